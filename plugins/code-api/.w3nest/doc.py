@@ -1,8 +1,6 @@
 from pathlib import Path
-from typing import cast
 
-from mkapi_python import generate_api, Configuration, std_links
-import griffe
+from mkapi_python import generate_api, AstCache, Configuration, std_links
 
 PROJECT = Path(__file__).parent.parent
 
@@ -10,29 +8,39 @@ print("Generate python API documentation of 'MkApiPython'")
 
 NAME = "mkapi_python"
 GRIFFE_URL = "https://mkdocstrings.github.io/griffe/reference"
+PYTHON_URL = "https://docs.python.org/3/library"
 DST = Path(__file__).parent.parent / "assets" / "api" / "code-api" / "MkApiBackends"
+AST_CACHE = AstCache(folder=Path.home() / ".cache" / "mkapi_python")
 
 config = Configuration(
     external_links={
         **std_links(),
+        "http": f"{PYTHON_URL}/http.html",
+        "http.server": f"{PYTHON_URL}/http.server.html",
+        "http.server.BaseHTTPRequestHandler": f"{PYTHON_URL}/http.server.html#http.server.BaseHTTPRequestHandler",
+        "json": f"{PYTHON_URL}/json.html",
+        "json.JSONEncoder": f"{PYTHON_URL}/json.html#json.JSONEncoder",
+        "type": f"{PYTHON_URL}/functions.html#type",
+        "typing": f"{PYTHON_URL}/typing.html",
+        "typing.Iterable": f"{PYTHON_URL}/typing.html#typing.Iterable",
+        "typing.Iterator": f"{PYTHON_URL}/typing.html#typing.Iterator",
         "griffe": "https://mkdocstrings.github.io/griffe/",
         "griffe.google-style": "https://mkdocstrings.github.io/griffe/docstrings/#google-style",
         **{
             f"griffe.dataclasses.{name}": f"{GRIFFE_URL}/griffe/#griffe.{name}"
-            for name in ["Module", "Class", "Function", "Attribute"]
+            for name in ["Module", "Class", "Function", "Attribute", "Alias", "Object"]
         },
         "griffe.docstrings.dataclasses.DocstringSection": f"{GRIFFE_URL}/api/docstrings/models/#griffe.DocstringSection",
+        **{
+            f"griffe.expressions.{name}": f"{GRIFFE_URL}/api/expressions/#griffe.{name}"
+            for name in ["Expr", "ExprName"]
+        },
         "code-api-models": "@nav[code-api].models.ts",
     },
     out=DST,
+    ast_cache=AST_CACHE,
 )
 module_path = PROJECT / "src" / "mkapi-backends" / "mkapi_python" / "mkapi_python"
 
-global_doc = cast(
-    griffe.Module,
-    griffe.load(
-        module_path,
-        submodules=True,
-    ),
-)
+global_doc = AST_CACHE.load(module_path, submodules=True)
 generate_api(global_doc, config)
@@ -5,6 +5,7 @@ import { DocumentationView } from './documentation.view'
 import { HeaderView } from './header.view'
 import { Attribute, Module, Project, Type } from './models'
 import { CodeView } from './code.view'
+import type { HttpClientTrait } from './index'
 /**
  * View for a {@link Attribute}.
  */
@@ -20,6 +21,7 @@ export class AttributeView implements VirtualDOM<'div'> {
     public readonly router: Router
     public readonly configuration: Configuration
     public readonly project: Project
+    public readonly httpClient?: HttpClientTrait
     public readonly tag = 'div'
     public readonly class = `${AttributeView.CssSelector} mkapi-attr`
     public readonly children: ChildrenLike
@@ -28,6 +30,7 @@ export class AttributeView implements VirtualDOM<'div'> {
         attribute: Attribute
         configuration: Configuration
         project: Project
+        httpClient?: HttpClientTrait
         parent?: Type
         fromModule: Module
     }) {
@@ -56,6 +59,7 @@ export class AttributeView implements VirtualDOM<'div'> {
                         configuration: this.configuration,
                         parent: this.attribute,
                         project: this.project,
+                        httpClient: this.httpClient,
                     }),
                 ],
             },
@@ -6,6 +6,7 @@ import { CodeView } from './code.view'
 import { HeaderView } from './header.view'
 import { separatorView } from './utils'
 import { Callable, Module, Project, Type } from './models'
+import type { HttpClientTrait } from './index'
 /**
  * View for a {@link Callable}.
  */
@@ -20,6 +21,7 @@ export class CallableView implements VirtualDOM<'div'> {
     public readonly router: Router
     public readonly configuration: Configuration
     public readonly project: Project
+    public readonly httpClient?: HttpClientTrait
     public readonly tag = 'div'
     public readonly class = `${CallableView.CssSelector} mkapi-callable`
     public readonly children: ChildrenLike
@@ -29,6 +31,7 @@ export class CallableView implements VirtualDOM<'div'> {
         router: Router
         configuration: Configuration
         project: Project
+        httpClient?: HttpClientTrait
         parent?: Type
         fromModule: Module
     }) {
@@ -48,6 +51,7 @@ export class CallableView implements VirtualDOM<'div'> {
                 configuration: this.configuration,
                 parent: this.callable,
                 project: this.project,
+                httpClient: this.httpClient,
             }),
             { tag: 'div', class: 'mt-3' },
             new DocumentationView({
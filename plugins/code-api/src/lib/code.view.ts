@@ -1,10 +1,19 @@
 import { child$, ChildrenLike, VirtualDOM } from 'rx-vdom'
-import { BehaviorSubject } from 'rxjs'
+import {
+    BehaviorSubject,
+    catchError,
+    map,
+    Observable,
+    of,
+    switchMap,
+    throwError,
+} from 'rxjs'
 import { parseMd, type Router } from 'mkdocs-ts'
 import { Configuration } from './configurations'
 import { Code, Entity, Project } from './models'
 import { DeclarationView } from './declaration.view'
 import { faIconTyped } from './fa-icons'
+import type { HttpClientTrait } from './index'
 
 class CodeHeaderView implements VirtualDOM<'div'> {
     static readonly CssSelector = 'mkdocs-CodeHeaderView'
@@ -87,6 +96,7 @@ export class CodeView implements VirtualDOM<'div'> {
     public readonly code: Code
     public readonly configuration: Configuration
     public readonly project: Project
+    public readonly httpClient?: HttpClientTrait
 
     public readonly tag = 'div'
     public readonly class = `${CodeView.CssSelector} fv-border-primary rounded`
@@ -101,6 +111,7 @@ export class CodeView implements VirtualDOM<'div'> {
         router: Router
         configuration: Configuration
         project: Project
+        httpClient?: HttpClientTrait
     }) {
         Object.assign(this, params)
         const declarationView = new DeclarationView({
@@ -108,14 +119,17 @@ export class CodeView implements VirtualDOM<'div'> {
             parent: params.parent,
             rootModulesNav: this.project.rootModulesNav,
         })
-        if (this.code.implementation === undefined) {
+        if (
+            this.code.implementation === undefined &&
+            this.code.implementationAsset === undefined
+        ) {
             this.children = [declarationView]
             return
         }
-        const implementation = this.code.implementation
-        const implementationView = implementation
-            ? new ImplementationView(params)
-            : undefined
+        const implementationView =
+            this.code.implementation || this.code.implementationAsset
+                ? new ImplementationView(params)
+                : undefined
         this.children = [
             declarationView,
             { tag: 'div', class: 'my-1' },
@@ -124,8 +138,45 @@ export class CodeView implements VirtualDOM<'div'> {
     }
 }
 
+/**
+ * Retrieve the implementation of a {@link Code}, fetching its source asset if it is not embedded.
+ *
+ * @param code The code.
+ * @param httpClient The HTTP client fetching the source asset, see {@link HttpClientTrait.fetchSourceAsset}.
+ * @returns The implementation.
+ */
+export function fetchImplementation(
+    code: Code,
+    httpClient?: HttpClientTrait,
+): Observable<string> {
+    if (code.implementation || !code.implementationAsset) {
+        return of(code.implementation ?? '')
+    }
+    if (!httpClient?.fetchSourceAsset) {
+        return throwError(
+            () =>
+                new Error(
+                    `No HTTP client to fetch the source asset '${code.implementationAsset}'`,
+                ),
+        )
+    }
+    return httpClient.fetchSourceAsset(code.implementationAsset).pipe(
+        map((source) =>
+            code.startLine > 0
+                ? source
+                      .split('\n')
+                      .slice(code.startLine - 1, code.endLine)
+                      .join('\n')
+                : source,
+        ),
+    )
+}
+
 /**
  * View for the implementation of a {@link Code}.
+ *
+ * If the implementation is not embedded, its source asset is fetched when expanded for the first time
+ * (see {@link HttpClientTrait.fetchSourceAsset}); an error message is displayed if it can not be fetched.
  */
 export class ImplementationView implements VirtualDOM<'div'> {
     public readonly tag = 'div'
@@ -137,9 +188,9 @@ export class ImplementationView implements VirtualDOM<'div'> {
         router: Router
         configuration: Configuration
         project: Project
+        httpClient?: HttpClientTrait
     }) {
-        const implementation = params.code.implementation
-        if (!implementation) {
+        if (!params.code.implementation && !params.code.implementationAsset) {
             this.children = []
             return
         }
@@ -152,11 +203,35 @@ export class ImplementationView implements VirtualDOM<'div'> {
                 project: params.project,
             }),
             child$({
-                source$: this.expanded$,
-                vdomMap: (expanded) => {
-                    if (!expanded) {
+                source$: this.expanded$.pipe(
+                    switchMap((expanded) =>
+                        expanded
+                            ? fetchImplementation(
+                                  params.code,
+                                  params.httpClient,
+                              ).pipe(
+                                  catchError((error: unknown) =>
+                                      of(
+                                          error instanceof Error
+                                              ? error
+                                              : new Error(String(error)),
+                                      ),
+                                  ),
+                              )
+                            : of(undefined),
+                    ),
+                ),
+                vdomMap: (implementation) => {
+                    if (implementation === undefined) {
                         return { tag: 'div' }
                     }
+                    if (implementation instanceof Error) {
+                        return {
+                            tag: 'div',
+                            class: 'ms-1 me-1 mt-1 text-danger',
+                            innerText: `Failed to load the implementation: ${implementation.message}`,
+                        }
+                    }
                     return {
                         tag: 'div',
                         class: 'ms-1 me-1 mt-1 code-api-snippet ',
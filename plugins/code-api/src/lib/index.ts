@@ -52,6 +52,12 @@ export interface HttpClientTrait {
      * @param modulePath path of the module relative to project's `docBasePath`.
      */
     fetchModule(modulePath: string): Observable<Module>
+    /**
+     * Fetch the content of a source asset, referenced by {@link Code.implementationAsset}.
+     *
+     * @param assetPath path of the asset relative to project's `dataFolder`.
+     */
+    fetchSourceAsset?(assetPath: string): Observable<string>
 }
 
 /**
@@ -59,6 +65,10 @@ export interface HttpClientTrait {
  */
 export class HttpClient implements HttpClientTrait {
     public readonly cache: Record<string, Module> = {}
+    /**
+     * The source assets fetched, keyed by URL.
+     */
+    public readonly sourceAssetsCache: Record<string, string> = {}
     /**
      * The configuration, usually forwarded from {@link codeApiEntryNode}.
      */
@@ -92,6 +102,17 @@ export class HttpClient implements HttpClientTrait {
             tap((m) => (this.cache[assetPath] = m)),
         )
     }
+
+    fetchSourceAsset(assetPath: string): Observable<string> {
+        const url = `${this.project.dataFolder}/${assetPath}`
+        if (url in this.sourceAssetsCache) {
+            return of(this.sourceAssetsCache[url])
+        }
+        return request$<string>(new Request(url)).pipe(
+            raiseHTTPErrors(),
+            tap((source) => (this.sourceAssetsCache[url] = source)),
+        )
+    }
 }
 
 const moduleView = <TLayout, THeader>(
@@ -118,6 +139,7 @@ const moduleView = <TLayout, THeader>(
                     router,
                     configuration,
                     project,
+                    httpClient,
                 },
                 ctx,
             )
@@ -51,6 +51,12 @@ export interface Code {
      * Optional associated implementation.
      */
     implementation?: string
+    /**
+     * Path of the source file's asset (a JSON file including the source as a string) relative to the project's
+     * `dataFolder`, when the implementation is not embedded: it spans the lines {@link Code.startLine} to
+     * {@link Code.endLine}.
+     */
+    implementationAsset?: string
     /**
      * File path in which the declaration is included.
      */
@@ -9,6 +9,7 @@ import { ContextTrait, NoContext, Router } from 'mkdocs-ts'
 import { separatorView, ySeparatorView5 } from './utils'
 import { Entity, Module, Project } from './models'
 import { SummaryView } from './summary.view'
+import type { HttpClientTrait } from './index'
 
 /**
  * View for a {@link Module}.
@@ -31,6 +32,7 @@ export class ModuleView implements VirtualDOM<'div'> {
     public readonly router: Router
     public readonly configuration: Configuration
     public readonly project: Project
+    public readonly httpClient?: HttpClientTrait
     public readonly tag = 'div'
     public readonly class = `${ModuleView.CssSelector} mkapi-module`
     public readonly children: ChildrenLike
@@ -43,6 +45,9 @@ export class ModuleView implements VirtualDOM<'div'> {
      * @param params.module Model of the module.
      * @param params.router Router of the application.
      * @param params.configuration Rendering configuration.
+     * @param params.project The project.
+     * @param params.httpClient HTTP client fetching the resources of the module (e.g. the source assets of the
+     *   implementations).
      * @param ctx Execution context used for logging and tracing.
      */
     constructor(
@@ -50,6 +55,7 @@ export class ModuleView implements VirtualDOM<'div'> {
             module: Module
             router: Router
             project: Project
+            httpClient?: HttpClientTrait
             configuration: Configuration<unknown, unknown>
         },
         ctx?: ContextTrait,
@@ -150,6 +156,7 @@ export class ModuleView implements VirtualDOM<'div'> {
                                         router: this.router,
                                         configuration: this.configuration,
                                         project: this.project,
+                                        httpClient: this.httpClient,
                                     }),
                                     ySeparatorView5,
                                 ])
@@ -164,6 +171,7 @@ export class ModuleView implements VirtualDOM<'div'> {
                                         router: this.router,
                                         configuration: this.configuration,
                                         project: this.project,
+                                        httpClient: this.httpClient,
                                         fromModule: this.module,
                                     }),
                                     ySeparatorView5,
@@ -180,6 +188,7 @@ export class ModuleView implements VirtualDOM<'div'> {
                                         router: this.router,
                                         configuration: this.configuration,
                                         project: this.project,
+                                        httpClient: this.httpClient,
                                     }),
                                     ySeparatorView5,
                                 ])
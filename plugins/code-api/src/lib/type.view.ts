@@ -9,6 +9,7 @@ import { CallableView } from './callable.view'
 import { separatorView } from './utils'
 import { Module, Project, Type } from './models'
 import { SummaryView } from './summary.view'
+import type { HttpClientTrait } from './index'
 /**
  * View for a {@link Type}.
  */
@@ -22,6 +23,7 @@ export class TypeView implements VirtualDOM<'div'> {
     public readonly router: Router
     public readonly configuration: Configuration
     public readonly project: Project
+    public readonly httpClient?: HttpClientTrait
     public readonly tag = 'div'
     public readonly class = `${TypeView.CssSelector} mkapi-type border-start border-bottom ps-2 mkapi-semantic-border-color`
     public readonly children: ChildrenLike
@@ -31,6 +33,7 @@ export class TypeView implements VirtualDOM<'div'> {
         router: Router
         configuration: Configuration
         project: Project
+        httpClient?: HttpClientTrait
     }) {
         Object.assign(this, params)
         this.class += ` mkapi-role-${this.type.semantic.role}`
@@ -48,6 +51,7 @@ export class TypeView implements VirtualDOM<'div'> {
                 configuration: this.configuration,
                 parent: this.type,
                 project: this.project,
+                httpClient: this.httpClient,
             }),
             separatorView,
             new SummaryView({
@@ -74,6 +78,7 @@ export class TypeView implements VirtualDOM<'div'> {
                             parent: this.type,
                             fromModule: this.fromModule,
                             project: this.project,
+                            httpClient: this.httpClient,
                         }),
                     ],
                 }
@@ -89,6 +94,7 @@ export class TypeView implements VirtualDOM<'div'> {
                             configuration: this.configuration,
                             parent: this.type,
                             project: this.project,
+                            httpClient: this.httpClient,
                             fromModule: this.fromModule,
                         }),
                     ],
@@ -0,0 +1,9 @@
+"""
+Benchmarks of the `mkapi_python` generator.
+
+They are not part of the distributed package, each benchmark is a module to run from the folder
+`mkapi_python` (where the `pyproject.toml` is located), e.g.:
+```
+python -m benchmarks.symbols_by_name
+```
+"""
@@ -0,0 +1,179 @@
+"""
+Benchmark of :func:`mkapi_python.py_griffe.init_aliases` on a package with deep chains of wildcard imports:
+recursive traversal re-processing each wildcard import (previous implementation) versus the memoized resolution.
+
+The synthetic package nests `--depth` levels of sub-packages, each level re-exporting its own modules and the next
+level using wildcard imports (`from .level_1 import *`, *etc.*). Each module also re-exports a shared module
+(`from wildcard_pkg.common import *`), leading to many chains of wildcard imports targeting the same modules:
+```
+python -m benchmarks.aliases --depth 8 --modules 4 --classes 20
+```
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import cast
+
+import griffe
+from griffe.dataclasses import Alias as AstAlias
+from griffe.dataclasses import Attribute as AstAttribute
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Function as AstFunction
+from griffe.dataclasses import Module as AstModule
+from griffe.dataclasses import Object as AstObject
+from griffe.exceptions import AliasResolutionError
+
+from mkapi_python.py_griffe import init_aliases
+
+
+def write_wildcard_package(
+    root: Path, name: str, depth: int, modules: int, classes: int
+):
+    """
+    Write a synthetic package with chains of wildcard imports in a folder.
+
+    Parameters:
+        root: The folder.
+        name: The package's name.
+        depth: Number of nested levels of sub-packages.
+        modules: Number of modules per level.
+        classes: Number of classes per module.
+    """
+    package = root / name
+    package.mkdir(parents=True)
+    common = [f"class Common{c}:\n    pass\n" for c in range(classes)]
+    (package / "common.py").write_text("\n\n".join(common))
+    level = package
+    for d in range(depth):
+        imports = [f"from .module_{m} import *" for m in range(modules)]
+        if d < depth - 1:
+            imports.append(f"from .level_{d + 1} import *")
+        (level / "__init__.py").write_text("\n".join(imports) + "\n")
+        for m in range(modules):
+            lines = [f"from {name}.common import *", ""]
+            lines += [f"class Class{d}_{m}_{c}:\n    pass\n" for c in range(classes)]
+            (level / f"module_{m}.py").write_text("\n\n".join(lines))
+        level = level / f"level_{d + 1}"
+        level.mkdir()
+    (level / "__init__.py").write_text("")
+
+
+def previous_init_aliases(root_ast: AstModule) -> dict[str, str]:
+    """
+    Previous implementation of :func:`mkapi_python.py_griffe.init_aliases`.
+    """
+
+    aliases: dict[str, str] = {}
+    modules_seen: list[str] = []
+
+    def is_leaf(ast: AstObject | AstAlias):
+        return any(isinstance(ast, C) for C in (AstAttribute, AstClass, AstFunction))
+
+    def process_entity(
+        ast: AstObject | AstAlias,
+        parent_module: str,
+        parents_wild_card: list[str],
+    ):
+
+        def add_import(
+            entity: AstObject | AstAlias,
+        ):
+            aliases[f"{parent_module}.{entity.name}"] = entity.canonical_path
+            for parent_wild_card in parents_wild_card:
+                aliases[f"{parent_wild_card}.{entity.name}"] = entity.canonical_path
+
+        if is_leaf(ast):
+            add_import(ast)
+            return
+
+        def is_in_lib(m: AstObject | AstAlias):
+            try:
+                m.canonical_path.startswith(root_ast.name)
+                return True
+            except AliasResolutionError:
+                return False
+
+        lib_members = [m for m in ast.all_members.values() if is_in_lib(m)]
+
+        modules = [
+            m
+            for m in lib_members
+            if isinstance(m, AstModule) and m.canonical_path not in modules_seen
+        ]
+        for m in modules:
+            modules_seen.append(m.canonical_path)
+            add_import(m)
+            process_entity(m, m.canonical_path, parents_wild_card)
+
+        direct_imports = [
+            m
+            for m in lib_members
+            if not isinstance(m, AstAlias) and not isinstance(m, AstModule)
+        ]
+        for direct_import in direct_imports:
+            process_entity(direct_import, ast.canonical_path, parents_wild_card)
+
+        direct_aliases: list[AstAlias] = [
+            m
+            for m in lib_members
+            if isinstance(m, AstAlias) and not m.name.endswith("/*")
+        ]
+        for direct_alias in direct_aliases:
+            add_import(direct_alias)
+
+        wild_cards_aliases: list[AstAlias] = [
+            m for m in lib_members if isinstance(m, AstAlias) and m.name.endswith("/*")
+        ]
+        for wild_card_alias in wild_cards_aliases:
+            process_entity(
+                wild_card_alias,
+                wild_card_alias.canonical_path,
+                [*parents_wild_card, ast.canonical_path],
+            )
+
+    process_entity(root_ast, root_ast.name, [])
+    return aliases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=8)
+    parser.add_argument("--modules", type=int, default=4)
+    parser.add_argument("--classes", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        name = "wildcard_pkg"
+        write_wildcard_package(
+            root=Path(folder),
+            name=name,
+            depth=args.depth,
+            modules=args.modules,
+            classes=args.classes,
+        )
+        start = time.perf_counter()
+        ast = cast(AstModule, griffe.load(name, submodules=True, search_paths=[folder]))
+        load_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = previous_init_aliases(root_ast=ast)
+    previous_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = init_aliases(root_ast=ast)
+    duration = time.perf_counter() - start
+
+    if list(actual.items()) != list(expected.items()):
+        raise RuntimeError("The previous and the memoized resolutions differ")
+
+    print(f"Depth: {args.depth}, aliases: {len(actual)}")
+    print(f"griffe load:              {load_duration * 1000:10.1f} ms")
+    print(f"init_aliases (previous):  {previous_duration * 1000:10.1f} ms")
+    print(f"init_aliases (memoized):  {duration * 1000:10.1f} ms")
+    print(f"Speedup: {previous_duration / duration:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
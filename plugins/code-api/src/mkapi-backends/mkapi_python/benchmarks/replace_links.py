@@ -0,0 +1,188 @@
+"""
+Benchmark of :func:`mkapi_python.py_griffe.rewrite_links`: previous implementation (code blocks extracted into
+placeholders, then a second pass for the cross-links) versus the single-pass rewriter.
+
+The corpus is made of the docstrings of the packages provided (and their sections' descriptions), e.g.:
+```
+python -m benchmarks.replace_links griffe click pylint --repeat 5
+```
+The equivalence of both implementations on such a corpus is checked by the tests (`tests/test_replace_links.py`).
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+from typing import Callable, cast
+
+import griffe
+from griffe.dataclasses import Alias as AstAlias
+from griffe.dataclasses import Object as AstObject
+
+from mkapi_python.py_griffe import (
+    SUPPORTED_CROSS_LINK_TAGS,
+    TAGS_TO_SEMANTIC,
+    Configuration,
+    DocReporter,
+    Project,
+    SphinxCrossLinkTag,
+    get_cross_link_candidates,
+    get_cross_link_package_nav,
+    get_nav_path,
+    init_project,
+    lookup_symbol,
+    rewrite_links,
+)
+from mkapi_python.stats import GenerationStats
+from mkapi_python.std_links import std_links
+
+
+def previous_replace_links(text: str, parent: str, project: Project) -> str:
+    """
+    Previous implementation of :func:`mkapi_python.py_griffe.rewrite_links`.
+    """
+
+    def extract_code_blocks(md_text: str) -> tuple[str, dict[str, str]]:
+        placeholders: dict[str, str] = {}
+
+        def replacer(match):
+            code_content = match.group(0)
+            placeholder = f"md_placeholder_{len(placeholders)}"
+            placeholders[placeholder] = code_content
+            return placeholder
+
+        md_text = re.sub(r"```.*?```", replacer, md_text, flags=re.DOTALL)
+        return md_text, placeholders
+
+    def restore_code_blocks(md_text: str, placeholders: dict[str, str]) -> str:
+        for placeholder, code in placeholders.items():
+            md_text = md_text.replace(placeholder, code)
+        return md_text
+
+    cross_ref_pattern = r":(\w+):`([^`]+)`"
+    project_prefix = f"{project.root_ast.name}."
+
+    def sanitize_py_path(py_path: str):
+        if py_path.startswith(project_prefix):
+            return py_path.replace(project_prefix, "")
+        return py_path
+
+    def replace_function(match: re.Match[str]):
+        tag = match.group(1)
+        content = match.group(2)
+        py_path = content
+        label = py_path.split(".")[-1]
+
+        if tag not in SUPPORTED_CROSS_LINK_TAGS:
+            project.reporter.add_sphinx_tag_unknown(parent, tag)
+            return label
+
+        pattern = r"<([^>]+)>"
+        matches = re.findall(pattern, py_path)
+        if matches:
+            index_start = py_path.find("<")
+            label = py_path[0:index_start]
+            py_path = matches[0]
+
+        py_path = sanitize_py_path(py_path)
+        if tag == "ext":
+            return f"<mkapi-ext-link href='{project.config.external_links[py_path]}' >{label}</mkapi-ext-link>"
+
+        if lookup_symbol(py_path, project):
+            nav_path = get_nav_path(tag=cast(SphinxCrossLinkTag, tag), py_path=py_path)
+            semantic = TAGS_TO_SEMANTIC[tag].replace("mkapi-role-", "")
+            return f"<mkapi-api-link nav='@nav[{project.root_ast.name}]/{nav_path}' semantic='{semantic}'>{label}</mkapi-api-link>"
+
+        package_name = py_path.split(".")[0]
+        if package_name in project.config.cross_linked_packages:
+            nav = get_cross_link_package_nav(
+                package_name=package_name, py_path=py_path, project=project
+            )
+            if not nav:
+                project.reporter.add_sphinx_link_unresolved(parent, match.group(0), [])
+                return label
+            return f"<mkapi-ext-link href='{nav}' >{label}</mkapi-ext-link>"
+
+        candidates = get_cross_link_candidates(
+            link_type=cast(SphinxCrossLinkTag, tag),
+            short_link=py_path,
+            project=project,
+        )
+
+        project.reporter.add_sphinx_link_unresolved(parent, match.group(0), candidates)
+        return label
+
+    no_code, code_dict = extract_code_blocks(text)
+    processed = re.sub(cross_ref_pattern, replace_function, no_code)
+    return restore_code_blocks(processed, code_dict)
+
+
+def safe_call(
+    function: Callable[..., str], text: str, parent: str, project: Project
+) -> str:
+    try:
+        return function(text, parent=parent, project=project)
+    except KeyError as error:
+        # E.g. an `ext` link not declared in the configuration.
+        return f"KeyError: {error}"
+
+
+def collect_texts(obj: AstObject, texts: list[tuple[str, str]]):
+    """
+    Collect the docstrings (and their sections' descriptions) of an object and its members.
+
+    Parameters:
+        obj: The object.
+        texts: The texts collected, as tuples `(text, parent's path)`.
+    """
+    if obj.docstring:
+        texts.append((obj.docstring.value, obj.canonical_path))
+        for section in obj.docstring.parsed:
+            values = section.value if isinstance(section.value, list) else []
+            for value in values:
+                description = getattr(value, "description", None)
+                if isinstance(description, str) and description:
+                    texts.append((description, obj.canonical_path))
+    for member in obj.members.values():
+        if not isinstance(member, AstAlias):
+            collect_texts(member, texts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("packages", nargs="+")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for package in args.packages:
+        ast = cast(griffe.Module, griffe.load(package, submodules=True))
+        project = init_project(
+            root_ast=ast,
+            config=Configuration(out=Path(), external_links=std_links()),
+            stats=GenerationStats(),
+            cross_packages={},
+        )
+        texts: list[tuple[str, str]] = []
+        collect_texts(ast, texts)
+
+        durations: dict[str, float] = {}
+        for name, function in [
+            ("previous", previous_replace_links),
+            ("single-pass", rewrite_links),
+        ]:
+            p = project._replace(reporter=DocReporter())
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                for text, parent in texts:
+                    safe_call(function, text, parent=parent, project=p)
+            durations[name] = (time.perf_counter() - start) / args.repeat
+
+        print(
+            f"{package}: {len(texts)} texts, previous {durations['previous'] * 1000:.1f} ms, "
+            f"single-pass {durations['single-pass'] * 1000:.1f} ms, "
+            f"speedup {durations['previous'] / durations['single-pass']:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Scalability benchmark of the generator on synthetic packages written on disk.
+
+For each scale, a package is generated with `--subpackages x scale` sub-packages, each including `--modules`
+files of `--classes` classes with `--methods` methods. Methods' parameters are annotated with classes of other
+modules (`--annotations` per method), docstrings include sphinx cross-links (`--cross-links` per docstring), and
+sub-packages re-export their files using wildcard imports (chained up to the root package).
+
+Each scale runs in a fresh process; wall time, peak allocated memory and max RSS are recorded per phase:
+griffe load, the phases of :func:`mkapi_python.py_griffe.generate_api`, and `replace_links` applied on all the
+docstrings. Results are stored as JSON to compare them across commits, e.g.:
+```
+python -m benchmarks.scalability --scales 1 2 4 8 --output scalability.json
+```
+The default configuration produces about 1400 symbols per scale (more than 10k symbols from scale 8).
+"""
+
+import argparse
+import contextlib
+import importlib.metadata
+import io
+import json
+import multiprocessing
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, NamedTuple, cast
+
+import griffe
+
+from mkapi_python.docstring_cache import DocstringCache
+from mkapi_python.navigation_cache import NavigationCache
+from mkapi_python.py_griffe import (
+    Configuration,
+    DocReporter,
+    Project,
+    generate_api,
+    init_aliases,
+    init_declarations_names,
+    init_leaf_modules,
+    init_modules_elements,
+    init_symbols,
+    init_symbols_by_name,
+    list_modules,
+    replace_links,
+)
+from mkapi_python.stats import GenerationStats
+from mkapi_python.std_links import std_links
+from mkapi_python.suffix_trie import SuffixTrie
+
+
+class SyntheticPackage(NamedTuple):
+    """
+    Shape of a synthetic package.
+    """
+
+    subpackages: int
+    modules: int
+    classes: int
+    methods: int
+    annotations: int
+    cross_links: int
+
+    def symbols(self) -> int:
+        files = self.subpackages * self.modules
+        return 1 + self.subpackages + files * self.classes * (1 + self.methods)
+
+
+def class_path(name: str, shape: SyntheticPackage, index: int) -> tuple[str, str]:
+    """
+    Returns:
+        The module's path and the name of the `index`-th class of the package.
+    """
+    classes = index % (shape.subpackages * shape.modules * shape.classes)
+    file, c = divmod(classes, shape.classes)
+    sub, module = divmod(file, shape.modules)
+    return f"{name}.sub_{sub}.module_{module}", f"Class{sub}_{module}_{c}"
+
+
+def docstring(name: str, shape: SyntheticPackage, seed: int, indent: str) -> str:
+    links = []
+    for k in range(shape.cross_links):
+        module, cls = class_path(name, shape, seed * 7 + k * 13)
+        links.append(f":class:`{module}.{cls}`")
+    lines = [
+        '"""',
+        f"Synthetic documentation, see {', '.join(links)}." if links else "Doc.",
+        "",
+        "```python",
+        "x = 1  # A code block: links are not replaced here, e.g. :class:`Foo`",
+        "```",
+        '"""',
+    ]
+    return "\n".join(indent + line for line in lines)
+
+
+def write_synthetic_package(root: Path, name: str, shape: SyntheticPackage):
+    """
+    Write a synthetic package in a folder.
+
+    Parameters:
+        root: The folder.
+        name: The package's name.
+        shape: The package's shape.
+    """
+    package = root / name
+    package.mkdir(parents=True)
+    init = [docstring(name, shape, 0, "")]
+    init += [f"from .sub_{s} import *" for s in range(shape.subpackages)]
+    (package / "__init__.py").write_text("\n".join(init) + "\n")
+    for s in range(shape.subpackages):
+        sub = package / f"sub_{s}"
+        sub.mkdir()
+        init = [docstring(name, shape, s, "")]
+        init += [f"from .module_{m} import *" for m in range(shape.modules)]
+        (sub / "__init__.py").write_text("\n".join(init) + "\n")
+        for m in range(shape.modules):
+            seed = (s * shape.modules + m) * shape.classes
+            lines = [docstring(name, shape, seed, "")]
+            imports = {
+                class_path(name, shape, seed + shape.classes + a)
+                for a in range(shape.annotations)
+            }
+            lines += [f"from {module} import {cls}" for module, cls in sorted(imports)]
+            annotations = [cls for _, cls in sorted(imports)] or ["int"]
+            for c in range(shape.classes):
+                lines += ["", "", f"class Class{s}_{m}_{c}:"]
+                lines.append(docstring(name, shape, seed + c, "    "))
+                for k in range(shape.methods):
+                    params = ", ".join(
+                        f"p{a}: {annotations[(a + k) % len(annotations)]}"
+                        for a in range(shape.annotations)
+                    )
+                    lines += [
+                        "",
+                        f"    def method_{k}(self, {params}) -> int:",
+                        docstring(name, shape, seed + c + k, "        "),
+                        "        return 0",
+                    ]
+            (sub / f"module_{m}.py").write_text("\n".join(lines) + "\n")
+
+
+def measure_replace_links(ast: griffe.Module, stats: GenerationStats):
+    """
+    Apply `replace_links` on the docstrings of all the documented modules, classes and methods.
+    """
+    modules_elements = init_modules_elements(root_ast=ast)
+    modules = list_modules(root_ast=ast, modules_elements=modules_elements)
+    all_symbols = init_symbols(root_ast=ast, modules_elements=modules_elements)
+    project = Project(
+        config=Configuration(out=Path(), external_links=std_links()),
+        root_ast=ast,
+        all_symbols=all_symbols,
+        all_aliases=init_aliases(root_ast=ast),
+        cross_linked_packages={},
+        symbols_by_name=init_symbols_by_name(all_symbols=all_symbols),
+        symbols_trie=SuffixTrie(paths=all_symbols.keys()),
+        declarations_names=init_declarations_names(
+            modules=[m for _, m in modules], modules_elements=modules_elements
+        ),
+        modules_elements=modules_elements,
+        leaf_modules=init_leaf_modules(modules_elements=modules_elements),
+        navigation_cache=NavigationCache(),
+        reporter=DocReporter(),
+        docstring_cache=DocstringCache(),
+    )
+    docstrings: list[tuple[str, str]] = []
+    for _, module in modules:
+        for obj in [module, *modules_elements[module.path].classes]:
+            for o in [obj, *obj.functions.values()]:
+                if o.docstring:
+                    docstrings.append((o.docstring.value, o.canonical_path))
+    with stats.phase("replace_links"):
+        for text, parent in docstrings:
+            replace_links(text, parent=parent, project=project)
+
+
+def run_scale(shape: SyntheticPackage, trace_memory: bool) -> dict[str, Any]:
+    """
+    Run the benchmark for a package's shape, meant to be executed in a fresh process.
+    """
+    if trace_memory:
+        tracemalloc.start()
+    with tempfile.TemporaryDirectory() as folder:
+        name = "synthetic_pkg"
+        write_synthetic_package(root=Path(folder) / "src", name=name, shape=shape)
+        stats = GenerationStats()
+        start = time.perf_counter()
+        with stats.phase("griffe load"):
+            ast = cast(
+                griffe.Module,
+                griffe.load(name, submodules=True, search_paths=[Path(folder) / "src"]),
+            )
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_api(
+                ast,
+                Configuration(out=Path(folder) / "out", external_links=std_links()),
+                stats=stats,
+            )
+        total = time.perf_counter() - start
+        measure_replace_links(ast, stats)
+    return {
+        "shape": shape._asdict(),
+        "symbols": shape.symbols(),
+        "totalDuration": total,
+        **stats.to_json(count=5),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--subpackages", type=int, default=4)
+    parser.add_argument("--modules", type=int, default=5)
+    parser.add_argument("--classes", type=int, default=10)
+    parser.add_argument("--methods", type=int, default=6)
+    parser.add_argument("--annotations", type=int, default=3)
+    parser.add_argument("--cross-links", type=int, default=2)
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Record the peak allocated memory per phase using tracemalloc (slows down the execution).",
+    )
+    parser.add_argument("--output", type=Path, default=Path("scalability.json"))
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scales:
+        shape = SyntheticPackage(
+            subpackages=args.subpackages * scale,
+            modules=args.modules,
+            classes=args.classes,
+            methods=args.methods,
+            annotations=args.annotations,
+            cross_links=args.cross_links,
+        )
+        # A fresh process per scale: the max RSS is not polluted by the previous scales.
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            result = executor.submit(run_scale, shape, args.trace_memory).result()
+        results.append(result)
+        phases = {p["name"]: p["duration"] for p in result["phases"]}
+        print(
+            f"scale {scale:3}: {result['symbols']:7} symbols, total {result['totalDuration']:7.2f} s, "
+            + ", ".join(f"{k} {v:.2f} s" for k, v in phases.items())
+        )
+
+    report = {
+        "revision": git_revision(),
+        "python": sys.version,
+        "griffe": importlib.metadata.version("griffe"),
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2))
+    print(f"Results saved in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
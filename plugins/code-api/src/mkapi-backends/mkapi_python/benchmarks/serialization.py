@@ -0,0 +1,188 @@
+"""
+Benchmark of the serialization of an API file: `json.dump` with
+:class:`benchmarks.serialization.AsdictJSONEncoder` (previous implementation) versus
+:func:`mkapi_python.serialization.dump_model`, indented and compact.
+
+The module serialized is synthetic, with thousands of documented entities:
+```
+python -m benchmarks.serialization --classes 400 --members 20
+```
+Peak memory is measured with `tracemalloc`, it does not include the model itself.
+"""
+
+import argparse
+import dataclasses
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from mkapi_python.models import (
+    Code,
+    Documentation,
+    DocumentationSection,
+    Entity,
+    Module,
+    Semantic,
+    Type,
+)
+from mkapi_python.serialization import dump_model
+
+
+class AsdictJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder of the models using `dataclasses.asdict`, as the API files were written before
+    :func:`mkapi_python.serialization.dump_model`.
+    """
+
+    def default(self, o: Any) -> Any:
+        if dataclasses.is_dataclass(o) and not isinstance(o, type):
+            return dataclasses.asdict(o, dict_factory=omitting_none)
+        return json.JSONEncoder.default(self, o)
+
+
+def omitting_none(items: list[tuple[str, Any]]) -> dict[str, Any]:
+    """
+    Dictionary factory of `dataclasses.asdict` omitting the fields omitted by
+    :func:`mkapi_python.serialization.dump_model` when `None` (only `Code.implementationAsset`).
+    """
+    return {k: v for k, v in items if v is not None or k != "implementationAsset"}
+
+
+def semantic(role: str) -> Semantic:
+    return Semantic(role=role, labels=["public"], attributes={}, relations={})
+
+
+def documentation(name: str) -> Documentation:
+    return Documentation(
+        sections=[
+            DocumentationSection(
+                content=f"Documentation of `{name}`, see <mkapi-ext-link>x</mkapi-ext-link>.\n"
+                * 3,
+                contentType="Markdown",
+                semantic=semantic("body"),
+            ),
+            DocumentationSection(
+                title="Parameters",
+                content="*  **foo**: The foo.\n*  **bar**: The bar.\n",
+                contentType="Markdown",
+                semantic=semantic("arguments"),
+            ),
+        ]
+    )
+
+
+def entity(path: str, role: str) -> Entity:
+    name = path.split(".")[-1]
+    return Entity(
+        name=name,
+        documentation=documentation(name),
+        code=Code(
+            declaration=f"def {name}(foo: Foo, bar: list[Bar]) -> dict[str, Baz]:",
+            filePath="synthetic/module.py",
+            startLine=10,
+            endLine=42,
+            references={
+                "Foo": "@nav[synthetic]/.Foo",
+                "Bar": "@nav[synthetic]/.Bar",
+                "Baz": "https://example.com/baz",
+            },
+            implementation=f"def {name}(foo: Foo, bar: list[Bar]) -> dict[str, Baz]:\n    return {{}}\n"
+            * 4,
+        ),
+        semantic=semantic(role),
+        path=path,
+        navPath=f"@nav[synthetic]/{path}",
+    )
+
+
+def synthetic_module(classes: int, members: int) -> Module:
+    return Module(
+        name="synthetic",
+        documentation=documentation("synthetic"),
+        semantic=semantic("module"),
+        path="synthetic",
+        children=[],
+        callables=[
+            entity(f"synthetic.function_{i}", "function") for i in range(classes)
+        ],
+        types=[
+            Type(
+                **entity(f"synthetic.Class{c}", "class").__dict__,
+                callables=[
+                    entity(f"synthetic.Class{c}.method_{m}", "method")
+                    for m in range(members)
+                ],
+                attributes=[
+                    entity(f"synthetic.Class{c}.attribute_{m}", "attribute")
+                    for m in range(members)
+                ],
+            )
+            for c in range(classes)
+        ],
+        attributes=[
+            entity(f"synthetic.GLOBAL_{i}", "attribute") for i in range(classes)
+        ],
+        files=[],
+    )
+
+
+def measure(
+    write: Callable[[Any, Any], None], module: Module, path: Path
+) -> tuple[float, float, int]:
+    """
+    Returns:
+        Duration (s), peak memory (MB) and size (bytes) of the output.
+        The duration is measured in a first run, the peak memory in a second one (`tracemalloc` slows down the
+        execution).
+    """
+    start = time.perf_counter()
+    with open(path, "w", encoding="UTF8") as file:
+        write(module, file)
+    duration = time.perf_counter() - start
+    tracemalloc.start()
+    with open(path, "w", encoding="UTF8") as file:
+        write(module, file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak / 1e6, path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--classes", type=int, default=400)
+    parser.add_argument("--members", type=int, default=20)
+    args = parser.parse_args()
+
+    module = synthetic_module(classes=args.classes, members=args.members)
+    writers: dict[str, Callable[[Any, Any], None]] = {
+        "json.dump + asdict": lambda m, f: json.dump(
+            m, f, cls=AsdictJSONEncoder, indent=4
+        ),
+        "dump_model": dump_model,
+        "dump_model (compact)": lambda m, f: dump_model(m, f, indent=None),
+    }
+    with tempfile.TemporaryDirectory() as folder:
+        results = {
+            name: measure(write, module, Path(folder) / f"{i}.json")
+            for i, (name, write) in enumerate(writers.items())
+        }
+        if (Path(folder) / "0.json").read_text() != (
+            Path(folder) / "1.json"
+        ).read_text():
+            raise RuntimeError("The outputs of json.dump and dump_model differ")
+
+    entities = args.classes * (3 + 2 * args.members)
+    print(f"Entities: {entities}")
+    reference, _, _ = results["json.dump + asdict"]
+    for name, (duration, peak, size) in results.items():
+        print(
+            f"{name:22} {duration * 1000:9.1f} ms  {size / duration / 1e6:7.1f} MB/s  "
+            f"peak {peak:8.1f} MB  size {size / 1e6:6.1f} MB  speedup {reference / duration:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark of the unique-symbol fallback used in `parse_code` when a reference can not be resolved directly:
+linear scan of `all_symbols` (previous implementation) versus the index
+:attr:`mkapi_python.py_griffe.Project.symbols_by_name`.
+
+The symbols table is the one of a synthetic package, with tens of thousands of symbols:
+```
+python -m benchmarks.symbols_by_name --modules 100 --classes 25 --members 10
+```
+"""
+
+import argparse
+import random
+import time
+from pathlib import Path
+from typing import cast
+
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python.docstring_cache import DocstringCache
+from mkapi_python.navigation_cache import NavigationCache
+from mkapi_python.py_griffe import (
+    Configuration,
+    DocReporter,
+    Project,
+    SymbolRef,
+    find_symbols_by_name,
+    init_symbols_by_name,
+)
+from mkapi_python.suffix_trie import SuffixTrie
+
+
+def synthetic_symbols(modules: int, classes: int, members: int) -> dict[str, SymbolRef]:
+    """
+    Symbols table of a synthetic package: each module defines classes, functions and globals,
+    class members share their names across classes (as do e.g. `__init__`, `run`, `name` in real packages).
+    """
+    symbols: dict[str, SymbolRef] = {}
+    for m in range(modules):
+        module = f"sub_{m // 10}.module_{m}"
+        nav = module.replace(".", "/")
+        symbols[module] = SymbolRef(kind="module", navigation_path=nav)
+        for c in range(classes):
+            name = f"Class{m}_{c}"
+            symbols[f"{module}.{name}"] = SymbolRef(
+                kind="class", navigation_path=f"{nav}.{name}"
+            )
+            symbols[f"{module}.function_{m}_{c}"] = SymbolRef(
+                kind="function", navigation_path=f"{nav}.function_{m}_{c}"
+            )
+            for k in range(members):
+                symbols[f"{module}.{name}.member_{k}"] = SymbolRef(
+                    kind="method", navigation_path=f"{nav}.{name}.member_{k}"
+                )
+        symbols[f"{module}.GLOBAL_{m}"] = SymbolRef(
+            kind="attribute", navigation_path=f"{nav}.GLOBAL_{m}"
+        )
+    return symbols
+
+
+def linear_scan(name: str, all_symbols: dict[str, SymbolRef]) -> list[SymbolRef]:
+    return [v for k, v in all_symbols.items() if k.endswith(f".{name}")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=100)
+    parser.add_argument("--classes", type=int, default=25)
+    parser.add_argument("--members", type=int, default=10)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    all_symbols = synthetic_symbols(
+        modules=args.modules, classes=args.classes, members=args.members
+    )
+    names = list({k.split(".")[-1] for k in all_symbols})
+    rng = random.Random(0)
+    # Half of the names looked up are unknown (e.g. `Any`, `Optional` from 'typing').
+    queries = [
+        rng.choice(names) if i % 2 else f"Unknown{i}" for i in range(args.lookups)
+    ]
+
+    start = time.perf_counter()
+    project = Project(
+        config=Configuration(out=Path()),
+        root_ast=cast(AstModule, None),
+        all_symbols=all_symbols,
+        all_aliases={},
+        cross_linked_packages={},
+        symbols_by_name=init_symbols_by_name(all_symbols=all_symbols),
+        symbols_trie=SuffixTrie(paths=[]),
+        declarations_names={},
+        modules_elements={},
+        leaf_modules={},
+        navigation_cache=NavigationCache(),
+        reporter=DocReporter(),
+        docstring_cache=DocstringCache(),
+    )
+    index_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [linear_scan(name, all_symbols) for name in queries]
+    scan_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [find_symbols_by_name(name, project) for name in queries]
+    lookup_duration = time.perf_counter() - start
+
+    if actual != expected:
+        raise RuntimeError("The index and the linear scan do not give the same results")
+
+    print(f"Symbols: {len(all_symbols)}, lookups: {len(queries)}")
+    print(f"Linear scan:  {scan_duration * 1000:10.2f} ms")
+    print(f"Index build:  {index_duration * 1000:10.2f} ms")
+    print(f"Index lookup: {lookup_duration * 1000:10.2f} ms")
+    print(
+        f"Speedup (build included): {scan_duration / (index_duration + lookup_duration):.0f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
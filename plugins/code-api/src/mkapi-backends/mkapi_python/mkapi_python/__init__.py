@@ -62,6 +62,23 @@ A pseudo sphinx tag `ext` has been added to link against external URLs (in addit
 
 """
 
+from .artifacts import *
+from .ast_cache import *
+from .batch import *
+from .content_store import *
+from .docstring_cache import *
+from .expressions import *
+from .incremental import *
 from .models import *
+from .navigation import *
+from .navigation_cache import *
+from .pack import *
 from .py_griffe import *
+from .reload import *
+from .search_index import *
+from .serialization import *
+from .source_assets import *
+from .stats import *
 from .std_links import *
+from .suffix_trie import *
+from .watch import *
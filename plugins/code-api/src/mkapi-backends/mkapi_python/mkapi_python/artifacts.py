@@ -0,0 +1,40 @@
+"""
+Location of the generated artifacts other than the modules' API files, within
+:attr:`mkapi_python.py_griffe.Configuration.out`, and helper to write them.
+"""
+
+import os
+import uuid
+from pathlib import Path
+
+__all__ = ["ARTIFACTS_FOLDER", "write_atomically"]
+
+ARTIFACTS_FOLDER = ".mkapi"
+"""
+Folder including the generated artifacts (e.g. the source assets), in :attr:`mkapi_python.py_griffe.Configuration.out`.
+
+Its name is not a valid Python identifier: no module's API file can be written in it, whatever the names of the
+documented modules.
+"""
+
+
+def write_atomically(target: Path, content: bytes):
+    """
+    Write a file in a temporary file then rename it: concurrent writers never expose a partial file.
+
+    The temporary file is created like any other file (its permissions follow the process' umask), it is removed
+    if the writing fails.
+
+    Parameters:
+        target: Path of the file.
+        content: Content of the file.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temporary, "xb") as file:
+            file.write(content)
+        os.replace(temporary, target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
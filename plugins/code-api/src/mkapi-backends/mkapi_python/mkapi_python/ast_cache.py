@@ -0,0 +1,259 @@
+"""
+Persistent cache of the :ext:`griffe` ASTs, see :class:`mkapi_python.ast_cache.AstCache`.
+
+Loaded module trees are stored as pickle files in a cache folder, along with the fingerprint of the sources they
+have been loaded from. On subsequent runs, a package for which the fingerprint did not change is loaded from the
+cache without parsing its sources.
+
+The module trees are pickled rather than serialized with griffe's JSON encoder: decoding the JSON does not
+restore the source lines, the imports & exports, nor the collections required to resolve the aliases.
+
+Loading a pickle file can execute arbitrary code: the cache folder must only be writable by the current user.
+It is created with the permissions `0o700`, and the entries of an existing folder owned by another user or writable
+by others are ignored (the packages are then loaded from their sources), see
+:func:`mkapi_python.ast_cache.is_private_folder`. In particular, do not use a folder shared between users
+(e.g. in `/tmp`).
+"""
+
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import sys
+from pathlib import Path
+from stat import S_IWGRP, S_IWOTH
+from typing import Any, NamedTuple, cast
+
+import griffe
+from griffe.dataclasses import Module as AstModule
+from griffe.finder import ModuleFinder, NamespacePackage
+
+__all__ = [
+    "AST_CACHE_VERSION",
+    "AstCacheEntry",
+    "package_files",
+    "package_fingerprint",
+    "is_private_folder",
+    "AstCache",
+]
+
+AST_CACHE_VERSION = 1
+"""
+Version of the cache entries' format, entries with a different version are discarded.
+"""
+
+
+class AstCacheEntry(NamedTuple):
+    """
+    Entry of the cache, stored in a pickle file.
+    """
+
+    version: int
+    """
+    Version of the format, see :glob:`mkapi_python.ast_cache.AST_CACHE_VERSION`.
+    """
+    fingerprint: str
+    """
+    Fingerprint of the package's sources when it was loaded, see
+    :func:`mkapi_python.ast_cache.package_fingerprint`.
+    """
+    module: AstModule
+    """
+    The loaded module tree.
+    """
+
+
+def package_files(spec: Any) -> list[Path]:
+    """
+    List the source files of a package found by griffe's `ModuleFinder`.
+
+    Parameters:
+        spec: The package, as returned by `ModuleFinder.find_spec`.
+
+    Returns:
+        The paths of the `.py` and `.pyi` files, sorted.
+    """
+    if isinstance(spec, NamespacePackage):
+        folders = spec.path
+    elif spec.path.name == "__init__.py":
+        folders = [spec.path.parent]
+    else:
+        return sorted([spec.path, *([spec.stubs] if spec.stubs else [])])
+    return sorted(
+        path
+        for folder in folders
+        for pattern in ("*.py", "*.pyi")
+        for path in folder.rglob(pattern)
+    )
+
+
+def package_fingerprint(name: str, files: list[Path], submodules: bool) -> str:
+    """
+    Compute the fingerprint of a package's sources.
+
+    It includes the versions of python, griffe and of the package (if available), as well as the path,
+    modification time and size of each source file.
+
+    Parameters:
+        name: Name of the package.
+        files: Source files of the package.
+        submodules: Whether the submodules are loaded.
+
+    Returns:
+        The fingerprint.
+    """
+    try:
+        version = importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        version = ""
+    hasher = hashlib.sha256()
+    for text in (
+        sys.version,
+        importlib.metadata.version("griffe"),
+        name,
+        version,
+        str(submodules),
+    ):
+        hasher.update(text.encode("UTF8") + b"\0")
+    for path in files:
+        stat = path.stat()
+        hasher.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode("UTF8"))
+    return hasher.hexdigest()
+
+
+def is_private_folder(folder: Path) -> bool:
+    """
+    Whether a folder is owned by the current user and not writable by others.
+
+    Parameters:
+        folder: The folder.
+
+    Returns:
+        `True` if the folder is private, always `True` on platforms without POSIX ownership (e.g. Windows).
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    status = folder.stat()
+    return status.st_uid == os.getuid() and not status.st_mode & (S_IWGRP | S_IWOTH)
+
+
+class AstCache:
+    """
+    Loads packages using :ext:`griffe`, and stores the loaded module trees in a folder to speed up subsequent
+    loads.
+
+    Example:
+    ```
+    cache = AstCache(folder=Path.home() / ".cache" / "mkapi_python")
+    griffe_ast = cache.load("foo")
+    generate_api(griffe_ast, Configuration(out=DST, ast_cache=cache))
+    ```
+
+    When provided to :attr:`mkapi_python.py_griffe.Configuration.ast_cache`, the cache is also used to load the
+    :attr:`cross-linked packages<mkapi_python.py_griffe.Configuration.cross_linked_packages>`,
+    and the counts of hits & misses are reported at the end of :func:`mkapi_python.py_griffe.generate_api`.
+
+    The entries are pickle files: the folder must be private to the current user, see `mkapi_python.ast_cache`.
+    """
+
+    def __init__(self, folder: Path):
+        """
+        Initialize the cache.
+
+        Parameters:
+            folder: Folder in which the entries are stored, created if needed (readable & writable by the current
+                user only).
+        """
+        self.folder = folder
+        """
+        Folder in which the entries are stored.
+        """
+        self.hits: list[str] = []
+        """
+        Packages loaded from the cache.
+        """
+        self.misses: list[str] = []
+        """
+        Packages loaded by parsing their sources.
+        """
+
+    def load(self, objspec: str | Path, submodules: bool = True) -> AstModule:
+        """
+        Load a package, from the cache if its sources did not change.
+
+        Parameters:
+            objspec: Name or path of the package, as provided to `griffe.load`.
+            submodules: Whether to recurse on the submodules.
+
+        Returns:
+            The package's module tree.
+        """
+        try:
+            name, spec = ModuleFinder().find_spec(objspec)
+        except ModuleNotFoundError:
+            # Let griffe raise the appropriate error (or handle the case its own way).
+            self.misses.append(str(objspec))
+            return cast(AstModule, griffe.load(objspec, submodules=submodules))
+
+        files = package_files(spec)
+        fingerprint = package_fingerprint(name, files, submodules)
+        location = hashlib.sha256(
+            f"{objspec}\0{files[0] if files else ''}".encode("UTF8")
+        )
+        path = self.folder / f"{name}-{location.hexdigest()[0:16]}.pickle"
+
+        entry = self._read(path)
+        if (
+            entry is not None
+            and entry.version == AST_CACHE_VERSION
+            and entry.fingerprint == fingerprint
+        ):
+            self.hits.append(name)
+            return entry.module
+
+        self.misses.append(name)
+        module = cast(AstModule, griffe.load(objspec, submodules=submodules))
+        self._write(
+            path,
+            AstCacheEntry(
+                version=AST_CACHE_VERSION, fingerprint=fingerprint, module=module
+            ),
+        )
+        return module
+
+    def report(self) -> str:
+        """
+        Returns:
+            A one-line summary of the hits & misses.
+        """
+        return (
+            f"AST cache: {len(self.hits)} hit(s), {len(self.misses)} miss(es) "
+            f"(hits: {self.hits}, misses: {self.misses})"
+        )
+
+    @staticmethod
+    def _read(path: Path) -> AstCacheEntry | None:
+        if not path.is_file() or not is_private_folder(path.parent):
+            return None
+        try:
+            with open(path, "rb") as file:
+                entry = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Corrupted or incompatible entry (e.g. griffe's classes changed): it is treated as a miss and
+            # overwritten.
+            return None
+        return entry if isinstance(entry, AstCacheEntry) else None
+
+    def _write(self, path: Path, entry: AstCacheEntry):
+        self.folder.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not is_private_folder(self.folder):
+            return
+        tmp_path = path.with_suffix(f".{id(entry)}.tmp")
+        try:
+            with open(tmp_path, "wb") as file:
+                pickle.dump(entry, file, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError, TypeError):
+            # The tree can not be stored, next run will load the package from its sources again.
+            tmp_path.unlink(missing_ok=True)
+            return
+        tmp_path.replace(path)
@@ -0,0 +1,200 @@
+"""
+Batch generation of the API files of several packages cross-linking each other,
+see :func:`mkapi_python.batch.generate_batch_api`.
+
+Calling :func:`mkapi_python.py_griffe.generate_api` for each package loads again all the packages listed in
+:attr:`mkapi_python.py_griffe.Configuration.cross_linked_packages`: for packages cross-linking each other, the work
+grows quadratically with their count. Within a batch:
+*  Each package's tree is loaded once, and its symbol tables are computed once.
+*  The symbol tables of the packages of the batch are shared across the builds; the other cross-linked packages are
+   loaded once (or read once from their index, see
+   :attr:`mkapi_python.py_griffe.Configuration.cross_linked_indexes`).
+*  Once the tables are shared, the builds do not depend on each other (including packages cross-linking each
+   other): they run in parallel.
+
+Example:
+```
+generate_batch_api(
+    builds=[
+        ("foo", Configuration(out=DST / "foo", cross_linked_packages=["bar"])),
+        ("bar", Configuration(out=DST / "bar", cross_linked_packages=["foo"])),
+    ],
+    jobs=4,
+)
+```
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, cast
+
+import griffe
+from griffe.dataclasses import Module as AstModule
+
+from .py_griffe import (
+    Configuration,
+    CrossLinkedPackage,
+    Project,
+    generate_project_api,
+    init_aliases,
+    init_project,
+    init_symbols,
+    load_symbol_index,
+)
+from .stats import GenerationStats
+
+__all__ = ["load_package_ast", "SharedPackages", "generate_batch_api"]
+
+_BATCH_WORKER_STATE: dict[str, Any] = {}
+"""
+Projects & statistics of the builds, inherited by the forked worker processes of
+:func:`mkapi_python.batch.generate_batch_api`.
+"""
+
+
+def load_package_ast(package: str, config: Configuration) -> AstModule:
+    """
+    Parameters:
+        package: Name of the package.
+        config: Configuration, its :attr:`mkapi_python.py_griffe.Configuration.ast_cache` is used if provided.
+
+    Returns:
+        The package's AST.
+    """
+    if config.ast_cache:
+        return config.ast_cache.load(package, submodules=True)
+    return cast(AstModule, griffe.load(package, submodules=True))
+
+
+class SharedPackages:  # pylint: disable=too-few-public-methods
+    """
+    Symbol tables of the cross-linked packages, loaded once for all the builds of a batch.
+    """
+
+    def __init__(self, tables: dict[str, CrossLinkedPackage]) -> None:
+        """
+        Parameters:
+            tables: Symbol tables of the packages of the batch, keyed by name.
+        """
+        self.tables = tables
+        """
+        Symbol tables of the packages loaded, keyed by name.
+        """
+        self.indexes: dict[tuple[str, Path], CrossLinkedPackage] = {}
+        """
+        Symbol tables read from an index, keyed by package's name and index's path.
+        """
+
+    def resolve(self, config: Configuration) -> dict[str, CrossLinkedPackage]:
+        """
+        Resolve the cross-linked packages of a build, loading those encountered for the first time.
+
+        The packages of the batch are resolved using their shared tables, even if an index is provided in
+        :attr:`mkapi_python.py_griffe.Configuration.cross_linked_indexes`: the index of such a package is produced by
+        its build, from the same tables.
+
+        Parameters:
+            config: Configuration of the build.
+
+        Returns:
+            The cross-linked packages, keyed by name.
+        """
+        packages: dict[str, CrossLinkedPackage] = {}
+        for key in config.cross_linked_packages:
+            if key not in self.tables and key in config.cross_linked_indexes:
+                path = config.cross_linked_indexes[key]
+                if (key, path) not in self.indexes:
+                    self.indexes[(key, path)] = load_symbol_index(
+                        path=path, package=key
+                    )
+                packages[key] = self.indexes[(key, path)]
+                continue
+            if key not in self.tables:
+                root_ast = load_package_ast(package=key, config=config)
+                self.tables[key] = CrossLinkedPackage(
+                    all_aliases=init_aliases(root_ast=root_ast),
+                    all_symbols=init_symbols(root_ast=root_ast),
+                )
+            packages[key] = self.tables[key]
+        return packages
+
+
+def _generate_build_worker(package: str) -> GenerationStats:
+    project: Project = _BATCH_WORKER_STATE["projects"][package]
+    stats: GenerationStats = _BATCH_WORKER_STATE["stats"][package]
+    return generate_project_api(project=project, stats=stats)
+
+
+def generate_batch_api(
+    builds: list[tuple[str, Configuration]],
+    jobs: int = 1,
+    stats: GenerationStats | None = None,
+) -> dict[str, GenerationStats]:
+    """
+    Generate the API files of several packages, sharing their trees and symbol tables.
+
+    The projects of the builds are initialized in the calling process, the builds then run in `jobs` processes
+    (if the `fork` start method is available). Within a build, modules are generated in parallel according to
+    :attr:`mkapi_python.py_griffe.Configuration.jobs`.
+
+    Parameters:
+        builds: The builds, as tuples `(package name, configuration)`.
+        jobs: Number of builds running in parallel.
+        stats: Statistics to complete with the phases shared by the builds (packages loading, cross-linked
+            packages). If not provided, a new instance is created.
+
+    Returns:
+        The statistics of the builds, keyed by package name.
+    """
+    packages = [package for package, _ in builds]
+    if len(set(packages)) != len(packages):
+        raise ValueError(f"A package is built more than once in the batch: {packages}")
+    stats = stats if stats is not None else GenerationStats()
+    builds_stats = {package: GenerationStats() for package in packages}
+    with stats.phase("griffe load"):
+        trees = {
+            package: load_package_ast(package=package, config=config)
+            for package, config in builds
+        }
+    projects = {
+        package: init_project(
+            root_ast=trees[package],
+            config=config,
+            stats=builds_stats[package],
+            cross_packages={},
+        )
+        for package, config in builds
+    }
+    shared = SharedPackages(
+        tables={
+            package: CrossLinkedPackage(
+                all_symbols=project.all_symbols, all_aliases=project.all_aliases
+            )
+            for package, project in projects.items()
+        }
+    )
+    with stats.phase("cross-linked packages"):
+        for package, config in builds:
+            projects[package] = projects[package]._replace(
+                cross_linked_packages=shared.resolve(config)
+            )
+
+    if jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+        _BATCH_WORKER_STATE["projects"] = projects
+        _BATCH_WORKER_STATE["stats"] = builds_stats
+        try:
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                return dict(
+                    zip(packages, executor.map(_generate_build_worker, packages))
+                )
+        finally:
+            _BATCH_WORKER_STATE.clear()
+    return {
+        package: generate_project_api(
+            project=projects[package], stats=builds_stats[package]
+        )
+        for package in packages
+    }
@@ -0,0 +1,163 @@
+"""
+Content-addressed store of the modules' API files, see :attr:`mkapi_python.py_griffe.Configuration.content_store`.
+
+The API files of a generation are published in a store shared by the generations of several versions of a package:
+each document is stored once, named after the hash of its content (the one of
+:attr:`mkapi_python.navigation.NavigationNode.hash`). A per-version manifest, written in the artifacts' folder of the
+output folder (see :glob:`mkapi_python.content_store.STORE_MANIFEST_FILENAME`), maps the modules' path to their blob.
+
+Modules unchanged between versions share the same blob: it is neither rewritten nor re-uploaded (when synchronizing
+the store), and blobs can be served with immutable cache headers. Blobs not referenced anymore by any manifest are
+not removed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .artifacts import ARTIFACTS_FOLDER, write_atomically
+from .navigation import content_hash
+
+__all__ = [
+    "STORE_MANIFEST_FILENAME",
+    "STORE_MANIFEST_VERSION",
+    "StoreManifest",
+    "ContentStore",
+    "publish_modules",
+]
+
+STORE_MANIFEST_FILENAME = f"{ARTIFACTS_FOLDER}/store-manifest.json"
+"""
+Path of the store's manifest of a generation, relative to :attr:`mkapi_python.py_griffe.Configuration.out`
+(see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+"""
+
+STORE_MANIFEST_VERSION = 1
+"""
+Version of the store manifest's format.
+"""
+
+
+class StoreManifest(NamedTuple):
+    """
+    The modules of a generation published in a content-addressed store.
+    """
+
+    store: str
+    """
+    Path of the store, relative to the manifest's folder.
+    """
+    modules: dict[str, str]
+    """
+    Blob of the modules' documents, relative to the store.
+    Keys are the modules' path relative to the output folder, as requested by the frontend's `HttpClient.fetchModule`
+    (e.g. `foo/bar` for the module `foo.bar`).
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": STORE_MANIFEST_VERSION,
+            "store": self.store,
+            "modules": self.modules,
+        }
+
+    def save(self, folder: Path):
+        """
+        Save the manifest in the output folder.
+
+        Parameters:
+            folder: The output folder.
+        """
+        path = folder / STORE_MANIFEST_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="UTF8") as file:
+            json.dump(self.to_json(), file, indent=4)
+
+    @staticmethod
+    def load(folder: Path) -> "StoreManifest":
+        """
+        Load the manifest of an output folder.
+
+        Parameters:
+            folder: The output folder.
+
+        Returns:
+            The manifest.
+        """
+        with open(folder / STORE_MANIFEST_FILENAME, encoding="UTF8") as file:
+            content = json.load(file)
+        return StoreManifest(store=content["store"], modules=content["modules"])
+
+
+class ContentStore:  # pylint: disable=too-few-public-methods
+    """
+    A content-addressed store of documents.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        """
+        Parameters:
+            folder: The store's folder.
+        """
+        self.folder = folder
+        """
+        The store's folder.
+        """
+        self.written = 0
+        """
+        Number of blobs written.
+        """
+        self.reused = 0
+        """
+        Number of blobs found already stored.
+        """
+
+    def put(self, source: Path) -> str:
+        """
+        Store a document, if not already stored.
+
+        Parameters:
+            source: Path of the document.
+
+        Returns:
+            The blob's name, relative to the store's folder (e.g. `0a1b2c3d4e5f6a7b.json`).
+        """
+        name = f"{content_hash(source)}{source.suffix}"
+        target = self.folder / name
+        if target.exists():
+            self.reused += 1
+            return name
+        write_atomically(target=target, content=source.read_bytes())
+        self.written += 1
+        return name
+
+
+def publish_modules(
+    folder: Path, store: ContentStore, modules: list[str]
+) -> StoreManifest:
+    """
+    Publish the API files of a generation in a content-addressed store, and save the store's manifest in the
+    output folder.
+
+    Parameters:
+        folder: The output folder.
+        store: The store.
+        modules: The modules' path relative to the output folder (e.g. `foo/bar` for the module `foo.bar`).
+
+    Returns:
+        The manifest.
+    """
+    manifest = StoreManifest(
+        store=Path(
+            os.path.relpath(
+                store.folder.resolve(),
+                (folder / STORE_MANIFEST_FILENAME).parent.resolve(),
+            )
+        ).as_posix(),
+        modules={
+            module: store.put(source=folder / f"{module}.json") for module in modules
+        },
+    )
+    manifest.save(folder=folder)
+    return manifest
@@ -0,0 +1,108 @@
+"""
+Memoization of the docstrings' parsing and of the cross-links' rewriting,
+see :attr:`mkapi_python.py_griffe.Project.docstring_cache`.
+"""
+
+from typing import Any, NamedTuple
+
+from griffe.docstrings.dataclasses import DocstringSection
+
+from .incremental import ModuleDependencies
+
+__all__ = ["SectionsKey", "LinksRewrite", "DocstringCache"]
+
+SectionsKey = tuple[str, str, str, str]
+"""
+Key of a parsed docstring: `(text, parent's kind, parent's scope, parser)`.
+
+The parent's scope (the path of the module or class including it) is part of the key: the annotations of the
+sections (e.g. the exceptions of a `Raises` section) are resolved from it.
+"""
+
+
+class LinksRewrite(NamedTuple):
+    """
+    Text with its cross-links rewritten, including the side effects to replay when it is retrieved from the cache.
+    """
+
+    text: str
+    """
+    The text with the cross-links replaced.
+    """
+    report: dict[str, Any] | None
+    """
+    The errors reported while rewriting that do not refer to the entity documented (see `DocReporter.dump`),
+    `None` if no errors.
+    """
+    tags_unknown: list[str]
+    """
+    The unknown tags of the cross-links, reported against the entity documented when replayed.
+    """
+    links_unresolved: list[tuple[str, list[str]]]
+    """
+    The cross-links unresolved along with the candidates suggested, reported against the entity documented when
+    replayed.
+    """
+    dependencies: ModuleDependencies
+    """
+    The lookups done in the symbol tables of the project to resolve the cross-links.
+    """
+
+
+class DocstringCache:
+    """
+    Cache of the parsed docstrings and of the texts with their cross-links rewritten.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty cache.
+        """
+        self.sections: dict[SectionsKey, list[DocstringSection]] = {}
+        """
+        The parsed docstrings, see :glob:`mkapi_python.docstring_cache.SectionsKey`.
+        """
+        self.links: dict[tuple[str, str], LinksRewrite] = {}
+        """
+        The texts with their cross-links rewritten, keyed by `(text, scope)`: the scope is the path of the module or
+        class including the entity documented, identical texts of sibling entities share their rewrite.
+        """
+        self.hits = 0
+        """
+        Number of parsed docstrings and rewritten texts retrieved from the cache.
+        """
+        self.misses = 0
+        """
+        Number of parsed docstrings and rewritten texts computed.
+        """
+
+    def get_sections(self, key: SectionsKey) -> list[DocstringSection] | None:
+        """
+        Parameters:
+            key: Key of the docstring.
+
+        Returns:
+            The cached sections, if any.
+        """
+        sections = self.sections.get(key, None)
+        if sections is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return sections
+
+    def get_links(self, text: str, scope: str) -> LinksRewrite | None:
+        """
+        Parameters:
+            text: The text.
+            scope: Path of the module or class including the entity documented.
+
+        Returns:
+            The cached rewrite, if any.
+        """
+        rewrite = self.links.get((text, scope), None)
+        if rewrite is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return rewrite
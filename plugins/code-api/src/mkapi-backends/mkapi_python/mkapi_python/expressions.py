@@ -0,0 +1,78 @@
+"""
+Walker over the :ext:`griffe` expressions, used to find the names referenced in the declarations of the entities.
+"""
+
+import dataclasses
+from typing import Any
+
+from griffe.dataclasses import Decorator as AstDecorator
+from griffe.dataclasses import Parameter as AstParameter
+from griffe.dataclasses import Parameters as AstParameters
+from griffe.expressions import Expr, ExprName
+
+__all__ = ["expression_fields", "find_names"]
+
+_EXPRESSION_FIELDS: dict[type[Expr], tuple[str, ...]] = {}
+
+
+def expression_fields(expr_type: type[Expr]) -> tuple[str, ...]:
+    """
+    Returns the fields of an expression's type that may include sub-expressions, in declaration order.
+
+    The field `parent` is excluded: it points to the scope of the expression.
+    Results are cached by type.
+
+    Parameters:
+        expr_type: Type of the expression (e.g. `ExprSubscript`).
+
+    Returns:
+        The fields' name.
+    """
+    fields = _EXPRESSION_FIELDS.get(expr_type, None)
+    if fields is None:
+        fields = tuple(
+            f.name for f in dataclasses.fields(expr_type) if f.name != "parent"
+        )
+        _EXPRESSION_FIELDS[expr_type] = fields
+    return fields
+
+
+def find_names(ast: Any) -> list[ExprName]:
+    """
+    Find the names referenced within expressions.
+
+    The walk is typed: it only follows the fields of the expressions (see
+    :func:`mkapi_python.expressions.expression_fields`), the elements of lists and tuples, and the expressions held
+    by parameters and decorators. In particular, names are not resolved.
+
+    Parameters:
+        ast: An expression, a list or tuple of expressions, parameters or decorators.
+            Other values (e.g. `str`, `None`) are ignored.
+
+    Returns:
+        The names in order of appearance, each instance of `ExprName` is included once.
+    """
+    names: list[ExprName] = []
+    visited: set[int] = set()
+
+    def visit(node: Any):
+        if isinstance(node, Expr):
+            if id(node) in visited:
+                return
+            visited.add(id(node))
+            if isinstance(node, ExprName):
+                names.append(node)
+                return
+            for field in expression_fields(type(node)):
+                visit(getattr(node, field))
+        elif isinstance(node, (list, tuple, AstParameters)):
+            for item in node:
+                visit(item)
+        elif isinstance(node, AstParameter):
+            visit(node.annotation)
+            visit(node.default)
+        elif isinstance(node, AstDecorator):
+            visit(node.value)
+
+    visit(ast)
+    return names
@@ -0,0 +1,276 @@
+"""
+Support for the incremental generation of API files, see
+:attr:`mkapi_python.py_griffe.Configuration.incremental`.
+
+A manifest is stored in the artifacts' folder of the output folder, it records for each generated module:
+*  A fingerprint of its inputs: source files and docstrings.
+*  The symbols it has looked up in the tables of the project, and a hash of their resolution.
+*  The report of errors emitted while generating it (replayed when the module is skipped).
+
+On subsequent runs, a module is only regenerated if one of these entries changed, and the API files of the
+modules not documented anymore are removed.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, NamedTuple
+
+from .artifacts import ARTIFACTS_FOLDER
+
+__all__ = [
+    "INCREMENTAL_MANIFEST_FILENAME",
+    "INCREMENTAL_MANIFEST_VERSION",
+    "DependencyKind",
+    "ModuleDependencies",
+    "empty_dependencies",
+    "ManifestEntry",
+    "IncrementalManifest",
+    "remove_api_files",
+    "hash_json",
+    "hash_files",
+]
+
+INCREMENTAL_MANIFEST_FILENAME = f"{ARTIFACTS_FOLDER}/incremental.json"
+"""
+Path of the manifest file, relative to :attr:`mkapi_python.py_griffe.Configuration.out`
+(see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+"""
+
+INCREMENTAL_MANIFEST_VERSION = 1
+"""
+Version of the manifest's format, manifests with a different version are discarded.
+"""
+
+
+DependencyKind = Literal["symbols", "aliases", "names", "candidates", "crossLinks"]
+"""
+Kinds of lookups recorded in :class:`mkapi_python.incremental.ModuleDependencies`.
+"""
+
+
+class ModuleDependencies(NamedTuple):
+    """
+    Records the lookups in the symbol tables of the project done while generating a module.
+
+    Each set gathers the keys requested, regardless whether they have been resolved.
+    """
+
+    symbols: set[str]
+    """
+    Keys looked up in :attr:`mkapi_python.py_griffe.Project.all_symbols`.
+    """
+    aliases: set[str]
+    """
+    Keys looked up in :attr:`mkapi_python.py_griffe.Project.all_aliases`.
+    """
+    names: set[str]
+    """
+    Names for which a unique symbol has been searched in the project.
+    """
+    cross_links: set[str]
+    """
+    Python paths resolved within :attr:`mkapi_python.py_griffe.Project.cross_linked_packages`.
+    """
+    candidates: set[str]
+    """
+    Unresolved sphinx cross-links (formatted as `tag:path`) for which candidates have been searched.
+    """
+
+    def lookups(self) -> Iterator[tuple[DependencyKind, str]]:
+        """
+        Returns:
+            The lookups as tuples `(kind, key)`, sorted by key for each kind.
+        """
+        yield from (("symbols", k) for k in sorted(self.symbols))
+        yield from (("aliases", k) for k in sorted(self.aliases))
+        yield from (("names", k) for k in sorted(self.names))
+        yield from (("candidates", k) for k in sorted(self.candidates))
+        yield from (("crossLinks", k) for k in sorted(self.cross_links))
+
+    def to_json(self) -> dict[str, list[str]]:
+        return {
+            "symbols": sorted(self.symbols),
+            "aliases": sorted(self.aliases),
+            "names": sorted(self.names),
+            "crossLinks": sorted(self.cross_links),
+            "candidates": sorted(self.candidates),
+        }
+
+    @staticmethod
+    def from_json(data: dict[str, list[str]]) -> "ModuleDependencies":
+        return ModuleDependencies(
+            symbols=set(data["symbols"]),
+            aliases=set(data["aliases"]),
+            names=set(data["names"]),
+            cross_links=set(data["crossLinks"]),
+            candidates=set(data["candidates"]),
+        )
+
+
+def empty_dependencies() -> ModuleDependencies:
+    """
+    Returns:
+        A new recorder with no dependencies.
+    """
+    return ModuleDependencies(
+        symbols=set(),
+        aliases=set(),
+        names=set(),
+        cross_links=set(),
+        candidates=set(),
+    )
+
+
+class ManifestEntry(NamedTuple):
+    """
+    Entry of the manifest for a generated module.
+    """
+
+    sources: str
+    """
+    Hash of the module's source files and docstrings.
+    """
+    dependencies: ModuleDependencies
+    """
+    Lookups done in the symbol tables while generating the module.
+    """
+    resolutions: str
+    """
+    Hash of the resolution of :attr:`mkapi_python.incremental.ManifestEntry.dependencies`.
+    """
+    report: dict[str, Any]
+    """
+    Errors reported while generating the module,
+    see `DocReporter.dump`.
+    """
+
+
+class IncrementalManifest(NamedTuple):
+    """
+    Manifest of an incremental generation.
+    """
+
+    generator: str
+    """
+    Hash of the generator's sources and of the configuration's elements impacting the outputs.
+    A change invalidates all the entries.
+    """
+    modules: dict[str, ManifestEntry]
+    """
+    Entries of the generated modules, keyed by module's path (e.g. `foo.bar`).
+    """
+
+    @staticmethod
+    def load(folder: Path, generator: str) -> "IncrementalManifest":
+        """
+        Load the manifest from the output folder.
+
+        Parameters:
+            folder: The output folder.
+            generator: The expected generator hash.
+
+        Returns:
+            The manifest, without entries if it does not exist or if it was produced by another generator.
+        """
+        path = folder / INCREMENTAL_MANIFEST_FILENAME
+        empty = IncrementalManifest(generator=generator, modules={})
+        if not path.exists():
+            return empty
+        with open(path, encoding="UTF8") as file:
+            data = json.load(file)
+        if (
+            data.get("version") != INCREMENTAL_MANIFEST_VERSION
+            or data.get("generator") != generator
+        ):
+            return empty
+        return IncrementalManifest(
+            generator=generator,
+            modules={
+                path: ManifestEntry(
+                    sources=entry["sources"],
+                    dependencies=ModuleDependencies.from_json(entry["dependencies"]),
+                    resolutions=entry["resolutions"],
+                    report=entry["report"],
+                )
+                for path, entry in data["modules"].items()
+            },
+        )
+
+    def save(self, folder: Path):
+        """
+        Save the manifest in the output folder.
+
+        Parameters:
+            folder: The output folder.
+        """
+        path = folder / INCREMENTAL_MANIFEST_FILENAME
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INCREMENTAL_MANIFEST_VERSION,
+            "generator": self.generator,
+            "modules": {
+                path: {
+                    "sources": entry.sources,
+                    "dependencies": entry.dependencies.to_json(),
+                    "resolutions": entry.resolutions,
+                    "report": entry.report,
+                }
+                for path, entry in sorted(self.modules.items())
+            },
+        }
+        with open(path, "w", encoding="UTF8") as file:
+            json.dump(data, file, indent=1)
+
+
+def remove_api_files(folder: Path, modules: Iterable[str]):
+    """
+    Remove the API files of modules, e.g. those of a previous generation not documented anymore.
+    The folders left empty are removed as well.
+
+    Parameters:
+        folder: The output folder.
+        modules: The modules' path (e.g. `foo.bar`), missing API files are ignored.
+    """
+    for module in modules:
+        path = folder / f"{module.replace('.', '/')}.json"
+        path.unlink(missing_ok=True)
+        parent = path.parent
+        while parent != folder and parent.is_dir() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+
+
+def hash_json(data: Any) -> str:
+    """
+    Hash a JSON serializable data in a stable way.
+
+    Parameters:
+        data: The data.
+
+    Returns:
+        The hash.
+    """
+    serialized = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("UTF8")).hexdigest()
+
+
+def hash_files(paths: list[Path], extra: list[str]) -> str:
+    """
+    Hash the content of files along with some extra strings.
+
+    Parameters:
+        paths: The files' path, missing files are ignored.
+        extra: Extra strings included in the hash.
+
+    Returns:
+        The hash.
+    """
+    hasher = hashlib.sha256()
+    for path in paths:
+        hasher.update(str(path).encode("UTF8") + b"\0")
+        if path.is_file():
+            hasher.update(path.read_bytes() + b"\0")
+    for text in extra:
+        hasher.update(text.encode("UTF8") + b"\0")
+    return hasher.hexdigest()
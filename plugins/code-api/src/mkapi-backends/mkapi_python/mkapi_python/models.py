@@ -7,6 +7,8 @@ Python equivalent of the TypeScript's :ext:`models<code-api-models>`.
 import dataclasses
 from typing import Optional
 
+from .serialization import OMIT_IF_NONE
+
 EntityPath = str
 """
 Entity path is the python path of a module, e.g. `moduleFoo.ClassBar.attBaz`.
@@ -105,6 +107,14 @@ class Code:
     """
     Optional associated implementation.
     """
+    implementationAsset: Optional[str] = dataclasses.field(
+        default=None, metadata=OMIT_IF_NONE
+    )
+    """
+    Path of the source file's asset (a JSON file including the source as a string) relative to the data folder,
+    when the implementation is not embedded (see `mkapi_python.source_assets`): the implementation spans the lines
+    `startLine` to `endLine`. Omitted from the API files when `None`.
+    """
 
 
 @dataclasses.dataclass(frozen=True)
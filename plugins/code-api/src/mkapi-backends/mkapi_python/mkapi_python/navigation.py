@@ -0,0 +1,128 @@
+"""
+Navigation manifest: the tree of the documented modules in a single file, see
+:glob:`mkapi_python.navigation.NAVIGATION_FILENAME`.
+
+It allows the frontend to build the whole API navigation with one request, instead of fetching each module's
+document to learn its children. The content hash of each module's document is included: documents can be fetched
+using it as a cache buster, and cached indefinitely.
+"""
+
+import dataclasses
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .artifacts import ARTIFACTS_FOLDER
+from .models import ChildModule
+
+__all__ = [
+    "NAVIGATION_FILENAME",
+    "NAVIGATION_VERSION",
+    "content_hash",
+    "NavigationNode",
+    "NavigationManifest",
+]
+
+NAVIGATION_FILENAME = f"{ARTIFACTS_FOLDER}/navigation.json"
+"""
+Path of the navigation manifest, relative to :attr:`mkapi_python.py_griffe.Configuration.out`
+(see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+"""
+
+NAVIGATION_VERSION = 1
+"""
+Version of the navigation manifest's format.
+"""
+
+
+def content_hash(path: Path) -> str:
+    """
+    Parameters:
+        path: Path of a file.
+
+    Returns:
+        The hash of the file's content.
+    """
+    return hashlib.sha256(path.read_bytes()).hexdigest()[0:16]
+
+
+class NavigationNode(NamedTuple):
+    """
+    A documented module in the navigation manifest.
+    """
+
+    name: str
+    """
+    Name of the module.
+    """
+    nav_path: str | None
+    """
+    Navigation path of the module, `None` for the root module.
+    """
+    is_leaf: bool
+    """
+    Whether the module does not have documented children modules,
+    see :attr:`mkapi_python.models.ChildModule.isLeaf`.
+    """
+    children: list[str]
+    """
+    Paths of the documented children modules (e.g. `foo.bar`), in the order of the module's document.
+    The extra children modules follow, see :attr:`mkapi_python.navigation.NavigationManifest.extra_modules`.
+    """
+    hash: str
+    """
+    Hash of the module's document, see :func:`mkapi_python.navigation.content_hash`.
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "navPath": self.nav_path,
+            "isLeaf": self.is_leaf,
+            "children": self.children,
+            "hash": self.hash,
+        }
+
+
+class NavigationManifest(NamedTuple):
+    """
+    The navigation manifest of a package.
+    """
+
+    root: str
+    """
+    Path of the root module.
+    """
+    modules: dict[str, NavigationNode]
+    """
+    The documented modules, keyed by path (e.g. `foo.bar`), in depth-first order.
+    """
+    extra_modules: dict[str, list[ChildModule]]
+    """
+    Extra children modules keyed by parent module's path,
+    see :attr:`mkapi_python.py_griffe.Configuration.extra_modules`.
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": NAVIGATION_VERSION,
+            "root": self.root,
+            "modules": {path: node.to_json() for path, node in self.modules.items()},
+            "extraModules": {
+                path: [dataclasses.asdict(child) for child in children]
+                for path, children in self.extra_modules.items()
+            },
+        }
+
+    def save(self, folder: Path):
+        """
+        Save the manifest in the output folder, in a compact form.
+
+        Parameters:
+            folder: The output folder.
+        """
+        target = folder / NAVIGATION_FILENAME
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "w", encoding="UTF8") as file:
+            json.dump(self.to_json(), file, separators=(",", ":"))
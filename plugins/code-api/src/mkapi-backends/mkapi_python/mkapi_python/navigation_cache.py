@@ -0,0 +1,82 @@
+"""
+Memoization of the resolution of python paths into navigation paths,
+see :attr:`mkapi_python.py_griffe.Project.navigation_cache`.
+"""
+
+from typing import Literal, NamedTuple
+
+from .incremental import ModuleDependencies
+
+__all__ = ["CrossRefError", "NavigationResolution", "NavigationCache"]
+
+CrossRefError = Literal["internal", "external"]
+"""
+Kind of cross-reference error reported when a python path can not be resolved.
+"""
+
+
+class NavigationResolution(NamedTuple):
+    """
+    Resolution of a python path, including the side effects to replay when it is retrieved from the cache.
+    """
+
+    nav: str | None
+    """
+    The navigation path, `None` if not resolved.
+    """
+    error: CrossRefError | None
+    """
+    The cross-reference error to report (if requested) when not resolved.
+    """
+    dependencies: ModuleDependencies
+    """
+    The lookups done in the symbol tables of the project to resolve the path.
+    """
+
+
+class NavigationCache:
+    """
+    Cache of the resolutions of `(python path, name)` into navigation paths, including unresolved ones.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty cache.
+        """
+        self.entries: dict[tuple[str, str], NavigationResolution] = {}
+        """
+        The resolutions, keyed by `(python path, name)`.
+        """
+        self.hits = 0
+        """
+        Number of resolutions retrieved from the cache.
+        """
+        self.misses = 0
+        """
+        Number of resolutions computed.
+        """
+
+    def get(self, py_path: str, name: str) -> NavigationResolution | None:
+        """
+        Parameters:
+            py_path: The python path.
+            name: The name of the symbol.
+
+        Returns:
+            The cached resolution, if any.
+        """
+        resolution = self.entries.get((py_path, name), None)
+        if resolution is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return resolution
+
+    def set(self, py_path: str, name: str, resolution: NavigationResolution):
+        """
+        Parameters:
+            py_path: The python path.
+            name: The name of the symbol.
+            resolution: The resolution.
+        """
+        self.entries[(py_path, name)] = resolution
@@ -0,0 +1,160 @@
+"""
+Bundled API pack: the API files of all the modules concatenated in one file, along with an index
+`module path` → `(offset, length)`, see :attr:`mkapi_python.py_griffe.Configuration.pack`.
+
+It allows a site to serve all the modules' documents with one request, or with HTTP range requests.
+
+The pack can be precompressed using `gzip`: each module is then compressed as an independent gzip member.
+The offsets and lengths refer to the compressed bytes, each slice can be decompressed on its own,
+and the whole pack decompresses into the concatenation of the modules' documents.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Literal, NamedTuple
+
+from .artifacts import ARTIFACTS_FOLDER
+
+__all__ = [
+    "PackCompression",
+    "PACK_FILENAME",
+    "PACK_INDEX_FILENAME",
+    "PACK_VERSION",
+    "PackIndex",
+    "write_pack",
+    "read_pack_index",
+    "read_packed_module",
+]
+
+PackCompression = Literal["gzip"]
+"""
+Supported compressions of the pack.
+"""
+
+PACK_FILENAME = f"{ARTIFACTS_FOLDER}/api.pack"
+"""
+Path of the pack file, relative to :attr:`mkapi_python.py_griffe.Configuration.out`
+(see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+The suffix `.gz` is appended when compressed.
+"""
+
+PACK_INDEX_FILENAME = f"{ARTIFACTS_FOLDER}/api.pack-index.json"
+"""
+Path of the pack's index file, relative to :attr:`mkapi_python.py_griffe.Configuration.out`.
+"""
+
+PACK_VERSION = 1
+"""
+Version of the pack's format.
+"""
+
+
+class PackIndex(NamedTuple):
+    """
+    Index of a pack.
+    """
+
+    pack: str
+    """
+    Name of the pack file, relative to the index's folder.
+    """
+    compression: PackCompression | None
+    """
+    Compression of the modules' documents.
+    """
+    modules: dict[str, tuple[int, int]]
+    """
+    Location in the pack of the modules' documents `(offset, length)`, in bytes.
+    Keys are the modules' path relative to the output folder, as requested by the frontend's `HttpClient.fetchModule`
+    (e.g. `foo/bar` for the module `foo.bar`).
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": PACK_VERSION,
+            "pack": self.pack,
+            "compression": self.compression,
+            "modules": {k: list(v) for k, v in self.modules.items()},
+        }
+
+    @staticmethod
+    def from_json(data: dict[str, Any]) -> "PackIndex":
+        if data.get("version") != PACK_VERSION:
+            raise ValueError(
+                f"Unsupported pack version '{data.get('version')}', expected '{PACK_VERSION}'"
+            )
+        return PackIndex(
+            pack=data["pack"],
+            compression=data["compression"],
+            modules={k: (v[0], v[1]) for k, v in data["modules"].items()},
+        )
+
+
+def write_pack(
+    folder: Path, modules: list[str], compression: PackCompression | None
+) -> PackIndex:
+    """
+    Bundle API files into a pack, and write its index.
+
+    Parameters:
+        folder: The output folder, where the API files have been generated.
+        modules: The modules' path relative to the folder (e.g. `foo/bar` for the file `foo/bar.json`).
+        compression: Compression of the modules' documents.
+
+    Returns:
+        The index.
+    """
+    pack_path = folder / (PACK_FILENAME + (".gz" if compression == "gzip" else ""))
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    locations: dict[str, tuple[int, int]] = {}
+    offset = 0
+    with open(pack_path, "wb") as pack:
+        for module in modules:
+            content = (folder / f"{module}.json").read_bytes()
+            if compression == "gzip":
+                content = gzip.compress(content, mtime=0)
+            pack.write(content)
+            locations[module] = (offset, len(content))
+            offset += len(content)
+    index = PackIndex(pack=pack_path.name, compression=compression, modules=locations)
+    with open(folder / PACK_INDEX_FILENAME, "w", encoding="UTF8") as file:
+        json.dump(index.to_json(), file, separators=(",", ":"))
+    return index
+
+
+def read_pack_index(folder: Path) -> PackIndex:
+    """
+    Read the index of a pack.
+
+    Parameters:
+        folder: The output folder, where the pack has been written.
+
+    Returns:
+        The index.
+    """
+    with open(folder / PACK_INDEX_FILENAME, encoding="UTF8") as file:
+        return PackIndex.from_json(json.load(file))
+
+
+def read_packed_module(folder: Path, index: PackIndex, module: str) -> dict[str, Any]:
+    """
+    Read a module's document from a pack, the way a client would using an HTTP range request.
+
+    Parameters:
+        folder: The output folder, where the pack has been written.
+        index: The pack's index, see :func:`mkapi_python.pack.read_pack_index`.
+        module: The module's path, e.g. `foo/bar`.
+
+    Returns:
+        The module's document.
+    """
+    if module not in index.modules:
+        raise KeyError(f"Module '{module}' not found in the pack '{index.pack}'")
+    offset, length = index.modules[module]
+    with open((folder / PACK_INDEX_FILENAME).parent / index.pack, "rb") as pack:
+        pack.seek(offset)
+        content = pack.read(length)
+    if index.compression == "gzip":
+        content = gzip.decompress(content)
+    return json.loads(content)
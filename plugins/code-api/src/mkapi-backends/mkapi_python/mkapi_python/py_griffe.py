@@ -5,12 +5,27 @@ The python backend module to produce API files from python modules.
 
 import dataclasses
 import functools
+import importlib.metadata
 import json
+import multiprocessing
 import pprint
 import re
+import threading
+import time
+import typing
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path, PosixPath
-from typing import Any, Literal, NamedTuple, Sequence, TypeVar, cast
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 import griffe
 from griffe.dataclasses import Alias as AstAlias
@@ -21,19 +36,34 @@ from griffe.dataclasses import Function as AstFunction
 from griffe.dataclasses import Module as AstModule
 from griffe.dataclasses import Object as AstObject
 from griffe.docstrings.dataclasses import (
+    DocstringParameter,
+    DocstringRaise,
     DocstringSection,
     DocstringSectionAdmonition,
     DocstringSectionParameters,
     DocstringSectionRaises,
     DocstringSectionReturns,
     DocstringSectionText,
-    DocstringParameter,
-    DocstringRaise,
 )
 from griffe.enumerations import Kind
 from griffe.exceptions import AliasResolutionError
-from griffe.expressions import ExprName, Expr
-
+from griffe.expressions import Expr, ExprName
+
+from .artifacts import ARTIFACTS_FOLDER
+from .ast_cache import AstCache
+from .content_store import ContentStore, publish_modules
+from .docstring_cache import DocstringCache, LinksRewrite
+from .expressions import find_names
+from .incremental import (
+    DependencyKind,
+    IncrementalManifest,
+    ManifestEntry,
+    ModuleDependencies,
+    empty_dependencies,
+    hash_files,
+    hash_json,
+    remove_api_files,
+)
 from .models import (
     Attribute,
     Callable,
@@ -46,6 +76,14 @@ from .models import (
     Semantic,
     Type,
 )
+from .navigation import NavigationManifest, NavigationNode, content_hash
+from .navigation_cache import CrossRefError, NavigationCache, NavigationResolution
+from .pack import PackCompression, write_pack
+from .search_index import SearchDocument, SearchIndex, summary_sentence
+from .serialization import dump_model
+from .source_assets import SourceAssets
+from .stats import GenerationStats, ModuleStats
+from .suffix_trie import SuffixTrie
 
 INIT_FILENAME = "__init__.py"
 """
@@ -99,6 +137,77 @@ class Configuration(NamedTuple):
     }
     ```
     """
+    incremental: bool = False
+    """
+    If `True`, only the modules for which inputs changed since the last generation are regenerated.
+
+    The inputs of a module are its source files, its docstrings, and the resolution of the symbols it references.
+    They are tracked within a manifest stored in the artifacts' folder, see
+    :glob:`mkapi_python.incremental.INCREMENTAL_MANIFEST_FILENAME`. The API files of the modules not documented
+    anymore are removed.
+    """
+    jobs: int = 1
+    """
+    Number of worker processes used to generate the modules' API files.
+
+    Workers are forked from the main process, the AST and the symbols tables are shared read-only.
+    Generated files are identical to those of a serial generation (`jobs=1`).
+    If the `fork` start method is not available on the platform, the generation is serial.
+    """
+    ast_cache: AstCache | None = None
+    """
+    If provided, the :attr:`cross-linked packages<mkapi_python.py_griffe.Configuration.cross_linked_packages>`
+    are loaded using this cache, and the counts of hits & misses are reported at the end of the generation.
+
+    The root module's AST provided to :func:`mkapi_python.py_griffe.generate_api` can also be loaded using
+    :func:`mkapi_python.ast_cache.AstCache.load`.
+    """
+    compact: bool = False
+    """
+    If `True`, API files are written without indentation nor line breaks.
+    """
+    pack: bool = False
+    """
+    If `True`, the API files are also bundled in a single pack file along with an index of the modules' location,
+    see :glob:`mkapi_python.pack.PACK_FILENAME` and :glob:`mkapi_python.pack.PACK_INDEX_FILENAME`.
+    """
+    pack_compression: PackCompression | None = None
+    """
+    Compression of the modules' documents within the pack (if :attr:`mkapi_python.py_griffe.Configuration.pack`
+    is enabled).
+    """
+    stats_report: Path | None = None
+    """
+    If provided, the statistics of the generation (wall time & memory per phase, slowest modules and entities)
+    are saved as JSON in this file, see :class:`mkapi_python.stats.GenerationStats`.
+    """
+    cross_linked_indexes: dict[str, Path] = {}
+    """
+    Symbol indexes of cross-linked packages, keyed by package name,
+    e.g. `{'foo': Path('/docs/api/foo/.mkapi/symbols-index.json')}`.
+
+    Such indexes are emitted by :func:`mkapi_python.py_griffe.generate_api` when generating the API files of a
+    package, see :glob:`mkapi_python.py_griffe.SYMBOL_INDEX_FILENAME`.
+    A package of :attr:`mkapi_python.py_griffe.Configuration.cross_linked_packages` with an index is resolved
+    from it, instead of loading and parsing the package's sources.
+    """
+    source_assets: bool = False
+    """
+    If `True`, the implementations of classes & functions are not embedded in the API files: each source file is
+    written once as a separate asset, referenced by the entities' code along with their lines range.
+    See `mkapi_python.source_assets`.
+    """
+    search_index: bool = False
+    """
+    If `True`, a sharded inverted index of the symbols (names, parents' path & docstrings' first sentence) is written
+    for client-side search, see :glob:`mkapi_python.search_index.SEARCH_INDEX_FOLDER`.
+    """
+    content_store: Path | None = None
+    """
+    If provided, the API files are also published in this content-addressed store (shared by the generations of
+    several versions of the package), along with a manifest mapping the modules to their blob, see
+    :glob:`mkapi_python.content_store.STORE_MANIFEST_FILENAME`.
+    """
 
 
 SymbolKind = Literal["function", "attribute", "class", "property", "method", "module"]
@@ -137,6 +246,103 @@ class CrossLinkedPackage(NamedTuple):
     The list of aliases defined in the documented module (from the library).
     """
 
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "symbols": {
+                path: [symbol.kind, symbol.navigation_path]
+                for path, symbol in self.all_symbols.items()
+            },
+            "aliases": self.all_aliases,
+        }
+
+    @staticmethod
+    def from_json(data: dict[str, Any]) -> "CrossLinkedPackage":
+        return CrossLinkedPackage(
+            all_symbols={
+                path: SymbolRef(kind=kind, navigation_path=nav)
+                for path, (kind, nav) in data["symbols"].items()
+            },
+            all_aliases=data["aliases"],
+        )
+
+
+SYMBOL_INDEX_FILENAME = f"{ARTIFACTS_FOLDER}/symbols-index.json"
+"""
+Path of the symbol index file emitted by :func:`mkapi_python.py_griffe.generate_api`, relative to
+:attr:`mkapi_python.py_griffe.Configuration.out` (see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+
+It is the serialization of the package's :class:`mkapi_python.py_griffe.CrossLinkedPackage`, and can be published
+along with the API files to let downstream packages cross-link without loading the package,
+see :attr:`mkapi_python.py_griffe.Configuration.cross_linked_indexes`.
+"""
+
+SYMBOL_INDEX_VERSION = 1
+"""
+Version of the symbol index's format.
+"""
+
+
+def save_symbol_index(package: CrossLinkedPackage, name: str, folder: Path):
+    """
+    Save the symbol index of a package, see :glob:`mkapi_python.py_griffe.SYMBOL_INDEX_FILENAME`.
+
+    Parameters:
+        package: The package's symbols.
+        name: The package's name.
+        folder: The output folder.
+    """
+    path = folder / SYMBOL_INDEX_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": SYMBOL_INDEX_VERSION, "package": name, **package.to_json()}
+    with open(path, "w", encoding="UTF8") as file:
+        json.dump(data, file, separators=(",", ":"))
+
+
+def save_project_symbol_index(project: "Project"):
+    """
+    Save the symbol index of a project's package in its output folder, see
+    :func:`mkapi_python.py_griffe.save_symbol_index`.
+
+    Parameters:
+        project: The project.
+    """
+    save_symbol_index(
+        package=CrossLinkedPackage(
+            all_symbols=project.all_symbols, all_aliases=project.all_aliases
+        ),
+        name=project.root_ast.name,
+        folder=project.config.out,
+    )
+
+
+def load_symbol_index(path: Path, package: str) -> CrossLinkedPackage:
+    """
+    Load a symbol index emitted by :func:`mkapi_python.py_griffe.save_symbol_index`.
+
+    A `ValueError` is raised if the index's format version is not supported, or if the index is the one of another
+    package.
+
+    Parameters:
+        path: Path of the index file.
+        package: Name of the package expected in the index.
+
+    Returns:
+        The package's symbols.
+    """
+    with open(path, encoding="UTF8") as file:
+        data = json.load(file)
+    if data.get("version") != SYMBOL_INDEX_VERSION:
+        raise ValueError(
+            f"Unsupported symbol index version '{data.get('version')}' in '{path}', "
+            f"expected '{SYMBOL_INDEX_VERSION}'"
+        )
+    if data.get("package") != package:
+        raise ValueError(
+            f"The symbol index '{path}' is the one of the package '{data.get('package')}', "
+            f"expected '{package}'"
+        )
+    return CrossLinkedPackage.from_json(data)
+
 
 class Project(NamedTuple):
     """
@@ -163,6 +369,61 @@ class Project(NamedTuple):
     """
     Data prepared for cross-linked packages.
     """
+    symbols_by_name: dict[str, list[SymbolRef]]
+    """
+    The symbols of :attr:`mkapi_python.py_griffe.Project.all_symbols` indexed by name (last segment of their path),
+    see :func:`mkapi_python.py_griffe.init_symbols_by_name`.
+    """
+    symbols_trie: SuffixTrie
+    """
+    The paths of :attr:`mkapi_python.py_griffe.Project.all_symbols` indexed by suffix,
+    used to suggest candidates for unresolved cross-links.
+    """
+    declarations_names: dict[str, "DeclarationNames"]
+    """
+    Names referenced in the declarations of the documented entities, keyed by entity's path.
+    See :func:`mkapi_python.py_griffe.init_declarations_names`.
+    """
+    modules_elements: dict[str, "ModuleElements"]
+    """
+    Elements of the documented modules, keyed by module's path.
+    See :func:`mkapi_python.py_griffe.init_modules_elements`.
+    """
+    leaf_modules: dict[str, bool]
+    """
+    Whether the documented modules are leaves (they do not have documented sub-modules), keyed by module's path.
+    See :func:`mkapi_python.py_griffe.init_leaf_modules`.
+    """
+    navigation_cache: NavigationCache
+    """
+    Memoized resolutions of python paths into navigation paths, see
+    :func:`mkapi_python.py_griffe.navigation_path`.
+    When modules are generated in parallel, each worker process populates its own copy.
+    """
+    reporter: "DocReporter"
+    """
+    Collects the documentation errors of the run. Each module is parsed with its own reporter, whose errors are
+    merged into this one, see :func:`mkapi_python.py_griffe.parse_module_generation`.
+    """
+    docstring_cache: DocstringCache
+    """
+    Memoized docstrings' parsing and cross-links' rewriting, see :func:`mkapi_python.py_griffe.get_docstring_sections`
+    and :func:`mkapi_python.py_griffe.replace_links`.
+    When modules are generated in parallel, each worker process populates its own copy.
+    """
+    source_assets: SourceAssets | None = None
+    """
+    If provided, the implementations are written as source assets,
+    see :attr:`mkapi_python.py_griffe.Configuration.source_assets`.
+    """
+    dependencies: ModuleDependencies | None = None
+    """
+    If provided, records the lookups in the symbols tables (used for incremental generation).
+    """
+    entities_durations: dict[str, float] | None = None
+    """
+    If provided, records the parsing's wall time of the module's top-level entities, keyed by entity's path.
+    """
 
 
 NO_SEMANTIC = Semantic(role="", labels=[], attributes={}, relations={})
@@ -245,47 +506,165 @@ TAGS_TO_SEMANTIC: dict[str, str] = {
 Tags to semantic convertor.
 """
 
+CODE_BLOCK_PATTERN = re.compile(r"```.*?```", flags=re.DOTALL)
+"""
+Fenced code blocks of docstrings, in which cross-links are not replaced.
+"""
 
-class DocReporter:
-    errors: dict[str, set[str]] = defaultdict(set)
-    external_cross_ref_errors: set[str] = set()
-    internal_cross_ref_errors: set[str] = set()
-    no_docstrings_errors: set[str] = set()
-    sphinx_tag_unknown: set[str] = set()
-    sphinx_links_unresolved: dict[str, list[str]] = {}
-
-    @staticmethod
-    def add_error(symbol_path: str, description: str):
-        DocReporter.errors[symbol_path].add(description)
+CROSS_LINK_PATTERN = re.compile(r":(\w+):`([^`]+)`")
+"""
+Sphinx cross-links of docstrings: a tag between colons followed by the link's content between backticks.
+The groups are the tag and the link's content.
+"""
 
-    @staticmethod
-    def add_external_cross_ref_error(symbol_path: str):
-        DocReporter.external_cross_ref_errors.add(symbol_path)
+CROSS_LINK_LABEL_PATTERN = re.compile(r"<([^>]+)>")
+"""
+Target of a sphinx cross-link with a custom label, e.g. `custom label <foo.Bar>`.
+"""
 
-    @staticmethod
-    def add_internal_cross_ref_error(symbol_path: str):
-        DocReporter.internal_cross_ref_errors.add(symbol_path)
 
-    @staticmethod
-    def add_no_docstring(symbol_path: str):
-        DocReporter.no_docstrings_errors.add(symbol_path)
+class DocReporter:
+    """
+    Collects the documentation errors reported during a generation, see
+    :attr:`mkapi_python.py_griffe.Project.reporter`.
 
-    @staticmethod
-    def add_sphinx_tag_unknown(parent: str, tag: str):
-        DocReporter.sphinx_tag_unknown.add(f"[{parent}] => `{tag}` unknown")
+    Reports are isolated per instance and can be merged (see `DocReporter.load`): each module is generated with its
+    own reporter, its errors are then merged into the reporter of the run. The methods are thread-safe.
+    """
 
-    @staticmethod
-    def add_sphinx_link_unresolved(parent: str, link: str, candidates: list[str]):
-        DocReporter.sphinx_links_unresolved[f"{parent}=>{link}"] = candidates
+    def __init__(self) -> None:
+        """
+        Initialize an empty reporter.
+        """
+        self.lock = threading.Lock()
+        """
+        Lock serializing the updates of the errors.
+        """
+        self.errors: dict[str, set[str]] = defaultdict(set)
+        """
+        Errors related to a symbol, keyed by symbol's path.
+        """
+        self.external_cross_ref_errors: set[str] = set()
+        """
+        Python paths that could not be resolved into a cross-linked package.
+        """
+        self.internal_cross_ref_errors: set[str] = set()
+        """
+        Python paths that could not be resolved within the documented package.
+        """
+        self.no_docstrings_errors: set[str] = set()
+        """
+        Paths of the symbols without docstring.
+        """
+        self.sphinx_tag_unknown: set[str] = set()
+        """
+        Sphinx cross-links using an unknown tag.
+        """
+        self.sphinx_links_unresolved: dict[str, list[str]] = {}
+        """
+        Sphinx cross-links unresolved, with the candidates suggested.
+        """
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The lock is not picklable, e.g. when the project is sent to worker processes.
+        return {k: v for k, v in self.__dict__.items() if k != "lock"}
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+
+    def add_error(self, symbol_path: str, description: str):
+        with self.lock:
+            self.errors[symbol_path].add(description)
+
+    def add_external_cross_ref_error(self, symbol_path: str):
+        with self.lock:
+            self.external_cross_ref_errors.add(symbol_path)
+
+    def add_internal_cross_ref_error(self, symbol_path: str):
+        with self.lock:
+            self.internal_cross_ref_errors.add(symbol_path)
+
+    def add_no_docstring(self, symbol_path: str):
+        with self.lock:
+            self.no_docstrings_errors.add(symbol_path)
+
+    def add_sphinx_tag_unknown(self, parent: str, tag: str):
+        with self.lock:
+            self.sphinx_tag_unknown.add(f"[{parent}] => `{tag}` unknown")
+
+    def add_sphinx_link_unresolved(self, parent: str, link: str, candidates: list[str]):
+        with self.lock:
+            self.sphinx_links_unresolved[f"{parent}=>{link}"] = candidates
+
+    def clear(self):
+        with self.lock:
+            self.errors = defaultdict(set)
+            self.external_cross_ref_errors = set()
+            self.internal_cross_ref_errors = set()
+            self.no_docstrings_errors = set()
+            self.sphinx_tag_unknown = set()
+            self.sphinx_links_unresolved = {}
+
+    def dump(self) -> dict[str, Any]:
+        """
+        Returns:
+            The errors reported, in a JSON serializable form.
+        """
+        with self.lock:
+            return {
+                "errors": {k: sorted(v) for k, v in sorted(self.errors.items())},
+                "externalCrossRefErrors": sorted(self.external_cross_ref_errors),
+                "internalCrossRefErrors": sorted(self.internal_cross_ref_errors),
+                "noDocstringsErrors": sorted(self.no_docstrings_errors),
+                "sphinxTagUnknown": sorted(self.sphinx_tag_unknown),
+                "sphinxLinksUnresolved": dict(self.sphinx_links_unresolved),
+            }
+
+    def load(self, report: dict[str, Any]):
+        """
+        Merge errors previously reported (possibly by another reporter) into the current ones.
+
+        Parameters:
+            report: The errors, as returned by `DocReporter.dump`.
+        """
+        with self.lock:
+            for symbol_path, descriptions in report["errors"].items():
+                self.errors[symbol_path].update(descriptions)
+            self.external_cross_ref_errors.update(report["externalCrossRefErrors"])
+            self.internal_cross_ref_errors.update(report["internalCrossRefErrors"])
+            self.no_docstrings_errors.update(report["noDocstringsErrors"])
+            self.sphinx_tag_unknown.update(report["sphinxTagUnknown"])
+            self.sphinx_links_unresolved.update(report["sphinxLinksUnresolved"])
+
+
+class LinksReporter(DocReporter):
+    """
+    Reporter of :func:`mkapi_python.py_griffe.rewrite_links` recording the errors referring to the entity documented
+    apart, to replay them against other entities, see :func:`mkapi_python.py_griffe.replace_links`.
+    """
 
-    @staticmethod
-    def clear():
-        DocReporter.errors = {}
-        DocReporter.external_cross_ref_errors = set()
-        DocReporter.internal_cross_ref_errors = set()
-        DocReporter.no_docstrings_errors = set()
-        DocReporter.sphinx_tag_unknown = set()
-        DocReporter.sphinx_links_unresolved = {}
+    def __init__(self) -> None:
+        """
+        Initialize an empty reporter.
+        """
+        super().__init__()
+        self.tags_unknown: list[str] = []
+        """
+        The unknown tags of the cross-links.
+        """
+        self.links_unresolved: list[tuple[str, list[str]]] = []
+        """
+        The cross-links unresolved along with the candidates suggested.
+        """
+
+    def add_sphinx_tag_unknown(self, parent: str, tag: str):
+        with self.lock:
+            self.tags_unknown.append(tag)
+
+    def add_sphinx_link_unresolved(self, parent: str, link: str, candidates: list[str]):
+        with self.lock:
+            self.links_unresolved.append((link, candidates))
 
 
 def ast_file_path(ast: AstObject) -> Path:
@@ -301,10 +680,40 @@ def canonical_path(
     return ast.canonical_path.replace(f"{project.root_ast.name}.", "")
 
 
+def lookup_symbol(key: str, project: Project) -> SymbolRef | None:
+    if project.dependencies is not None:
+        project.dependencies.symbols.add(key)
+    return project.all_symbols.get(key, None)
+
+
+def lookup_alias(key: str, project: Project) -> str | None:
+    if project.dependencies is not None:
+        project.dependencies.aliases.add(key)
+    return project.all_aliases.get(key, None)
+
+
+def find_symbols_by_name(name: str, project: Project) -> list[SymbolRef]:
+    """
+    Find the symbols of the project with a given name (last segment of their path).
+
+    Parameters:
+        name: Name of the symbol.
+        project: Project description.
+
+    Returns:
+        The symbols found.
+    """
+    if project.dependencies is not None:
+        project.dependencies.names.add(name)
+    return project.symbols_by_name.get(name, [])
+
+
 def get_cross_link_package_nav(
     package_name: str, py_path: str, project: Project
 ) -> str | None:
 
+    if project.dependencies is not None:
+        project.dependencies.cross_links.add(py_path)
     direct_path = ".".join(py_path.split(".")[1:])
     symbol = project.cross_linked_packages[package_name].all_symbols.get(
         direct_path, None
@@ -326,19 +735,30 @@ def get_cross_link_package_nav(
     return f"@nav[{package_name}]/{symbol.navigation_path}"
 
 
-def navigation_path(
-    py_path: str, name: str, project: Project, report_error: bool = True
-) -> str | None:
+def resolve_navigation_path(
+    py_path: str, name: str, project: Project
+) -> tuple[str | None, CrossRefError | None]:
+    """
+    Resolve a python path into a navigation path, without using the cache nor reporting errors.
+
+    Parameters:
+        py_path: The python path.
+        name: The name of the symbol.
+        project: Project description.
+
+    Returns:
+        The navigation path (if resolved), and the kind of cross-reference error otherwise.
+    """
 
     def get_symbol(path: str):
         base = path.replace(f"{project.root_ast.name}.", "")
-        symbol_direct = project.all_symbols.get(base, None)
+        symbol_direct = lookup_symbol(base, project)
         if symbol_direct:
             return symbol_direct
-        alias = project.all_aliases.get(path, None)
+        alias = lookup_alias(path, project)
         if alias:
             base = alias.replace(f"{project.root_ast.name}.", "")
-            symbol_alias = project.all_symbols.get(base, None)
+            symbol_alias = lookup_symbol(base, project)
             return symbol_alias
         return None
 
@@ -349,27 +769,67 @@ def navigation_path(
             if parent_symbol and parent_symbol.kind == "attribute":
                 # This is when linking an instance's attribute (from implementation in declaration).
                 # We link to the parent global attribute if it exists.
-                return f"@nav[{project.root_ast.name}]/{parent_symbol.navigation_path}"
-            if report_error:
-                DocReporter.add_internal_cross_ref_error(py_path)
-            return None
-        return f"@nav[{project.root_ast.name}]/{symbol.navigation_path}"
+                return (
+                    f"@nav[{project.root_ast.name}]/{parent_symbol.navigation_path}",
+                    None,
+                )
+            return None, "internal"
+        return f"@nav[{project.root_ast.name}]/{symbol.navigation_path}", None
 
     if py_path in project.config.external_links:
-        return project.config.external_links[py_path]
+        return project.config.external_links[py_path], None
 
     package_name = py_path.split(".")[0]
     if package_name in project.config.cross_linked_packages:
         nav = get_cross_link_package_nav(
             package_name=package_name, py_path=py_path, project=project
         )
-        if not nav and report_error:
-            DocReporter.add_internal_cross_ref_error(py_path)
-        return nav
+        return nav, None if nav else "internal"
 
-    if report_error:
-        DocReporter.add_external_cross_ref_error(py_path)
-    return None
+    return None, "external"
+
+
+def navigation_path(
+    py_path: str, name: str, project: Project, report_error: bool = True
+) -> str | None:
+    """
+    Resolve a python path into a navigation path.
+
+    Resolutions are memoized in :attr:`mkapi_python.py_griffe.Project.navigation_cache`, including the unresolved
+    ones: when retrieved from the cache, the lookups in the symbol tables are recorded in
+    :attr:`mkapi_python.py_griffe.Project.dependencies` and the error is reported as when computed.
+
+    Parameters:
+        py_path: The python path.
+        name: The name of the symbol.
+        project: Project description.
+        report_error: Whether to report a cross-reference error if not resolved.
+
+    Returns:
+        The navigation path, `None` if not resolved.
+    """
+    resolution = project.navigation_cache.get(py_path, name)
+    if resolution is None:
+        dependencies = empty_dependencies()
+        nav, error = resolve_navigation_path(
+            py_path=py_path,
+            name=name,
+            project=project._replace(dependencies=dependencies),
+        )
+        resolution = NavigationResolution(
+            nav=nav, error=error, dependencies=dependencies
+        )
+        project.navigation_cache.set(py_path, name, resolution)
+
+    if project.dependencies is not None:
+        project.dependencies.symbols.update(resolution.dependencies.symbols)
+        project.dependencies.aliases.update(resolution.dependencies.aliases)
+        project.dependencies.cross_links.update(resolution.dependencies.cross_links)
+    if report_error and resolution.error == "internal":
+        project.reporter.add_internal_cross_ref_error(py_path)
+    if report_error and resolution.error == "external":
+        project.reporter.add_external_cross_ref_error(py_path)
+    return resolution.nav
 
 
 def navigation_path_ast(
@@ -386,6 +846,10 @@ def navigation_path_ast(
 
 
 class ModuleElements(NamedTuple):
+    """
+    Documented elements of a module, including those defined in its files.
+    """
+
     modules: list[AstModule]
     files: list[AstModule]
     classes: list[AstClass]
@@ -433,7 +897,69 @@ def extract_module(ast: AstModule) -> ModuleElements:
     )
 
 
+def init_modules_elements(
+    root_ast: AstModule, reused: dict[str, ModuleElements] | None = None
+) -> dict[str, ModuleElements]:
+    """
+    Extract in a single traversal the elements of the documented modules.
+
+    Parameters:
+        root_ast: Root module's AST.
+        reused: Elements already extracted, keyed by module's path, used instead of extracting them again
+            (e.g. those of the modules not reloaded, see :func:`mkapi_python.reload.update_project`).
+
+    Returns:
+        A dictionary `module's path` => :class:`mkapi_python.py_griffe.ModuleElements`, in depth-first order.
+    """
+    modules_elements: dict[str, ModuleElements] = {}
+
+    def init_modules_elements_rec(ast: AstModule):
+        elements = reused.get(ast.path) if reused else None
+        if elements is None:
+            elements = extract_module(ast=ast)
+        modules_elements[ast.path] = elements
+        for child in elements.modules:
+            init_modules_elements_rec(child)
+
+    init_modules_elements_rec(root_ast)
+    return modules_elements
+
+
+def init_leaf_modules(modules_elements: dict[str, ModuleElements]) -> dict[str, bool]:
+    """
+    Compute the leaf status of the documented modules.
+
+    Parameters:
+        modules_elements: Elements of the modules, as returned by
+            :func:`mkapi_python.py_griffe.init_modules_elements`.
+
+    Returns:
+        A dictionary `module's path` => whether the module does not have documented sub-modules.
+    """
+    return {path: not elements.modules for path, elements in modules_elements.items()}
+
+
+def get_module_elements(
+    ast: AstModule, modules_elements: dict[str, ModuleElements] | None
+) -> ModuleElements:
+    """
+    Returns the elements of a module, from the precomputed ones if available.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        modules_elements: Precomputed elements, see :func:`mkapi_python.py_griffe.init_modules_elements`.
+
+    Returns:
+        The elements.
+    """
+    elements = modules_elements.get(ast.path, None) if modules_elements else None
+    return elements if elements is not None else extract_module(ast=ast)
+
+
 def is_leaf_module(path: str, project: Project) -> bool:
+    leaf = project.leaf_modules.get(path, None)
+    if leaf is not None:
+        return leaf
     module_doc: AstModule = functools.reduce(
         lambda acc, e: acc.modules[e] if e else acc,
         path.split(".")[1:],
@@ -453,6 +979,34 @@ def is_leaf_module(path: str, project: Project) -> bool:
     return len(children) == 0
 
 
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+def timed_parse(
+    ast: AstClass | AstFunction | AstAttribute,
+    project: Project,
+    parse: typing.Callable[[], T],
+) -> T:
+    """
+    Parse an entity, recording its wall time in
+    :attr:`mkapi_python.py_griffe.Project.entities_durations` (if provided).
+
+    Parameters:
+        ast: Griffe's entity documentation.
+        project: Project description.
+        parse: The parsing function.
+
+    Returns:
+        The parsed model.
+    """
+    if project.entities_durations is None:
+        return parse()
+    start = time.perf_counter()
+    model = parse()
+    project.entities_durations[ast.path] = time.perf_counter() - start
+    return model
+
+
 def parse_module(ast: AstModule, project: Project) -> Module:
     """
     Transforms module documentation as provided by griffe to the mkdocs-ts models.
@@ -464,25 +1018,46 @@ def parse_module(ast: AstModule, project: Project) -> Module:
     Returns:
         The parsed model.
     """
-    elements = extract_module(ast=ast)
+    elements = get_module_elements(ast=ast, modules_elements=project.modules_elements)
     children_modules = [
         *[parse_child_module(ast=m, project=project) for m in elements.modules],
         *project.config.extra_modules.get(ast.canonical_path, []),
     ]
     classes = [
-        parse_class(ast=c, project=project) for c in elements.classes if c.has_docstring
+        timed_parse(
+            ast=c,
+            project=project,
+            parse=functools.partial(parse_class, ast=c, project=project),
+        )
+        for c in elements.classes
+        if c.has_docstring
     ]
     functions = [
-        parse_function(ast=f, semantic=FUNCTION_GLOBAL_SEMANTIC, project=project)
+        timed_parse(
+            ast=f,
+            project=project,
+            parse=functools.partial(
+                parse_function,
+                ast=f,
+                semantic=FUNCTION_GLOBAL_SEMANTIC,
+                project=project,
+            ),
+        )
         for f in elements.functions
         if f.has_docstring
     ]
     attributes = [
-        parse_attribute(ast=a, semantic=GLOBAL_SEMANTIC, project=project)
+        timed_parse(
+            ast=a,
+            project=project,
+            parse=functools.partial(
+                parse_attribute, ast=a, semantic=GLOBAL_SEMANTIC, project=project
+            ),
+        )
         for a in elements.attributes
     ]
     files = [format_file_doc(ast=f, project=project) for f in elements.files]
-    sections = get_docstring_sections(ast)
+    sections = get_docstring_sections(ast, project=project)
 
     return Module(
         name=ast.name,
@@ -555,7 +1130,7 @@ def format_file_doc(ast: AstModule, project: Project) -> File:
         name=ast.name,
         path=str(ast_file_path(ast).relative_to(root_path.parent)),
         documentation=format_detailed_docstring(
-            get_docstring_sections(ast), parent=ast, project=project
+            get_docstring_sections(ast, project=project), parent=ast, project=project
         ),
     )
 
@@ -572,7 +1147,7 @@ def parse_function(ast: AstFunction, semantic: Semantic, project: Project) -> Ca
     Returns:
         The parsed model.
     """
-    parsed = get_docstring_sections(ast)
+    parsed = get_docstring_sections(ast, project=project)
     sections = [
         p
         for p in parsed
@@ -621,7 +1196,9 @@ def parse_class(ast: AstClass, project: Project) -> Type:
     Returns:
         The parsed model.
     """
-    bases: list[ExprName] = find_attributes_of_type(ast.bases, ExprName)
+    bases = (
+        project.declarations_names.get(ast.path, None) or get_declaration_names(ast)
+    ).bases
     semantic = Semantic(
         role="class",
         labels=[],
@@ -642,7 +1219,7 @@ def parse_class(ast: AstClass, project: Project) -> Type:
     return Type(
         name=ast.name,
         documentation=format_detailed_docstring(
-            sections=get_docstring_sections(ast),
+            sections=get_docstring_sections(ast, project=project),
             parent=ast,
             project=project,
         ),
@@ -737,7 +1314,7 @@ def parse_returns(
                 ),
             )
         except RuntimeError as e:
-            DocReporter.add_error(
+            project.reporter.add_error(
                 ast.canonical_path,
                 f"Failed to parse return of function {ast.name}: {e}",
             )
@@ -793,7 +1370,7 @@ def parse_raises(
                 ),
             )
         except RuntimeError as error:
-            DocReporter.add_error(
+            project.reporter.add_error(
                 ast.canonical_path,
                 f"Failed to parse 'raises' of function {ast.name}: {error}",
             )
@@ -802,22 +1379,43 @@ def parse_raises(
 
 
 def get_docstring_sections(
-    ast: AstClass | AstFunction | AstAttribute | AstModule,
+    ast: AstClass | AstFunction | AstAttribute | AstModule, project: Project
 ) -> list[DocstringSection]:
+    """
+    Parse the docstring of an entity using the google style.
+
+    Parsed docstrings are memoized in :attr:`mkapi_python.py_griffe.Project.docstring_cache`, keyed by text, kind
+    and scope of the entity (see :glob:`mkapi_python.docstring_cache.SectionsKey`): repeated docstrings
+    (e.g. boilerplate) are parsed once.
+    The values retrieved from the entity's signature (e.g. the parameters' annotation & default) are then those of
+    the first entity parsed; they are not used by the generator.
+
+    Parameters:
+        ast: The entity.
+        project: Project description.
+
+    Returns:
+        The sections.
+    """
     if not ast.docstring and not (
         isinstance(ast, AstModule) and ast_file_path(ast).parts[-1] != "__init__.py"
     ):
         # This should not normally happen because only symbols with docstring are reported.
         # Except for files for which it is tolerated.
-        DocReporter.add_no_docstring(get_symbol_path(ast))
+        project.reporter.add_no_docstring(get_symbol_path(ast))
 
     docstring_text = ast.docstring.value if ast.docstring else ""
-
-    docstring = AstDocstring(
-        docstring_text,
-        parent=ast,
-    )
-    return docstring.parse("google")
+    scope = ast.parent.path if isinstance(ast.parent, AstObject) else ""
+    key = (docstring_text, ast.kind.value, scope, "google")
+    sections = project.docstring_cache.get_sections(key)
+    if sections is None:
+        docstring = AstDocstring(
+            docstring_text,
+            parent=ast,
+        )
+        sections = docstring.parse("google")
+        project.docstring_cache.sections[key] = sections
+    return sections
 
 
 def get_nav_path(tag: SphinxCrossLinkTag, py_path: str):
@@ -832,27 +1430,115 @@ def get_nav_path(tag: SphinxCrossLinkTag, py_path: str):
     return nav
 
 
+def get_cross_link_candidates(
+    link_type: SphinxCrossLinkTag, short_link: str, project: Project
+) -> list[str]:
+    """
+    Find the symbols that may have been targeted by an unresolved sphinx cross-link (for error reporting).
+
+    Candidates are the symbols ending with the link's path (or with its parent's path for methods and attributes),
+    segments are matched as a whole.
+
+    Parameters:
+        link_type: The sphinx tag of the link.
+        short_link: The python path of the link.
+        project: Project description.
+
+    Returns:
+        The candidates' path.
+    """
+    if project.dependencies is not None:
+        project.dependencies.candidates.add(f"{link_type}:{short_link}")
+    project_prefix = f"{project.root_ast.name}."
+    short_link_sanitized = (
+        short_link.replace(project_prefix, "")
+        if short_link.startswith(project_prefix)
+        else short_link
+    )
+    parent_symbol = ".".join(short_link_sanitized.split(".")[0:-1])
+
+    return (
+        project.symbols_trie.ends_with(short_link_sanitized)
+        if link_type in {"mod", "class", "func", "glob"}
+        else project.symbols_trie.ends_with(parent_symbol)
+    )
+
+
 def replace_links(text: str, parent: str, project: Project) -> str:
+    """
+    Replace the sphinx cross-links of a docstring's text, see :func:`mkapi_python.py_griffe.rewrite_links`.
+
+    The rewrite does not depend on the entity documented: results are memoized in
+    :attr:`mkapi_python.py_griffe.Project.docstring_cache` for identical texts within the same scope (the module or
+    class including the entity), e.g. the boilerplate of sibling methods. When retrieved from the cache, the lookups in
+    the symbol tables are recorded in :attr:`mkapi_python.py_griffe.Project.dependencies` and the errors are reported
+    against `parent` as when computed.
+
+    Parameters:
+        text: The text.
+        parent: Path of the entity documented, for error reporting.
+        project: Project description.
 
-    def extract_code_blocks(md_text: str) -> tuple[str, dict[str, str]]:
-        placeholders: dict[str, str] = {}
+    Returns:
+        The text with the cross-links replaced.
+    """
+    if ":`" not in text:
+        # Most texts do not include cross-links.
+        return text
+
+    scope = parent.rpartition(".")[0]
+    rewrite = project.docstring_cache.get_links(text, scope)
+    if rewrite is None:
+        reporter = LinksReporter()
+        dependencies = empty_dependencies()
+        rewritten = rewrite_links(
+            text=text,
+            parent=parent,
+            project=project._replace(reporter=reporter, dependencies=dependencies),
+        )
+        report = reporter.dump()
+        rewrite = LinksRewrite(
+            text=rewritten,
+            report=report if any(report.values()) else None,
+            tags_unknown=reporter.tags_unknown,
+            links_unresolved=reporter.links_unresolved,
+            dependencies=dependencies,
+        )
+        project.docstring_cache.links[(text, scope)] = rewrite
+
+    if project.dependencies is not None:
+        project.dependencies.symbols.update(rewrite.dependencies.symbols)
+        project.dependencies.aliases.update(rewrite.dependencies.aliases)
+        project.dependencies.names.update(rewrite.dependencies.names)
+        project.dependencies.cross_links.update(rewrite.dependencies.cross_links)
+        project.dependencies.candidates.update(rewrite.dependencies.candidates)
+    if rewrite.report is not None:
+        project.reporter.load(rewrite.report)
+    for tag in rewrite.tags_unknown:
+        project.reporter.add_sphinx_tag_unknown(parent, tag)
+    for link, candidates in rewrite.links_unresolved:
+        project.reporter.add_sphinx_link_unresolved(parent, link, candidates)
+    return rewrite.text
+
+
+def rewrite_links(text: str, parent: str, project: Project) -> str:
+    """
+    Replace the sphinx cross-links of a docstring's text, see :glob:`mkapi_python.py_griffe.CROSS_LINK_PATTERN`.
 
-        def replacer(match):
-            code_content = match.group(0)
-            placeholder = f"md_placeholder_{len(placeholders)}"
-            placeholders[placeholder] = code_content
-            return placeholder
+    The text is scanned once: the cross-links of the segments between fenced code blocks are rewritten, the code
+    blocks are copied as is.
 
-        # Match both inline block code (```code```) code
-        md_text = re.sub(r"```.*?```", replacer, md_text, flags=re.DOTALL)
-        return md_text, placeholders
+    Parameters:
+        text: The text.
+        parent: Path of the entity documented, for error reporting.
+        project: Project description.
 
-    def restore_code_blocks(md_text: str, placeholders: dict[str, str]) -> str:
-        for placeholder, code in placeholders.items():
-            md_text = md_text.replace(placeholder, code)
-        return md_text
+    Returns:
+        The text with the cross-links replaced.
+    """
+    if ":`" not in text:
+        return text
 
-    cross_ref_pattern = r":(\w+):`([^`]+)`"
     project_prefix = f"{project.root_ast.name}."
 
     def sanitize_py_path(py_path: str):
@@ -860,18 +1546,6 @@ def replace_links(text: str, parent: str, project: Project) -> str:
             return py_path.replace(project_prefix, "")
         return py_path
 
-    def get_cross_link_candidates(
-        link_type: SphinxCrossLinkTag, short_link: str, all_symbols: list[str]
-    ):
-        short_link_sanitized = sanitize_py_path(short_link)
-        parent_symbol = ".".join(short_link_sanitized.split(".")[0:-1])
-
-        return (
-            [s for s in all_symbols if s.endswith(short_link_sanitized)]
-            if link_type in {"mod", "class", "func", "glob"}
-            else [s for s in all_symbols if s.endswith(parent_symbol)]
-        )
-
     def replace_function(match: re.Match[str]):
         tag = match.group(1)  # Capture the tag (e.g., func, class, etc.)
         # Capture the value between the backticks
@@ -881,21 +1555,20 @@ def replace_links(text: str, parent: str, project: Project) -> str:
         label = py_path.split(".")[-1]
 
         if tag not in SUPPORTED_CROSS_LINK_TAGS:
-            DocReporter.add_sphinx_tag_unknown(parent, tag)
+            project.reporter.add_sphinx_tag_unknown(parent, tag)
             return label
 
-        pattern = r"<([^>]+)>"
-        matches = re.findall(pattern, py_path)
-        if matches:
+        label_match = CROSS_LINK_LABEL_PATTERN.search(py_path)
+        if label_match:
             index_start = py_path.find("<")
             label = py_path[0:index_start]
-            py_path = matches[0]
+            py_path = label_match.group(1)
 
         py_path = sanitize_py_path(py_path)
         if tag == "ext":
             return f"<mkapi-ext-link href='{project.config.external_links[py_path]}' >{label}</mkapi-ext-link>"
 
-        if project.all_symbols.get(py_path, None):
+        if lookup_symbol(py_path, project):
             nav_path = get_nav_path(tag=tag, py_path=py_path)
             semantic = TAGS_TO_SEMANTIC[tag].replace("mkapi-role-", "")
             return f"<mkapi-api-link nav='@nav[{project.root_ast.name}]/{nav_path}' semantic='{semantic}'>{label}</mkapi-api-link>"
@@ -906,22 +1579,32 @@ def replace_links(text: str, parent: str, project: Project) -> str:
                 package_name=package_name, py_path=py_path, project=project
             )
             if not nav:
-                DocReporter.add_sphinx_link_unresolved(parent, match.group(0), [])
+                project.reporter.add_sphinx_link_unresolved(parent, match.group(0), [])
                 return label
             return f"<mkapi-ext-link href='{nav}' >{label}</mkapi-ext-link>"
 
         candidates = get_cross_link_candidates(
-            link_type=tag,
+            link_type=cast(SphinxCrossLinkTag, tag),
             short_link=py_path,
-            all_symbols=list(project.all_symbols.keys()),
+            project=project,
         )
 
-        DocReporter.add_sphinx_link_unresolved(parent, match.group(0), candidates)
+        project.reporter.add_sphinx_link_unresolved(parent, match.group(0), candidates)
         return label
 
-    no_code, code_dict = extract_code_blocks(text)
-    processed = re.sub(cross_ref_pattern, replace_function, no_code)
-    return restore_code_blocks(processed, code_dict)
+    if "```" not in text:
+        return CROSS_LINK_PATTERN.sub(replace_function, text)
+
+    parts: list[str] = []
+    position = 0
+    for block in CODE_BLOCK_PATTERN.finditer(text):
+        parts.append(
+            CROSS_LINK_PATTERN.sub(replace_function, text[position : block.start()])
+        )
+        parts.append(block.group(0))
+        position = block.end()
+    parts.append(CROSS_LINK_PATTERN.sub(replace_function, text[position:]))
+    return "".join(parts)
 
 
 def format_detailed_docstring(
@@ -985,7 +1668,7 @@ def parse_attribute(
     Returns:
         The parsed model.
     """
-    sections = get_docstring_sections(ast)
+    sections = get_docstring_sections(ast, project=project)
     documentation = format_detailed_docstring(
         sections=sections, parent=ast, project=project
     )
@@ -1068,11 +1751,11 @@ def parse_code(ast: AstClass | AstFunction | AstAttribute, project: Project) ->
                 return nav
 
         # Let's try if a unique symbol with given name exists
-        keys = [v for k, v in project.all_symbols.items() if k.endswith(f".{e.name}")]
+        keys = find_symbols_by_name(e.name, project)
         if len(keys) == 1:
             return keys[0].navigation_path
 
-        DocReporter.add_internal_cross_ref_error(e.canonical_path)
+        project.reporter.add_internal_cross_ref_error(e.canonical_path)
 
         return None
 
@@ -1080,127 +1763,156 @@ def parse_code(ast: AstClass | AstFunction | AstAttribute, project: Project) ->
     file_path = str(ast_file_path(ast).relative_to(root_path.parent))
     references = {}
     implementation = None
+    implementation_asset = None
     declaration = ""
+    names = project.declarations_names.get(ast.path, None) or get_declaration_names(ast)
     if isinstance(ast, AstAttribute):
-        types_annotation: list[ExprName] = find_attributes_of_type(
-            ast.annotation, ExprName
-        )
-        types_value: list[ExprName] = find_attributes_of_type(ast.value, ExprName)
-        declaration = functools.reduce(lambda acc, e: f"{acc}\n{e}", ast.lines)
+        declaration = "\n".join(ast.lines)
         implementation = None
-        references = {e.name: nav_path(e=e) for e in [*types_annotation, *types_value]}
+        references = {e.name: nav_path(e=e) for e in names.references}
 
     if isinstance(ast, AstFunction):
-        types_annotation = find_attributes_of_type(ast.annotation, ExprName)
-        returns_annotation: list[ExprName] = find_attributes_of_type(
-            ast.returns, ExprName
-        )
-        parameters_annotation: list[ExprName] = find_attributes_of_type(
-            ast.parameters, ExprName
-        )
-        all_annotations = [
-            *types_annotation,
-            *returns_annotation,
-            *parameters_annotation,
-        ]
-        implementation = functools.reduce(lambda acc, e: f"{acc}\n{e}", ast.lines)
+        implementation = "\n".join(ast.lines)
         declaration = extract_function_declaration(implementation)
         references = {
-            **{e.name: nav_path(e=e) for e in all_annotations},
+            **{e.name: nav_path(e=e) for e in names.references},
             ast.name: nav_path(e=ast),
         }
 
     if isinstance(ast, AstClass):
-        decorators_annotation: list[ExprName] = find_attributes_of_type(
-            ast.decorators, ExprName
-        )
-        bases_annotation: list[ExprName] = find_attributes_of_type(ast.bases, ExprName)
-        all_annotations = [
-            *decorators_annotation,
-            *bases_annotation,
-        ]
-        implementation = functools.reduce(lambda acc, e: f"{acc}\n{e}", ast.lines)
+        implementation = "\n".join(ast.lines)
         declaration = extract_class_declaration(implementation)
         references = {
-            **{e.name: nav_path(e=e) for e in all_annotations},
+            **{e.name: nav_path(e=e) for e in names.references},
             ast.name: nav_path(e=ast),
         }
 
+    if implementation and project.source_assets and ast.lineno and ast.endlineno:
+        implementation_asset = project.source_assets.get(
+            path=ast_file_path(ast), lines=ast.lines_collection[ast_file_path(ast)]
+        )
+        implementation = None
+
     return Code(
         filePath=file_path,
         startLine=ast.lineno or -1,
         endLine=ast.endlineno or -1,
         declaration=declaration,
         implementation=implementation,
+        implementationAsset=implementation_asset,
         references={k: v for k, v in references.items() if v},
     )
 
 
-T = TypeVar("T")  #
+class DeclarationNames(NamedTuple):
+    """
+    Names referenced in the declaration of an entity, see :func:`mkapi_python.py_griffe.get_declaration_names`.
+    """
 
+    references: list[ExprName]
+    """
+    Names referenced in the declaration: annotation and value of attributes, returns and parameters of functions,
+    decorators and bases of classes.
+    """
+    bases: list[ExprName]
+    """
+    Names referenced in the bases of a class (empty for attributes and functions).
+    """
 
-def find_attributes_of_type(ast: Any, target_type: type[T]) -> list[T]:
-    results: list[Any] = []
-    primitive_types = (int, float, str, bool, bytes, complex)
-    visited: list[Any] = []
 
-    def get_attr_val(obj: Any, attr_name: str) -> Any | None:
-        attr_value = getattr(obj, attr_name, None)
-        invalid = any(
-            [
-                attr_name.startswith("__"),
-                attr_name in ["parent"],
-                not attr_value,
-                isinstance(attr_value, primitive_types),
-                isinstance(attr_value, AstModule),
-            ]
+def get_declaration_names(
+    ast: AstClass | AstFunction | AstAttribute,
+) -> DeclarationNames:
+    """
+    Find the names referenced in the declaration of an entity.
+
+    Parameters:
+        ast: Griffe's class, function or attribute documentation.
+
+    Returns:
+        The names referenced (none for aliases).
+    """
+    if isinstance(ast, AstAttribute):
+        return DeclarationNames(
+            references=find_names([ast.annotation, ast.value]), bases=[]
         )
-        return not invalid and attr_value
+    if isinstance(ast, AstFunction):
+        return DeclarationNames(
+            references=find_names([ast.returns, ast.parameters]), bases=[]
+        )
+    if isinstance(ast, AstClass):
+        return DeclarationNames(
+            references=find_names([ast.decorators, ast.bases]),
+            bases=find_names(ast.bases),
+        )
+    return DeclarationNames(references=[], bases=[])
 
-    def parse_obj(obj: Any):
-        if obj in visited:
-            return
-        visited.append(obj)
-        attributes = [
-            get_attr_val(obj, attr_name)
-            for attr_name in dir(obj)
-            if get_attr_val(obj, attr_name) and attr_name != "parent"
-        ]
-        for attr_value in attributes:
-            if isinstance(attr_value, target_type):
-                results.append(attr_value)
-                continue
-            recursive_search(attr_value)
 
-    def recursive_search(current: Any):
+def documented_entities(
+    elements: ModuleElements,
+) -> list[AstClass | AstFunction | AstAttribute]:
+    """
+    List the documented entities of a module: classes (followed by their documented attributes & methods),
+    functions and attributes.
 
-        if isinstance(current, target_type):
-            results.append(current)
+    Parameters:
+        elements: The elements of the module, see :class:`mkapi_python.py_griffe.ModuleElements`.
+
+    Returns:
+        The entities.
+    """
+    entities: list[AstClass | AstFunction | AstAttribute] = []
+    for c in elements.classes:
+        entities.append(c)
+        entities.extend(
+            a
+            for a in c.attributes.values()
+            if not isinstance(a, AstAlias) and a.docstring and not a.inherited
+        )
+        entities.extend(
+            f
+            for f in c.functions.values()
+            if not isinstance(f, AstAlias) and f.docstring
+        )
+    entities.extend(elements.functions)
+    entities.extend(elements.attributes)
+    return entities
 
-        if isinstance(current, list):
-            _ = [recursive_search(item) for item in cast(list[Any], current)]
-        elif hasattr(current, "__dict__"):
-            parse_obj(current)
 
-    recursive_search(ast)
-    return results
+def init_declarations_names(
+    modules: list[AstModule],
+    modules_elements: dict[str, ModuleElements] | None = None,
+) -> dict[str, DeclarationNames]:
+    """
+    Find in a single pass the names referenced in the declarations of the documented entities of some modules.
 
+    Parameters:
+        modules: The modules.
+        modules_elements: Precomputed elements of the modules, see
+            :func:`mkapi_python.py_griffe.init_modules_elements`.
 
-class DataclassJSONEncoder(json.JSONEncoder):
-    def default(self, o: Any) -> Any:
-        if hasattr(o, "__dict__"):
-            return dataclasses.asdict(o)
-        if isinstance(o, (list, tuple)):
-            return [self.default(item) for item in cast(list[Any], o)]
-        return json.JSONEncoder.default(self, o)
+    Returns:
+        A dictionary `entity's path` => :class:`mkapi_python.py_griffe.DeclarationNames`.
+    """
+    return {
+        e.path: get_declaration_names(e)
+        for module in modules
+        for e in documented_entities(
+            get_module_elements(ast=module, modules_elements=modules_elements)
+        )
+    }
 
 
-def init_symbols(root_ast: AstModule) -> dict[str, SymbolRef]:
+def init_symbols(
+    root_ast: AstModule, modules_elements: dict[str, ModuleElements] | None = None
+) -> dict[str, SymbolRef]:
     """
     Recursive look up for all the symbols within the provided AST.
 
     Parameters:
         root_ast: Root module's AST.
+        modules_elements: Precomputed elements of the modules, see
+            :func:`mkapi_python.py_griffe.init_modules_elements`.
 
     Returns:
         A dictionary `canonical path` => :class:`mkapi_python.py_griffe.SymbolRef`.
@@ -1243,7 +1955,7 @@ def init_symbols(root_ast: AstModule) -> dict[str, SymbolRef]:
         if depth > max_depth:
             raise RecursionError("Maximum recursion depth reached")
 
-        elements = extract_module(ast=ast)
+        elements = get_module_elements(ast=ast, modules_elements=modules_elements)
         functions = {
             get_canonical_path(f.canonical_path): get_symbol(f, from_class=False)
             for f in elements.functions
@@ -1287,9 +1999,93 @@ def init_symbols(root_ast: AstModule) -> dict[str, SymbolRef]:
     return init_symbols_rec(ast=root_ast)
 
 
+def init_symbols_by_name(
+    all_symbols: dict[str, SymbolRef],
+) -> dict[str, list[SymbolRef]]:
+    """
+    Index the symbols by name (last segment of their path), the root module is not included.
+
+    Parameters:
+        all_symbols: The symbols, as returned by :func:`mkapi_python.py_griffe.init_symbols`.
+
+    Returns:
+        A dictionary `name` => list of :class:`mkapi_python.py_griffe.SymbolRef` (in the order of `all_symbols`).
+    """
+    symbols_by_name: dict[str, list[SymbolRef]] = defaultdict(list)
+    for path, symbol in all_symbols.items():
+        parent, _, name = path.rpartition(".")
+        if parent:
+            symbols_by_name[name].append(symbol)
+    return dict(symbols_by_name)
+
+
+class AliasesMembers(NamedTuple):
+    """
+    Members of a module involved in the resolution of aliases, see
+    :func:`mkapi_python.py_griffe.get_aliases_members`.
+    """
+
+    modules: list[AstModule]
+    """
+    The sub-modules.
+    """
+    entries: list[tuple[str, str]]
+    """
+    The entities defined (classes, functions, attributes) followed by the aliases (except wildcard imports),
+    as tuples `(name, resolved canonical path)`.
+    """
+    wildcards: list[AstAlias]
+    """
+    The wildcard imports.
+    """
+
+
+def get_aliases_members(ast: AstObject | AstAlias) -> AliasesMembers:
+    """
+    Collect the members of a module involved in the resolution of aliases.
+
+    Members that can not be resolved are skipped, the canonical path of each member is resolved only once.
+
+    Parameters:
+        ast: The module, or a wildcard import targeting it.
+
+    Returns:
+        The members.
+    """
+    modules: list[AstModule] = []
+    entities: list[tuple[str, str]] = []
+    aliases: list[tuple[str, str]] = []
+    wildcards: list[AstAlias] = []
+    for member in ast.all_members.values():
+        try:
+            canonical = member.canonical_path
+        except AliasResolutionError:
+            continue
+        if isinstance(member, AstModule):
+            modules.append(member)
+        elif not isinstance(member, AstAlias):
+            entities.append((member.name, canonical))
+        elif member.name.endswith("/*"):
+            wildcards.append(member)
+        else:
+            aliases.append((member.name, canonical))
+    return AliasesMembers(
+        modules=modules, entries=[*entities, *aliases], wildcards=wildcards
+    )
+
+
 def init_aliases(root_ast: AstModule) -> dict[str, str]:
     """
-    Recursive look up for all the aliases within the provided AST.
+    Look up all the aliases within the provided AST.
+
+    Modules are traversed from the root module along their sub-modules (each visited once), and along the
+    wildcard imports: the names re-exported by a wildcard import are also aliased in the modules importing it
+    (possibly through a chain of wildcard imports).
+
+    The graph of wildcard imports is resolved with memoization: the entries exported by a module imported using a
+    wildcard are collected the first time it is traversed, they are then replayed for the other modules importing
+    it. Each member's canonical path is resolved once per traversal, see
+    :func:`mkapi_python.py_griffe.get_aliases_members`.
 
     Parameters:
         root_ast: Root module's AST.
@@ -1299,138 +2095,912 @@ def init_aliases(root_ast: AstModule) -> dict[str, str]:
     """
 
     aliases: dict[str, str] = {}
-    modules_seen: list[str] = []
+    modules_seen: set[str] = set()
+    # For each module imported using a wildcard, the entries `(name, resolved path, owner, chain)` it exports:
+    # an entry is aliased in its owner module, in the modules importing the wildcard (`parents_wild_card`),
+    # then in the chain of wildcard imports between the module and the owner.
+    exports: dict[str, list[tuple[str, str, str, tuple[str, ...]]]] = {}
+    in_progress: set[str] = set()
+
+    def add_import(
+        name: str,
+        target: str,
+        owner: str,
+        parents: Sequence[str],
+        chain: Sequence[str] = (),
+    ):
+        aliases[f"{owner}.{name}"] = target
+        for parent in parents:
+            aliases[f"{parent}.{name}"] = target
+        for parent in chain:
+            aliases[f"{parent}.{name}"] = target
+
+    def process_module(ast: AstModule | AstAlias, parents_wild_card: list[str]):
+        path = ast.canonical_path
+        # The members of a wildcard import are aliases of the target module's members: they do not depend on the
+        # modules seen so far, and their exports can be memoized.
+        wild_card = isinstance(ast, AstAlias)
+        if wild_card and path in exports:
+            for name, target, owner, chain in exports[path]:
+                add_import(name, target, owner, parents_wild_card, chain)
+            return
+        if wild_card and path in in_progress:
+            # Cycle of wildcard imports.
+            return
+        if wild_card:
+            in_progress.add(path)
+        members = get_aliases_members(ast=ast)
+        modules = [m for m in members.modules if m.canonical_path not in modules_seen]
+        for module in modules:
+            modules_seen.add(module.canonical_path)
+            add_import(module.name, module.canonical_path, path, parents_wild_card)
+            process_module(module, parents_wild_card)
+
+        exported: list[tuple[str, str, str, tuple[str, ...]]] = []
+        for name, target in members.entries:
+            add_import(name, target, path, parents_wild_card)
+            exported.append((name, target, path, ()))
+        for member in members.wildcards:
+            process_module(member, [*parents_wild_card, path])
+            exported.extend(
+                (name, target, owner, (path, *chain))
+                for name, target, owner, chain in exports.get(member.canonical_path, [])
+            )
+        if wild_card:
+            in_progress.discard(path)
+            exports[path] = exported
 
-    def is_leaf(ast: AstObject | AstAlias):
-        return any(isinstance(ast, C) for C in (AstAttribute, AstClass, AstFunction))
+    process_module(root_ast, [])
+    return aliases
 
-    def process_entity(
-        ast: AstObject | AstAlias,
-        parent_module: str,
-        parents_wild_card: list[str],
-    ):
 
-        def add_import(
-            entity: AstObject | AstAlias,
-        ):
-            aliases[f"{parent_module}.{entity.name}"] = entity.canonical_path
-            for parent_wild_card in parents_wild_card:
-                aliases[f"{parent_wild_card}.{entity.name}"] = entity.canonical_path
+def generator_hash(config: Configuration) -> str:
+    """
+    Hash the generator's sources along with the configuration's elements impacting the outputs.
 
-        if is_leaf(ast):
-            add_import(ast)
-            return
+    Parameters:
+        config: Configuration.
 
-        def is_in_lib(m: AstObject | AstAlias):
-            try:
-                m.canonical_path.startswith(root_ast.name)
-                return True
-            except AliasResolutionError:
-                return False
-
-        lib_members = [m for m in ast.all_members.values() if is_in_lib(m)]
-
-        modules = [
-            m
-            for m in lib_members
-            if isinstance(m, AstModule) and m.canonical_path not in modules_seen
-        ]
-        for m in modules:
-            modules_seen.append(m.canonical_path)
-            add_import(m)
-            process_entity(m, m.canonical_path, parents_wild_card)
-
-        direct_imports = [
-            m
-            for m in lib_members
-            if not isinstance(m, AstAlias) and not isinstance(m, AstModule)
-        ]
-        for direct_import in direct_imports:
-            process_entity(direct_import, ast.canonical_path, parents_wild_card)
-
-        direct_aliases: list[AstAlias] = [
-            m
-            for m in lib_members
-            if isinstance(m, AstAlias) and not m.name.endswith("/*")
-        ]
-        for direct_alias in direct_aliases:
-            add_import(direct_alias)
-
-        wild_cards_aliases: list[AstAlias] = [
-            m for m in lib_members if isinstance(m, AstAlias) and m.name.endswith("/*")
-        ]
-        for wild_card_alias in wild_cards_aliases:
-            process_entity(
-                wild_card_alias,
-                wild_card_alias.canonical_path,
-                [*parents_wild_card, ast.canonical_path],
-            )
+    Returns:
+        The hash.
+    """
+    configuration = {
+        "externalLinks": config.external_links,
+        "crossLinkedPackages": config.cross_linked_packages,
+        "compact": config.compact,
+        "sourceAssets": config.source_assets,
+        "crossLinkedIndexes": {
+            k: str(v) for k, v in config.cross_linked_indexes.items()
+        },
+        "extraModules": {
+            k: [dataclasses.asdict(m) for m in v]
+            for k, v in config.extra_modules.items()
+        },
+    }
+    return hash_files(
+        paths=sorted(Path(__file__).parent.glob("*.py")),
+        extra=[importlib.metadata.version("griffe"), hash_json(configuration)],
+    )
 
-    process_entity(root_ast, root_ast.name, [])
-    return aliases
 
+def module_source_files(ast: AstModule, elements: ModuleElements) -> list[Path]:
+    """
+    List the source files read to generate a module.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        elements: The module's elements, as returned by `extract_module`.
 
-def generate_api(root_ast: AstModule, config: Configuration):
+    Returns:
+        The files, without duplicates.
     """
-    Create documentation API files from an AST parsed by the griffe library:
-    * It generates the list of exported symbols (those documented).
-      See :func:`mkapi_python.py_griffe.init_symbols`.
-    * It generates the list of all aliases from the `__init__.py` files, and from the `import` statements in the files.
-      See :func:`mkapi_python.py_griffe.init_aliases`.
-    * It generates the documentation recursively for all exported modules (those documented).
+    # The children's modules are included as they determine the `isLeaf` attribute of the children.
+    grand_children = [
+        g
+        for m in elements.modules
+        for g in m.modules.values()
+        if not isinstance(g, AstAlias)
+        and isinstance(g.filepath, PosixPath)
+        and g.filepath.name == INIT_FILENAME
+    ]
+    files = [ast_file_path(m) for m in (ast, *elements.files, *grand_children)]
+    return list(dict.fromkeys(files))
+
+
+def module_sources_hash(ast: AstModule, elements: ModuleElements) -> str:
+    """
+    Hash the inputs of a module's generation that are read from the AST: source files and docstrings.
+
+    Parameters:
+        ast: Griffe's module documentation.
+        elements: The module's elements, as returned by `extract_module`.
+
+    Returns:
+        The hash.
+    """
+    docstrings = [
+        e.docstring.value
+        for e in (ast, *elements.classes, *elements.functions, *elements.attributes)
+        if e.docstring
+    ]
+    return hash_files(paths=module_source_files(ast, elements), extra=docstrings)
+
+
+def resolve_dependency(kind: DependencyKind, key: str, project: Project) -> Any:
+    """
+    Resolve a lookup recorded while generating a module.
+
+    Parameters:
+        kind: The kind of lookup.
+        key: The key looked up.
+        project: Project description, it should not record dependencies itself.
+
+    Returns:
+        The resolution, JSON serializable.
+    """
+    if kind == "symbols":
+        return project.all_symbols.get(key, None)
+    if kind == "aliases":
+        return project.all_aliases.get(key, None)
+    if kind == "names":
+        return find_symbols_by_name(key, project)
+    if kind == "candidates":
+        return get_cross_link_candidates(
+            link_type=cast(SphinxCrossLinkTag, key.split(":")[0]),
+            short_link=key.split(":", 1)[1],
+            project=project,
+        )
+    return get_cross_link_package_nav(
+        package_name=key.split(".")[0], py_path=key, project=project
+    )
+
+
+def resolve_dependencies(dependencies: ModuleDependencies, project: Project) -> str:
+    """
+    Hash the resolution of the lookups recorded while generating a module.
+
+    Parameters:
+        dependencies: The recorded lookups.
+        project: Project description, it should not record dependencies itself.
+
+    Returns:
+        The hash.
+    """
+    resolutions: dict[str, list[Any]] = {
+        kind: [] for kind in ("symbols", "aliases", "names", "candidates", "crossLinks")
+    }
+    for kind, key in dependencies.lookups():
+        resolutions[kind].append([key, resolve_dependency(kind, key, project)])
+    return hash_json(resolutions)
+
+
+def iter_modules(
+    root_ast: AstModule, modules_elements: dict[str, ModuleElements] | None = None
+) -> Iterator[tuple[str, AstModule]]:
+    """
+    Iterate over the modules for which an API file is generated, in depth-first order.
+
+    Parameters:
+        root_ast: Root module's AST.
+        modules_elements: Precomputed elements of the modules, see
+            :func:`mkapi_python.py_griffe.init_modules_elements`.
+
+    Returns:
+        The tuples `(module path, module AST)`.
+    """
+    stack = [(root_ast.name, root_ast)]
+    while stack:
+        path, ast = stack.pop()
+        yield path, ast
+        children = get_module_elements(
+            ast=ast, modules_elements=modules_elements
+        ).modules
+        stack.extend((f"{path}.{child.name}", child) for child in reversed(children))
+
+
+def list_modules(
+    root_ast: AstModule, modules_elements: dict[str, ModuleElements] | None = None
+) -> list[tuple[str, AstModule]]:
+    """
+    List the modules for which an API file is generated, in depth-first order.
 
     Parameters:
         root_ast: Root module's AST.
+        modules_elements: Precomputed elements of the modules, see
+            :func:`mkapi_python.py_griffe.init_modules_elements`.
+
+    Returns:
+        The list of tuples `(module path, module AST)`.
+    """
+    return list(iter_modules(root_ast=root_ast, modules_elements=modules_elements))
+
+
+class ModuleGeneration(NamedTuple):
+    """
+    Result of the generation of a module's API file.
+    """
+
+    path: str
+    """
+    Path of the module.
+    """
+    entry: ManifestEntry | None
+    """
+    Entry of the module in the incremental manifest (if incremental generation is enabled).
+    """
+    report: dict[str, Any]
+    """
+    Errors reported while generating the module, see `DocReporter.dump`.
+    """
+    stats: ModuleStats
+    """
+    Statistics of the generation.
+    """
+
+
+def skipped_module_generation(
+    path: str, sources: str, project: Project, manifest: IncrementalManifest
+) -> ModuleGeneration | None:
+    """
+    Check whether the generation of a module can be skipped in an incremental generation: its API file exists,
+    and neither its sources nor the resolutions of its dependencies changed since the previous generation.
+
+    Parameters:
+        path: Path of the module.
+        sources: Hash of the module's sources, see :func:`mkapi_python.py_griffe.module_sources_hash`.
+        project: Project description.
+        manifest: Manifest of the previous generation.
+
+    Returns:
+        The skipped generation (reusing the previous entry), `None` if the module is to be generated.
+    """
+    entry = manifest.modules.get(path, None)
+    if (
+        entry
+        and Path(project.config.out, *path.split(".")).with_suffix(".json").exists()
+        and entry.sources == sources
+        and entry.resolutions
+        == resolve_dependencies(dependencies=entry.dependencies, project=project)
+    ):
+        return ModuleGeneration(
+            path=path,
+            entry=entry,
+            report=entry.report,
+            stats=ModuleStats(
+                path=path,
+                skipped=True,
+                parse_duration=0,
+                write_duration=0,
+                entities={},
+                navigation_hits=0,
+                navigation_misses=0,
+            ),
+        )
+    return None
+
+
+def parse_module_generation(
+    module: AstModule,
+    path: str,
+    project: Project,
+    manifest: IncrementalManifest | None,
+) -> tuple[ModuleGeneration, Module | None]:
+    """
+    Parse the documentation of a module, without writing its API file.
+
+    Errors are reported in a reporter dedicated to the module (not in
+    :attr:`mkapi_python.py_griffe.Project.reporter`), they are included in the returned value.
+
+    Parameters:
+        module: Griffe's module documentation.
+        path: Path of the module.
+        project: Project description.
+        manifest: Manifest of the previous generation, if incremental generation is enabled.
+
+    Returns:
+        The generation's result, and the module's documentation (`None` if the generation has been skipped).
+    """
+    sources = ""
+    if manifest is not None:
+        sources = module_sources_hash(
+            ast=module,
+            elements=get_module_elements(
+                ast=module, modules_elements=project.modules_elements
+            ),
+        )
+        skipped = skipped_module_generation(
+            path=path, sources=sources, project=project, manifest=manifest
+        )
+        if skipped:
+            return skipped, None
+
+    dependencies = empty_dependencies() if manifest is not None else None
+    entities_durations: dict[str, float] = {}
+    hits, misses = project.navigation_cache.hits, project.navigation_cache.misses
+    start = time.perf_counter()
+    reporter = DocReporter()
+    doc = parse_module(
+        module,
+        project=project._replace(
+            dependencies=dependencies,
+            entities_durations=entities_durations,
+            reporter=reporter,
+        ),
+    )
+    report = reporter.dump()
+    stats = ModuleStats(
+        path=path,
+        skipped=False,
+        parse_duration=time.perf_counter() - start,
+        write_duration=0,
+        entities=entities_durations,
+        navigation_hits=project.navigation_cache.hits - hits,
+        navigation_misses=project.navigation_cache.misses - misses,
+    )
+    return (
+        ModuleGeneration(
+            path=path,
+            entry=(
+                ManifestEntry(
+                    sources=sources,
+                    dependencies=dependencies,
+                    resolutions=resolve_dependencies(
+                        dependencies=dependencies, project=project
+                    ),
+                    report=report,
+                )
+                if dependencies is not None
+                else None
+            ),
+            report=report,
+            stats=stats,
+        ),
+        doc,
+    )
+
+
+def iter_project_api(
+    project: Project,
+    manifest: IncrementalManifest | None = None,
+    modules: Iterable[tuple[str, AstModule]] | None = None,
+) -> Iterator[tuple[ModuleGeneration, Module | None]]:
+    """
+    Parse the documentation of a project's modules one at a time, see
+    :func:`mkapi_python.py_griffe.parse_module_generation`.
+
+    This is the iterator consumed by both :func:`mkapi_python.py_griffe.iter_api` and
+    :func:`mkapi_python.py_griffe.generate_api`: the documentation of a module is not retained once yielded.
+
+    Parameters:
+        project: Project description.
+        manifest: Manifest of the previous generation, if incremental generation is enabled.
+        modules: The modules, as tuples `(module path, module AST)`. If not provided, the documented modules of the
+            project in depth-first order.
+
+    Returns:
+        The generations' result along with the modules' documentation, in the order of the modules.
+    """
+    if modules is None:
+        modules = iter_modules(
+            root_ast=project.root_ast, modules_elements=project.modules_elements
+        )
+    for path, module in modules:
+        yield parse_module_generation(
+            module=module, path=path, project=project, manifest=manifest
+        )
+
+
+def write_module(
+    generation: ModuleGeneration, doc: Module, config: Configuration
+) -> ModuleGeneration:
+    """
+    Write the API file of a module.
+
+    Parameters:
+        generation: The generation's result, see :func:`mkapi_python.py_griffe.parse_module_generation`.
+        doc: The module's documentation.
+        config: Configuration.
+
+    Returns:
+        The generation's result, including the write's duration.
+    """
+    start = time.perf_counter()
+    target_path = Path(config.out, *generation.path.split(".")).with_suffix(".json")
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(target_path, "w", encoding="UTF8") as json_file:
+        dump_model(doc, json_file, indent=None if config.compact else 4)
+    return generation._replace(
+        stats=generation.stats._replace(write_duration=time.perf_counter() - start)
+    )
+
+
+def generate_module(
+    module: AstModule,
+    path: str,
+    project: Project,
+    manifest: IncrementalManifest | None,
+) -> ModuleGeneration:
+    """
+    Generate the API file of a module.
+
+    Errors are reported in a reporter dedicated to the module (not in
+    :attr:`mkapi_python.py_griffe.Project.reporter`), they are included in the returned value.
+
+    Parameters:
+        module: Griffe's module documentation.
+        path: Path of the module.
+        project: Project description.
+        manifest: Manifest of the previous generation, if incremental generation is enabled.
+
+    Returns:
+        The generation's result.
+    """
+    generation, doc = parse_module_generation(
+        module=module, path=path, project=project, manifest=manifest
+    )
+    if doc is None:
+        return generation
+    return write_module(generation=generation, doc=doc, config=project.config)
+
+
+_GENERATION_WORKER_STATE: dict[str, Any] = {}
+"""
+State of a worker process spawned by :func:`mkapi_python.py_griffe.generate_api` (when `jobs > 1`).
+"""
+
+
+def _init_generation_worker(project: Project, manifest: IncrementalManifest | None):
+    _GENERATION_WORKER_STATE["project"] = project
+    _GENERATION_WORKER_STATE["manifest"] = manifest
+
+
+def _generate_module_worker(path: str) -> ModuleGeneration:
+    project: Project = _GENERATION_WORKER_STATE["project"]
+    module: AstModule = functools.reduce(
+        lambda acc, e: acc.modules[e], path.split(".")[1:], project.root_ast
+    )
+    return generate_module(
+        module=module,
+        path=path,
+        project=project,
+        manifest=_GENERATION_WORKER_STATE["manifest"],
+    )
+
+
+def load_cross_linked_packages(config: Configuration) -> dict[str, CrossLinkedPackage]:
+    """
+    Load the symbols of the cross-linked packages, from their index if provided in
+    :attr:`mkapi_python.py_griffe.Configuration.cross_linked_indexes`.
+
+    Parameters:
         config: Configuration.
+
+    Returns:
+        The cross-linked packages, keyed by name.
     """
-    DocReporter.clear()
-    all_symbols = init_symbols(root_ast=root_ast)
-    all_aliases = init_aliases(root_ast=root_ast)
     cross_packages: dict[str, CrossLinkedPackage] = {}
     for key in config.cross_linked_packages:
-        root_package_ast = cast(griffe.Module, griffe.load(key, submodules=True))
+        if key in config.cross_linked_indexes:
+            cross_packages[key] = load_symbol_index(
+                path=config.cross_linked_indexes[key], package=key
+            )
+            continue
+        root_package_ast = (
+            config.ast_cache.load(key, submodules=True)
+            if config.ast_cache
+            else cast(griffe.Module, griffe.load(key, submodules=True))
+        )
         cross_packages[key] = CrossLinkedPackage(
             all_aliases=init_aliases(root_ast=root_package_ast),
             all_symbols=init_symbols(root_ast=root_package_ast),
         )
-    project = Project(
-        config=config,
-        root_ast=root_ast,
-        all_symbols=all_symbols,
-        all_aliases=all_aliases,
-        cross_linked_packages=cross_packages,
+    return cross_packages
+
+
+def init_project(
+    root_ast: AstModule,
+    config: Configuration,
+    stats: GenerationStats,
+    cross_packages: dict[str, CrossLinkedPackage] | None = None,
+    reporter: DocReporter | None = None,
+) -> Project:
+    """
+    Create the project description: the elements of the documented modules, the symbols tables and the
+    cross-linked packages.
+
+    Parameters:
+        root_ast: Root module's AST.
+        config: Configuration.
+        stats: Statistics in which the phases are recorded.
+        cross_packages: Cross-linked packages already loaded, see
+            :func:`mkapi_python.py_griffe.load_cross_linked_packages`. Loaded if not provided.
+        reporter: Reporter collecting the documentation errors of the run. A new instance is created if not
+            provided.
+
+    Returns:
+        The project.
+    """
+    with stats.phase("modules elements"):
+        modules_elements = init_modules_elements(root_ast=root_ast)
+    with stats.phase("init_symbols"):
+        all_symbols = init_symbols(root_ast=root_ast, modules_elements=modules_elements)
+    with stats.phase("init_aliases"):
+        all_aliases = init_aliases(root_ast=root_ast)
+    if cross_packages is None:
+        with stats.phase("cross-linked packages"):
+            cross_packages = load_cross_linked_packages(config=config)
+    with stats.phase("project tables"):
+        modules = list_modules(root_ast=root_ast, modules_elements=modules_elements)
+        return Project(
+            config=config,
+            root_ast=root_ast,
+            all_symbols=all_symbols,
+            all_aliases=all_aliases,
+            cross_linked_packages=cross_packages,
+            symbols_by_name=init_symbols_by_name(all_symbols=all_symbols),
+            symbols_trie=SuffixTrie(paths=all_symbols.keys()),
+            declarations_names=init_declarations_names(
+                modules=[module for _, module in modules],
+                modules_elements=modules_elements,
+            ),
+            modules_elements=modules_elements,
+            leaf_modules=init_leaf_modules(modules_elements=modules_elements),
+            navigation_cache=NavigationCache(),
+            reporter=reporter if reporter is not None else DocReporter(),
+            docstring_cache=DocstringCache(),
+            source_assets=(
+                SourceAssets(folder=config.out) if config.source_assets else None
+            ),
+        )
+
+
+def generate_modules(
+    modules: list[tuple[str, AstModule]],
+    project: Project,
+    manifest: IncrementalManifest | None,
+) -> list[ModuleGeneration]:
+    """
+    Generate the API files of modules, in parallel if :attr:`mkapi_python.py_griffe.Configuration.jobs` is
+    greater than 1.
+
+    Parameters:
+        modules: The modules, as tuples `(module path, module AST)`.
+        project: Project description.
+        manifest: Manifest of the previous generation, if incremental generation is enabled.
+
+    Returns:
+        The generations' result, in the order of the modules.
+    """
+    config = project.config
+    if config.jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(
+            max_workers=config.jobs,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_generation_worker,
+            initargs=(project, manifest),
+        ) as executor:
+            return list(
+                executor.map(
+                    _generate_module_worker,
+                    [path for path, _ in modules],
+                    chunksize=max(1, len(modules) // (4 * config.jobs)),
+                )
+            )
+    # Each module's documentation is released once written.
+    return [
+        (
+            write_module(generation=generation, doc=doc, config=config)
+            if doc is not None
+            else generation
+        )
+        for generation, doc in iter_project_api(
+            project=project, manifest=manifest, modules=modules
+        )
+    ]
+
+
+ITER_API_UNSUPPORTED_OPTIONS = (
+    "incremental",
+    "jobs",
+    "compact",
+    "pack",
+    "pack_compression",
+    "stats_report",
+    "source_assets",
+    "search_index",
+    "content_store",
+)
+"""
+Options of :class:`mkapi_python.py_griffe.Configuration` related to the files written, not supported by
+:func:`mkapi_python.py_griffe.iter_api`.
+"""
+
+
+def iter_api(
+    root_ast: AstModule,
+    config: Configuration,
+    stats: GenerationStats | None = None,
+    reporter: DocReporter | None = None,
+) -> Iterator[tuple[str, Module]]:
+    """
+    Generate the documentation of the modules one at a time, without writing files.
+
+    The documentation of a module is not retained once yielded: the caller can store it (e.g. in its own storage, a
+    pack, or a web server's response) with a memory usage bounded by the largest module.
+    Errors are merged in `reporter` as the modules are yielded.
+
+    Example:
+    ```
+    for path, module in iter_api(griffe_ast, config):
+        store(path, module)
+    ```
+
+    The project is initialized when called, the modules are parsed when iterated, see
+    :func:`mkapi_python.py_griffe.iter_project_api`.
+    The options related to the files written (see :glob:`mkapi_python.py_griffe.ITER_API_UNSUPPORTED_OPTIONS`) are
+    not supported, a `ValueError` is raised if one of them is set: implementations are embedded in the
+    documentation. See :func:`mkapi_python.py_griffe.generate_api` to write the API files.
+
+    Parameters:
+        root_ast: Root module's AST.
+        config: Configuration.
+        stats: Statistics to complete with the phases of the project's initialization and the modules' generation.
+        reporter: Reporter collecting the documentation errors, a new instance is created if not provided.
+
+    Returns:
+        The tuples `(module path, module documentation)`, in depth-first order.
+    """
+    defaults = Configuration(out=config.out)
+    unsupported = [
+        name
+        for name in ITER_API_UNSUPPORTED_OPTIONS
+        if getattr(config, name) != getattr(defaults, name)
+    ]
+    if unsupported:
+        raise ValueError(
+            f"Options not supported by iter_api (no files are written): {', '.join(unsupported)}. "
+            "Use generate_api instead."
+        )
+    generation_stats = stats if stats is not None else GenerationStats()
+    project = init_project(
+        root_ast=root_ast, config=config, stats=generation_stats, reporter=reporter
     )
 
-    def get_doc_rec(module: AstModule, path: str):
+    def iter_docs() -> Iterator[tuple[str, Module]]:
+        for generation, doc in iter_project_api(project=project):
+            project.reporter.load(generation.report)
+            generation_stats.modules.append(generation.stats)
+            yield generation.path, cast(Module, doc)
 
-        doc = parse_module(module, project=project)
-        target_path = Path(config.out, *path.split(".")).with_suffix(".json")
-        if target_path.exists():
-            target_path.unlink()
-        target_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(target_path, "w", encoding="UTF8") as json_file:
-            json.dump(doc, json_file, cls=DataclassJSONEncoder, indent=4)
-        for child in doc.children:
-            if child in config.extra_modules.get(path, []):
-                continue
-            gr_child = module[child.name]
-            get_doc_rec(module=gr_child, path=f"{path}.{child.name}")
+    return iter_docs()
 
-    get_doc_rec(module=root_ast, path=root_ast.name)
 
-    print(
-        f"Internal cross links errors ({len(DocReporter.internal_cross_ref_errors)}):"
+def init_navigation_manifest(
+    modules: list[tuple[str, AstModule]], project: Project
+) -> NavigationManifest:
+    """
+    Create the navigation manifest of the documented modules, once their API files have been written.
+
+    Parameters:
+        modules: The modules, as tuples `(module path, module AST)`, see :func:`mkapi_python.py_griffe.list_modules`.
+        project: Project description.
+
+    Returns:
+        The manifest.
+    """
+    config = project.config
+    nodes: dict[str, NavigationNode] = {}
+    for path, ast in modules:
+        elements = get_module_elements(
+            ast=ast, modules_elements=project.modules_elements
+        )
+        nodes[path] = NavigationNode(
+            name=ast.name,
+            nav_path=(
+                navigation_path(
+                    py_path=ast.canonical_path, name=ast.name, project=project
+                )
+                if ast is not project.root_ast
+                else None
+            ),
+            is_leaf=is_leaf_module(path=ast.canonical_path, project=project),
+            children=[m.canonical_path for m in elements.modules],
+            hash=content_hash(Path(config.out, *path.split(".")).with_suffix(".json")),
+        )
+    return NavigationManifest(
+        root=project.root_ast.name,
+        modules=nodes,
+        extra_modules={
+            path: children
+            for path, children in config.extra_modules.items()
+            if path in nodes
+        },
     )
-    pprint.pprint(DocReporter.internal_cross_ref_errors)
-    print(
-        f"External cross links errors  ({len(DocReporter.external_cross_ref_errors)}):"
+
+
+def init_search_documents(project: Project) -> list[SearchDocument]:
+    """
+    Create the documents of the search index: the symbols of the project, see
+    :attr:`mkapi_python.py_griffe.Project.all_symbols`.
+
+    The summary of a symbol is the first sentence of its docstring, the sphinx cross-links being replaced by their
+    label.
+
+    Parameters:
+        project: Project description.
+
+    Returns:
+        The documents, in the order of the symbols.
+    """
+    root_ast = project.root_ast
+
+    def label(match: re.Match[str]) -> str:
+        content = match.group(2)
+        if CROSS_LINK_LABEL_PATTERN.search(content):
+            return content[0 : content.find("<")].strip()
+        return content.split(".")[-1]
+
+    documents: list[SearchDocument] = []
+    for path, symbol in project.all_symbols.items():
+        try:
+            ast = root_ast if path == root_ast.name else root_ast[path]
+            docstring = ast.docstring.value if ast.docstring else ""
+        except (KeyError, AliasResolutionError):
+            docstring = ""
+        documents.append(
+            SearchDocument(
+                path=path,
+                kind=symbol.kind,
+                navigation_path=symbol.navigation_path,
+                summary=CROSS_LINK_PATTERN.sub(label, summary_sentence(docstring)),
+            )
+        )
+    return documents
+
+
+def generate_project_api(project: Project, stats: GenerationStats) -> GenerationStats:
+    """
+    Create the documentation API files of an initialized project, see
+    :func:`mkapi_python.py_griffe.generate_api`.
+
+    Parameters:
+        project: The project, see :func:`mkapi_python.py_griffe.init_project`.
+        stats: Statistics to complete.
+
+    Returns:
+        The statistics of the generation.
+    """
+    config, reporter = project.config, project.reporter
+    modules = list_modules(
+        root_ast=project.root_ast, modules_elements=project.modules_elements
+    )
+    with stats.phase("symbol index"):
+        save_project_symbol_index(project)
+
+    manifest = (
+        IncrementalManifest.load(folder=config.out, generator=generator_hash(config))
+        if config.incremental
+        else None
     )
-    pprint.pprint(DocReporter.external_cross_ref_errors)
-    print(f"No docstring errors ({len(DocReporter.no_docstrings_errors)}):")
-    pprint.pprint(DocReporter.no_docstrings_errors)
-    print(f"Sphinx cross-link tag unknown ({len(DocReporter.sphinx_tag_unknown)}):")
-    pprint.pprint(DocReporter.sphinx_tag_unknown)
+    with stats.phase("modules"):
+        generations = generate_modules(
+            modules=modules, project=project, manifest=manifest
+        )
+
+    for generation in generations:
+        reporter.load(generation.report)
+        stats.modules.append(generation.stats)
+    if config.pack:
+        with stats.phase("pack"):
+            write_pack(
+                folder=config.out,
+                modules=[path.replace(".", "/") for path, _ in modules],
+                compression=config.pack_compression,
+            )
+    if config.content_store:
+        with stats.phase("content store"):
+            store = ContentStore(folder=config.content_store)
+            publish_modules(
+                folder=config.out,
+                store=store,
+                modules=[path.replace(".", "/") for path, _ in modules],
+            )
+        print(
+            f"Content store: {store.written} blob(s) written, {store.reused} already stored"
+        )
+    with stats.phase("navigation manifest"):
+        init_navigation_manifest(modules=modules, project=project).save(
+            folder=config.out
+        )
+    if config.search_index:
+        with stats.phase("search index"):
+            SearchIndex.build(documents=init_search_documents(project)).save(
+                folder=config.out
+            )
+    if manifest is not None:
+        documented = {path for path, _ in modules}
+        remove_api_files(
+            folder=config.out,
+            modules=[path for path in manifest.modules if path not in documented],
+        )
+        IncrementalManifest(
+            generator=manifest.generator,
+            modules={g.path: g.entry for g in generations if g.entry},
+        ).save(folder=config.out)
+    if config.stats_report:
+        stats.save(config.stats_report)
+
+    print(f"Internal cross links errors ({len(reporter.internal_cross_ref_errors)}):")
+    pprint.pprint(reporter.internal_cross_ref_errors)
+    print(f"External cross links errors  ({len(reporter.external_cross_ref_errors)}):")
+    pprint.pprint(reporter.external_cross_ref_errors)
+    print(f"No docstring errors ({len(reporter.no_docstrings_errors)}):")
+    pprint.pprint(reporter.no_docstrings_errors)
+    print(f"Sphinx cross-link tag unknown ({len(reporter.sphinx_tag_unknown)}):")
+    pprint.pprint(reporter.sphinx_tag_unknown)
     print(
-        f"Sphinx cross-link unresolved ({len(DocReporter.sphinx_links_unresolved.keys())}):"
+        f"Sphinx cross-link unresolved ({len(reporter.sphinx_links_unresolved.keys())}):"
+    )
+    pprint.pprint(reporter.sphinx_links_unresolved)
+    if config.ast_cache:
+        print(config.ast_cache.report())
+    return stats
+
+
+def generate_api(
+    root_ast: AstModule,
+    config: Configuration,
+    stats: GenerationStats | None = None,
+    reporter: DocReporter | None = None,
+) -> GenerationStats:
+    """
+    Create documentation API files from an AST parsed by the griffe library:
+    * It extracts the elements of the documented modules in a single traversal.
+      See :func:`mkapi_python.py_griffe.init_modules_elements`.
+    * It generates the list of exported symbols (those documented).
+      See :func:`mkapi_python.py_griffe.init_symbols`.
+    * It generates the list of all aliases from the `__init__.py` files, and from the `import` statements in the files.
+      See :func:`mkapi_python.py_griffe.init_aliases`.
+    * It saves both in the symbol index of the package, see :glob:`mkapi_python.py_griffe.SYMBOL_INDEX_FILENAME`.
+    * It loads the symbols of the cross-linked packages, from their index if provided in
+      :attr:`mkapi_python.py_griffe.Configuration.cross_linked_indexes`.
+    * It collects, in a single pass, the names referenced in the declarations of the documented entities.
+      See :func:`mkapi_python.py_griffe.init_declarations_names`.
+    * It generates the documentation of all exported modules (those documented) one at a time, using the same
+      iterator as :func:`mkapi_python.py_griffe.iter_api` (see :func:`mkapi_python.py_griffe.iter_project_api`).
+      In :attr:`incremental mode<mkapi_python.py_griffe.Configuration.incremental>`, modules for which inputs did
+      not change are skipped, and the API files of the modules removed since the previous generation are deleted.
+      Modules are generated in parallel if :attr:`mkapi_python.py_griffe.Configuration.jobs` is greater than 1.
+    * If :attr:`mkapi_python.py_griffe.Configuration.pack` is enabled, it bundles the API files in a pack.
+    * If :attr:`mkapi_python.py_griffe.Configuration.content_store` is provided, it publishes the API files in the
+      content-addressed store, along with the manifest of this generation.
+    * It writes the navigation manifest: the tree of the modules along with their documents' hash,
+      see :glob:`mkapi_python.navigation.NAVIGATION_FILENAME`.
+    * If :attr:`mkapi_python.py_griffe.Configuration.search_index` is enabled, it writes the search index of the
+      symbols, see `mkapi_python.search_index`.
+
+    To regenerate the API files when the sources change, see :func:`mkapi_python.watch.watch_api`.
+    To get the modules' documentation without writing files, see :func:`mkapi_python.py_griffe.iter_api`.
+
+    The wall time and memory of each of these phases are recorded, along with the statistics of each module's
+    generation. They are returned, and saved in :attr:`mkapi_python.py_griffe.Configuration.stats_report` if
+    provided.
+
+    The documentation errors are collected in `reporter` and printed. No global state is involved: several
+    generations can run concurrently within a process, each with its own reporter.
+
+    Parameters:
+        root_ast: Root module's AST.
+        config: Configuration.
+        stats: Statistics to complete, e.g. with the phase of loading the root module's AST.
+            If not provided, a new instance is created.
+        reporter: Reporter collecting the documentation errors, a new instance is created if not provided.
+
+    Returns:
+        The statistics of the generation.
+    """
+    stats = stats if stats is not None else GenerationStats()
+    project = init_project(
+        root_ast=root_ast, config=config, stats=stats, reporter=reporter
     )
-    pprint.pprint(DocReporter.sphinx_links_unresolved)
+    return generate_project_api(project=project, stats=stats)
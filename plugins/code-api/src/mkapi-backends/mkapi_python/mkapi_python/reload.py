@@ -0,0 +1,362 @@
+"""
+Partial reloads of a package, used by the watch mode (see :func:`mkapi_python.watch.watch_api`).
+
+When only the content of some modules changed, :class:`mkapi_python.reload.PackageReloader` visits these modules
+again and replaces them in the module tree loaded by griffe, the other modules are kept as they are.
+The project is then updated:
+*  The elements and the declarations' names of the documented modules not impacted are reused.
+*  The symbols and aliases tables are computed again, as their resolution can go through any module
+   (inherited members, imports).
+*  The tables derived from the symbols are only computed again if the symbols changed.
+
+Other changes (modules added or removed, stub files, dataclasses inherited by classes of other modules) trigger a
+full reload of the package.
+"""
+
+from pathlib import Path
+from typing import cast
+
+import griffe
+from griffe.agents.visitor import visit
+from griffe.dataclasses import Alias as AstAlias
+from griffe.dataclasses import Class as AstClass
+from griffe.dataclasses import Module as AstModule
+from griffe.dataclasses import Object as AstObject
+from griffe.exceptions import AliasResolutionError, CyclicAliasError
+from griffe.extensions.base import Extensions, load_extensions
+from griffe.finder import ModuleFinder
+
+from .docstring_cache import DocstringCache
+from .navigation_cache import NavigationCache
+from .py_griffe import (
+    DeclarationNames,
+    DocReporter,
+    Project,
+    documented_entities,
+    get_declaration_names,
+    init_aliases,
+    init_leaf_modules,
+    init_modules_elements,
+    init_project,
+    init_symbols,
+    init_symbols_by_name,
+)
+from .source_assets import SourceAssets
+from .stats import GenerationStats
+from .suffix_trie import SuffixTrie
+
+__all__ = [
+    "iter_tree",
+    "changed_modules",
+    "dataclass_dependents",
+    "detach_module",
+    "clear_caches",
+    "replace_module",
+    "update_project",
+    "PackageReloader",
+]
+
+
+def iter_tree(root: AstModule) -> list[AstObject]:
+    """
+    Parameters:
+        root: The root module.
+
+    Returns:
+        The modules & classes of a module tree (aliases excluded), parents first.
+    """
+    objects: list[AstObject] = []
+    stack: list[AstObject] = [root]
+    while stack:
+        obj = stack.pop()
+        objects.append(obj)
+        stack.extend(
+            member
+            for member in obj.members.values()
+            if isinstance(member, (AstModule, AstClass))
+        )
+    return objects
+
+
+def changed_modules(root: AstModule, files: set[Path]) -> list[AstModule] | None:
+    """
+    Find the modules of a tree whose source files changed.
+
+    Parameters:
+        root: The root module.
+        files: The source files changed.
+
+    Returns:
+        The modules, parents first. `None` if one of the files is not the (still existing) `.py` file of a module
+        of the tree without stub file.
+    """
+    by_file = {
+        obj.filepath: obj
+        for obj in iter_tree(root)
+        if isinstance(obj, AstModule) and isinstance(obj.filepath, Path)
+    }
+    modules = []
+    for path in files:
+        if (
+            path.suffix != ".py"
+            or path not in by_file
+            or not path.exists()
+            or path.with_suffix(".pyi").exists()
+        ):
+            return None
+        modules.append(by_file[path])
+    return sorted(modules, key=lambda module: module.path.count("."))
+
+
+def dataclass_dependents(root: AstModule, modules: set[str]) -> bool:
+    """
+    Whether classes outside some modules inherit from dataclasses defined in these modules.
+
+    The `__init__` method of a dataclass is generated from its parents by griffe's dataclasses extension when
+    the package is loaded, it can not be updated by a partial reload.
+
+    Parameters:
+        root: The root module.
+        modules: Paths of the modules.
+
+    Returns:
+        `True` if such classes exist, or if the MRO of a class can not be computed.
+    """
+    classes = [obj for obj in iter_tree(root) if isinstance(obj, AstClass)]
+    if not any(c.module.path in modules and "dataclass" in c.labels for c in classes):
+        return False
+    for obj in classes:
+        if obj.module.path in modules:
+            continue
+        try:
+            mro = obj.mro()
+        except (ValueError, AliasResolutionError, CyclicAliasError):
+            return True
+        if any(
+            base.module.path in modules and "dataclass" in base.labels for base in mro
+        ):
+            return True
+    return False
+
+
+def detach_module(module: AstModule):
+    """
+    Detach the objects of a module replaced in the tree (sub-modules excluded): the aliases targeting them are
+    resolved again when used.
+
+    Parameters:
+        module: The module replaced.
+    """
+    stack: list[AstObject] = [module]
+    while stack:
+        obj = stack.pop()
+        for alias in obj.aliases.values():
+            alias._target = None  # pylint: disable=protected-access
+        stack.extend(
+            member
+            for member in obj.members.values()
+            if not isinstance(member, (AstAlias, AstModule))
+        )
+
+
+def clear_caches(root: AstModule):
+    """
+    Clear the members cached by griffe in a module tree: members of the aliases, resolved bases and inherited
+    members of the classes.
+
+    Parameters:
+        root: The root module.
+    """
+    for obj in iter_tree(root):
+        for member in obj.members.values():
+            if isinstance(member, AstAlias):
+                member.__dict__.pop("members", None)
+                member.__dict__.pop("inherited_members", None)
+        if isinstance(obj, AstClass):
+            obj.__dict__.pop("resolved_bases", None)
+            obj.__dict__.pop("inherited_members", None)
+
+
+def replace_module(old: AstModule, new: AstModule, code: str):
+    """
+    Replace a module of the tree by a new version of it.
+
+    The sub-modules of the old version are moved in the new one, in the order of griffe's loader.
+
+    Parameters:
+        old: The module in the tree.
+        new: The new version, visited with the same parent.
+        code: The source code of the new version.
+    """
+    if old.is_init_module:
+        for parts, _ in ModuleFinder().submodules(new):
+            submodule = old.members.get(parts[0])
+            if len(parts) == 1 and isinstance(submodule, AstModule):
+                new.set_member(parts[0], submodule)
+    if old.parent is None:
+        old.modules_collection.set_member(old.path, new)
+    else:
+        old.parent.set_member(old.name, new)
+    new.lines_collection[cast(Path, new.filepath)] = code.splitlines(keepends=False)
+    detach_module(old)
+
+
+def update_project(
+    previous: Project, root_ast: AstModule, reloaded: list[AstModule]
+) -> Project:
+    """
+    Update a project after some of its modules have been replaced.
+
+    Parameters:
+        previous: The project before the replacement.
+        root_ast: The root module (replaced if it has been reloaded).
+        reloaded: The new versions of the modules replaced.
+
+    Returns:
+        The new project, `previous` is left untouched.
+    """
+    dirty = {module.path for module in reloaded} | {
+        module.parent.path for module in reloaded if module.parent is not None
+    }
+    modules_elements = init_modules_elements(
+        root_ast=root_ast,
+        reused={
+            path: elements
+            for path, elements in previous.modules_elements.items()
+            if path not in dirty
+        },
+    )
+    declarations_names: dict[str, DeclarationNames] = {}
+    for path, elements in modules_elements.items():
+        for entity in documented_entities(elements):
+            names = previous.declarations_names.get(entity.path)
+            declarations_names[entity.path] = (
+                names
+                if names is not None and path not in dirty
+                else get_declaration_names(entity)
+            )
+    all_symbols = init_symbols(root_ast=root_ast, modules_elements=modules_elements)
+    symbols_changed = list(all_symbols.items()) != list(previous.all_symbols.items())
+    config = previous.config
+    return previous._replace(
+        root_ast=root_ast,
+        all_symbols=all_symbols,
+        all_aliases=init_aliases(root_ast=root_ast),
+        symbols_by_name=(
+            init_symbols_by_name(all_symbols=all_symbols)
+            if symbols_changed
+            else previous.symbols_by_name
+        ),
+        symbols_trie=(
+            SuffixTrie(paths=all_symbols.keys())
+            if symbols_changed
+            else previous.symbols_trie
+        ),
+        declarations_names=declarations_names,
+        modules_elements=modules_elements,
+        leaf_modules=init_leaf_modules(modules_elements=modules_elements),
+        navigation_cache=NavigationCache(),
+        reporter=DocReporter(),
+        docstring_cache=DocstringCache(),
+        source_assets=SourceAssets(folder=config.out) if config.source_assets else None,
+    )
+
+
+class PackageReloader:  # pylint: disable=too-few-public-methods
+    """
+    Reloads the module tree and the project of a package when its source files change.
+    """
+
+    def __init__(self, objspec: str | Path, project: Project):
+        """
+        Parameters:
+            objspec: Name or path of the package, as provided to `griffe.load`.
+            project: The project initially loaded, its cross-linked packages are reused by the reloads.
+        """
+        self.objspec = objspec
+        """
+        Name or path of the package.
+        """
+        self.project = project
+        """
+        The project, updated by each reload.
+        """
+        self.reloaded: list[str] | None = None
+        """
+        Paths of the modules visited again by the last reload, `None` if it was a full reload.
+        """
+        self.stale = False
+        """
+        Whether a reload failed while the module tree was being updated: the next reload is a full one.
+        """
+
+    def reload(self, files: set[Path]) -> Project:
+        """
+        Reload the package after some of its source files changed.
+
+        If the reload fails (*e.g.* syntax error), the error is propagated and
+        :attr:`mkapi_python.reload.PackageReloader.project` is left unchanged.
+
+        Parameters:
+            files: The source files added, removed or modified.
+
+        Returns:
+            The new project.
+        """
+        modules = (
+            None
+            if self.stale
+            else changed_modules(root=self.project.root_ast, files=files)
+        )
+        if modules is None:
+            return self._load()
+        extensions = load_extensions()
+        # All the modules are visited before updating the tree: it is left untouched if one of them fails.
+        visited = [(module, *self._visit(module, extensions)) for module in modules]
+        paths = {module.path for module in modules}
+        if dataclass_dependents(root=self.project.root_ast, modules=paths):
+            return self._load()
+        self.stale = True
+        root = self.project.root_ast
+        for old, new, code in visited:
+            replace_module(old=old, new=new, code=code)
+            root = new if old is root else root
+        clear_caches(root)
+        if dataclass_dependents(root=root, modules=paths):
+            return self._load()
+        extensions.call("on_package_loaded", pkg=root.package)
+        self.project = update_project(
+            previous=self.project,
+            root_ast=root,
+            reloaded=[new for _, new, _ in visited],
+        )
+        self.reloaded = sorted(paths)
+        self.stale = False
+        return self.project
+
+    @staticmethod
+    def _visit(module: AstModule, extensions: Extensions) -> tuple[AstModule, str]:
+        filepath = cast(Path, module.filepath)
+        code = filepath.read_text(encoding="utf8")
+        new = visit(
+            module.name,
+            filepath=filepath,
+            code=code,
+            extensions=extensions,
+            parent=cast(AstModule | None, module.parent),
+            lines_collection=module.lines_collection,
+            modules_collection=module.modules_collection,
+        )
+        return new, code
+
+    def _load(self) -> Project:
+        root_ast = cast(AstModule, griffe.load(self.objspec, submodules=True))
+        self.project = init_project(
+            root_ast=root_ast,
+            config=self.project.config,
+            stats=GenerationStats(),
+            cross_packages=self.project.cross_linked_packages,
+        )
+        self.reloaded = None
+        self.stale = False
+        return self.project
@@ -0,0 +1,471 @@
+"""
+Client-side search index of the symbols of a package, see :attr:`mkapi_python.py_griffe.Configuration.search_index`.
+
+The index is an inverted index written in the folder :glob:`mkapi_python.search_index.SEARCH_INDEX_FOLDER`:
+*  `index.json`: the entry point, listing the shards along with the range of terms they include, and the files of
+   the documents.
+*  `documents-<n>.json`: the symbols indexed, as tuples `[path, kind, navigation path, summary]`, split in files of
+   :glob:`mkapi_python.search_index.SEARCH_DOCUMENTS_SHARD_SIZE` symbols.
+   Postings refer to a symbol by its position in the concatenation of these lists: the symbol at position `p` is
+   the item `p % size` of the file `p // size`.
+*  `shard-<n>.json`: the shards, each including a contiguous range of the sorted terms along with their postings.
+
+The frontend loads `index.json`, then only the shards whose range intersects the terms searched
+(a prefix search may span several consecutive shards), and the documents' files including the results displayed.
+
+Within a shard, the terms are front-coded: each term is stored as the length of the prefix it shares with the
+previous term, and the remaining suffix. Every :glob:`mkapi_python.search_index.SEARCH_BLOCK_SIZE` terms the
+prefix length is reset to 0 (the term is stored in full), allowing a binary search over the blocks' heads.
+
+The postings of a term are the increasing positions of the symbols including it, delta-encoded (the first value is
+a position, the followings the gap with the previous one). Each value is multiplied by 8 and combined with a bitmask
+of the fields in which the term appears, see :glob:`mkapi_python.search_index.SEARCH_FIELDS`:
+for a posting `p`, the gap is `p >> 3` and the fields `p & 7`.
+"""
+
+import json
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .artifacts import ARTIFACTS_FOLDER
+
+__all__ = [
+    "SEARCH_INDEX_FOLDER",
+    "SEARCH_INDEX_VERSION",
+    "SEARCH_BLOCK_SIZE",
+    "SEARCH_SHARD_SIZE",
+    "SEARCH_DOCUMENTS_SHARD_SIZE",
+    "SEARCH_FIELDS",
+    "STOP_WORDS",
+    "WORD_PATTERN",
+    "SENTENCE_END_PATTERN",
+    "SearchDocument",
+    "summary_sentence",
+    "identifier_terms",
+    "text_terms",
+    "document_terms",
+    "front_code",
+    "front_decode",
+    "encode_postings",
+    "decode_postings",
+    "SearchShard",
+    "SearchIndex",
+]
+
+SEARCH_INDEX_FOLDER = f"{ARTIFACTS_FOLDER}/search"
+"""
+Path of the folder including the search index, relative to :attr:`mkapi_python.py_griffe.Configuration.out`
+(see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+"""
+
+SEARCH_INDEX_VERSION = 2
+"""
+Version of the search index's format.
+"""
+
+SEARCH_BLOCK_SIZE = 16
+"""
+Number of front-coded terms per block, the first term of each block being stored in full.
+"""
+
+SEARCH_SHARD_SIZE = 8192
+"""
+Target size of a shard, in number of terms and postings.
+"""
+
+SEARCH_DOCUMENTS_SHARD_SIZE = 1024
+"""
+Number of symbols per documents' file.
+"""
+
+SEARCH_FIELDS = {"name": 1, "path": 2, "summary": 4}
+"""
+Bit of each field in the postings: the symbol's name, the segments of its parent's path, the first sentence of its
+docstring.
+"""
+
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from if in is it its of on or that the this to with".split()
+)
+"""
+Words of the summaries not indexed.
+"""
+
+WORD_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+"""
+Words of an identifier, split on underscores and case changes (e.g. `HTTPClient` and `http_client` both give
+`http` & `client`).
+"""
+
+SENTENCE_END_PATTERN = re.compile(r"[.!?](\s|$)")
+"""
+End of the first sentence of a docstring.
+"""
+
+
+class SearchDocument(NamedTuple):
+    """
+    A symbol included in the search index.
+    """
+
+    path: str
+    """
+    Path of the symbol, without the package's name (e.g. `foo.Bar.baz`).
+    """
+    kind: str
+    """
+    Kind of the symbol, see :glob:`mkapi_python.py_griffe.SymbolKind`.
+    """
+    navigation_path: str
+    """
+    Navigation path of the symbol, see :attr:`mkapi_python.py_griffe.SymbolRef.navigation_path`.
+    """
+    summary: str
+    """
+    First sentence of the symbol's docstring, empty if none.
+    """
+
+    def to_json(self) -> list[str]:
+        return [self.path, self.kind, self.navigation_path, self.summary]
+
+    @staticmethod
+    def from_json(data: list[str]) -> "SearchDocument":
+        path, kind, navigation_path, summary = data
+        return SearchDocument(
+            path=path, kind=kind, navigation_path=navigation_path, summary=summary
+        )
+
+
+def summary_sentence(docstring: str) -> str:
+    """
+    Parameters:
+        docstring: Text of a docstring.
+
+    Returns:
+        The first sentence of the docstring's first paragraph, on a single line.
+    """
+    paragraph = docstring.strip().split("\n\n")[0]
+    paragraph = " ".join(paragraph.split())
+    end = SENTENCE_END_PATTERN.search(paragraph)
+    return paragraph[0 : end.start() + 1] if end else paragraph
+
+
+def identifier_terms(identifier: str) -> set[str]:
+    """
+    Parameters:
+        identifier: A python identifier.
+
+    Returns:
+        The terms of the identifier: itself and its words, lower-cased.
+    """
+    terms = {word.lower() for word in WORD_PATTERN.findall(identifier)}
+    terms.add(identifier.lower().strip("_"))
+    terms.discard("")
+    return terms
+
+
+def text_terms(text: str) -> set[str]:
+    """
+    Parameters:
+        text: A text, e.g. a summary.
+
+    Returns:
+        The terms of the text: its identifiers' terms, except the stop words and those of one character.
+    """
+    return {
+        term
+        for identifier in re.findall(r"\w+", text)
+        for term in identifier_terms(identifier)
+        if len(term) > 1 and term not in STOP_WORDS
+    }
+
+
+def document_terms(document: SearchDocument) -> dict[str, int]:
+    """
+    Parameters:
+        document: A symbol.
+
+    Returns:
+        The terms of the symbol, with the bitmask of the fields including them.
+    """
+    terms: dict[str, int] = defaultdict(int)
+    *parents, name = document.path.split(".")
+    fields = [
+        (SEARCH_FIELDS["name"], identifier_terms(name)),
+        (
+            SEARCH_FIELDS["path"],
+            {term for parent in parents for term in identifier_terms(parent)},
+        ),
+        (SEARCH_FIELDS["summary"], text_terms(document.summary)),
+    ]
+    for field, field_terms in fields:
+        for term in field_terms:
+            terms[term] |= field
+    return terms
+
+
+def front_code(terms: list[str], block_size: int) -> tuple[list[int], list[str]]:
+    """
+    Front-code sorted terms.
+
+    Parameters:
+        terms: The sorted terms.
+        block_size: Number of terms per block.
+
+    Returns:
+        The lengths of the prefixes shared with the previous terms, and the remaining suffixes.
+    """
+    prefixes: list[int] = []
+    suffixes: list[str] = []
+    previous = ""
+    for i, term in enumerate(terms):
+        shared = 0
+        if i % block_size:
+            limit = min(len(previous), len(term))
+            while shared < limit and previous[shared] == term[shared]:
+                shared += 1
+        prefixes.append(shared)
+        suffixes.append(term[shared:])
+        previous = term
+    return prefixes, suffixes
+
+
+def front_decode(prefixes: list[int], suffixes: list[str]) -> list[str]:
+    """
+    Decode front-coded terms, see :func:`mkapi_python.search_index.front_code`.
+
+    Parameters:
+        prefixes: The lengths of the prefixes shared with the previous terms.
+        suffixes: The remaining suffixes.
+
+    Returns:
+        The terms.
+    """
+    terms: list[str] = []
+    previous = ""
+    for shared, suffix in zip(prefixes, suffixes):
+        previous = previous[:shared] + suffix
+        terms.append(previous)
+    return terms
+
+
+def encode_postings(postings: list[tuple[int, int]]) -> list[int]:
+    """
+    Parameters:
+        postings: The postings of a term, as increasing tuples `(document's position, fields' bitmask)`.
+
+    Returns:
+        The delta-encoded postings, combined with their fields.
+    """
+    encoded: list[int] = []
+    previous = 0
+    for position, fields in postings:
+        encoded.append(((position - previous) << 3) | fields)
+        previous = position
+    return encoded
+
+
+def decode_postings(encoded: list[int]) -> list[tuple[int, int]]:
+    """
+    Parameters:
+        encoded: Encoded postings, see :func:`mkapi_python.search_index.encode_postings`.
+
+    Returns:
+        The postings, as tuples `(document's position, fields' bitmask)`.
+    """
+    postings: list[tuple[int, int]] = []
+    position = 0
+    for value in encoded:
+        position += value >> 3
+        postings.append((position, value & 7))
+    return postings
+
+
+class SearchShard(NamedTuple):
+    """
+    A shard of the search index: a contiguous range of the sorted terms, along with their postings.
+    """
+
+    terms: list[str]
+    """
+    The sorted terms.
+    """
+    postings: list[list[int]]
+    """
+    The encoded postings of each term, see :func:`mkapi_python.search_index.encode_postings`.
+    """
+
+    def to_json(self, block_size: int) -> dict[str, Any]:
+        prefixes, suffixes = front_code(self.terms, block_size=block_size)
+        return {"prefixes": prefixes, "suffixes": suffixes, "postings": self.postings}
+
+    @staticmethod
+    def from_json(data: dict[str, Any]) -> "SearchShard":
+        return SearchShard(
+            terms=front_decode(data["prefixes"], data["suffixes"]),
+            postings=data["postings"],
+        )
+
+
+class SearchIndex(NamedTuple):
+    """
+    The search index of a package, see :func:`mkapi_python.search_index.SearchIndex.build`.
+    """
+
+    documents: list[SearchDocument]
+    """
+    The symbols indexed.
+    """
+    shards: list[SearchShard]
+    """
+    The shards, in the order of their terms.
+    """
+    block_size: int = SEARCH_BLOCK_SIZE
+    """
+    Number of front-coded terms per block.
+    """
+    documents_shard_size: int = SEARCH_DOCUMENTS_SHARD_SIZE
+    """
+    Number of symbols per documents' file.
+    """
+
+    @staticmethod
+    def build(
+        documents: list[SearchDocument],
+        shard_size: int = SEARCH_SHARD_SIZE,
+        documents_shard_size: int = SEARCH_DOCUMENTS_SHARD_SIZE,
+    ) -> "SearchIndex":
+        """
+        Build the index of symbols.
+
+        Parameters:
+            documents: The symbols to index.
+            shard_size: Target size of the shards, in number of terms and postings: a shard is closed once the size
+                is reached (a term's postings are never split across shards).
+            documents_shard_size: Number of symbols per documents' file.
+
+        Returns:
+            The index.
+        """
+        postings: dict[str, list[tuple[int, int]]] = defaultdict(list)
+        for position, document in enumerate(documents):
+            for term, fields in document_terms(document).items():
+                postings[term].append((position, fields))
+
+        shards: list[SearchShard] = []
+        current = SearchShard(terms=[], postings=[])
+        size = 0
+        for term in sorted(postings):
+            current.terms.append(term)
+            current.postings.append(encode_postings(postings[term]))
+            size += 1 + len(postings[term])
+            if size >= shard_size:
+                shards.append(current)
+                current = SearchShard(terms=[], postings=[])
+                size = 0
+        if current.terms:
+            shards.append(current)
+        return SearchIndex(
+            documents=documents,
+            shards=shards,
+            documents_shard_size=documents_shard_size,
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "blockSize": self.block_size,
+            "fields": SEARCH_FIELDS,
+            "documents": {
+                "shardSize": self.documents_shard_size,
+                "files": [
+                    f"documents-{i}.json" for i in range(len(self.documents_shards()))
+                ],
+            },
+            "documentsCount": len(self.documents),
+            "shards": [
+                {
+                    "file": f"shard-{i}.json",
+                    "first": shard.terms[0],
+                    "last": shard.terms[-1],
+                }
+                for i, shard in enumerate(self.shards)
+            ],
+        }
+
+    def documents_shards(self) -> list[list[SearchDocument]]:
+        """
+        Returns:
+            The symbols, split in lists of :attr:`mkapi_python.search_index.SearchIndex.documents_shard_size`.
+        """
+        size = self.documents_shard_size
+        return [
+            self.documents[start : start + size]
+            for start in range(0, len(self.documents), size)
+        ]
+
+    def save(self, folder: Path):
+        """
+        Save the index in the output folder, replacing the previous one (if any): the shards & documents' files
+        not part of the new index are removed, only the index's own files are touched.
+
+        Parameters:
+            folder: The output folder.
+        """
+        target = folder / SEARCH_INDEX_FOLDER
+        target.mkdir(parents=True, exist_ok=True)
+        documents_shards = self.documents_shards()
+        files = {f"shard-{i}.json" for i in range(len(self.shards))} | {
+            f"documents-{i}.json" for i in range(len(documents_shards))
+        }
+        for stale in [*target.glob("shard-*.json"), *target.glob("documents*.json")]:
+            if stale.name not in files:
+                stale.unlink()
+
+        def dump(name: str, content: Any):
+            with open(target / name, "w", encoding="UTF8") as file:
+                json.dump(content, file, separators=(",", ":"))
+
+        dump("index.json", self.to_json())
+        for i, documents in enumerate(documents_shards):
+            dump(f"documents-{i}.json", [document.to_json() for document in documents])
+        for i, shard in enumerate(self.shards):
+            dump(f"shard-{i}.json", shard.to_json(block_size=self.block_size))
+
+    @staticmethod
+    def load(folder: Path) -> "SearchIndex":
+        """
+        Load the index saved in an output folder, see :func:`mkapi_python.search_index.SearchIndex.save`.
+
+        A `ValueError` is raised if the index's format is not supported.
+
+        Parameters:
+            folder: The output folder.
+
+        Returns:
+            The index.
+        """
+        source = folder / SEARCH_INDEX_FOLDER
+
+        def load_json(name: str) -> Any:
+            with open(source / name, encoding="UTF8") as file:
+                return json.load(file)
+
+        index = load_json("index.json")
+        if index["version"] != SEARCH_INDEX_VERSION:
+            raise ValueError(f"Unsupported search index version '{index['version']}'")
+        return SearchIndex(
+            documents=[
+                SearchDocument.from_json(document)
+                for name in index["documents"]["files"]
+                for document in load_json(name)
+            ],
+            shards=[
+                SearchShard.from_json(load_json(shard["file"]))
+                for shard in index["shards"]
+            ],
+            block_size=index["blockSize"],
+            documents_shard_size=index["documents"]["shardSize"],
+        )
@@ -0,0 +1,144 @@
+"""
+Streaming JSON serializer of the models defined in `mkapi_python.models`.
+
+The models are written directly to the output file: there is no intermediate copy of the tree as a dictionary
+(as `dataclasses.asdict` would do). The indented output is identical to the one of
+`json.dump(dataclasses.asdict(model), file, indent=4)`, except for the fields declared with
+:glob:`mkapi_python.serialization.OMIT_IF_NONE` that are omitted when `None`.
+"""
+
+import dataclasses
+import json
+from typing import Any, TextIO
+
+__all__ = ["OMIT_IF_NONE", "dataclass_fields", "dump_model"]
+
+OMIT_IF_NONE = {"omit_if_none": True}
+"""
+Metadata of the models' fields omitted from the output when their value is `None`,
+e.g. `dataclasses.field(default=None, metadata=OMIT_IF_NONE)`.
+"""
+
+_DATACLASS_FIELDS: dict[type, tuple[tuple[str, bool], ...]] = {}
+
+_encode_str = json.encoder.encode_basestring_ascii
+
+
+def _encode_key(key: Any) -> str:
+    """
+    Encode a dictionary's key, converted to a string as `json.dump` does.
+    """
+    if isinstance(key, str):
+        return _encode_str(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, int):
+        return f'"{int.__repr__(key)}"'
+    if isinstance(key, float):
+        return f'"{json.dumps(key)}"'
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
+def dataclass_fields(model_type: type) -> tuple[tuple[str, bool], ...] | None:
+    """
+    Returns the fields of a dataclass type, in declaration order. Results are cached by type.
+
+    Parameters:
+        model_type: The type.
+
+    Returns:
+        The fields' name along with whether they are omitted when `None` (see
+        :glob:`mkapi_python.serialization.OMIT_IF_NONE`), `None` if the type is not a dataclass.
+    """
+    fields = _DATACLASS_FIELDS.get(model_type, None)
+    if fields is None and dataclasses.is_dataclass(model_type):
+        fields = tuple(
+            (f.name, f.metadata.get("omit_if_none", False))
+            for f in dataclasses.fields(model_type)
+        )
+        _DATACLASS_FIELDS[model_type] = fields
+    return fields
+
+
+def dump_model(model: Any, file: TextIO, indent: int | None = 4):
+    """
+    Serialize a model (or a list, dictionary, *etc.* of models) as JSON into a file.
+
+    Parameters:
+        model: The model.
+        file: The output file.
+        indent: Indentation of the nested elements, if `None` the output is compact (no spaces nor line breaks).
+    """
+    write = file.write
+    colon = ": " if indent is not None else ":"
+    newlines: list[str] = []
+
+    def newline(level: int) -> str:
+        # Separators are cached per nesting level: `\n` followed by the indentation.
+        while len(newlines) <= level:
+            newlines.append(
+                "\n" + " " * (indent * len(newlines)) if indent is not None else ""
+            )
+        return newlines[level]
+
+    def write_items(items: Any, level: int, opening: str, closing: str, keyed: bool):
+        inner = newline(level + 1)
+        separator = "," + inner
+        first = True
+        for item in items:
+            if first:
+                write(opening + inner)
+                first = False
+            else:
+                write(separator)
+            if keyed:
+                key, value = item
+                write(_encode_key(key) + colon)
+                write_value(value, level + 1)
+            else:
+                write_value(item, level + 1)
+        write(opening + closing if first else newline(level) + closing)
+
+    def write_value(value: Any, level: int):
+        if isinstance(value, str):
+            write(_encode_str(value))
+        elif value is None:
+            write("null")
+        elif value is True:
+            write("true")
+        elif value is False:
+            write("false")
+        elif isinstance(value, int):
+            write(int.__repr__(value))
+        elif isinstance(value, float):
+            write(json.dumps(value))
+        elif isinstance(value, (list, tuple)):
+            write_items(value, level, "[", "]", keyed=False)
+        elif isinstance(value, dict):
+            write_items(value.items(), level, "{", "}", keyed=True)
+        else:
+            fields = dataclass_fields(type(value))
+            if fields is None:
+                raise TypeError(
+                    f"Object of type {type(value).__name__} is not JSON serializable"
+                )
+            write_items(
+                (
+                    (name, item)
+                    for name, omit_if_none in fields
+                    for item in (getattr(value, name),)
+                    if item is not None or not omit_if_none
+                ),
+                level,
+                "{",
+                "}",
+                keyed=True,
+            )
+
+    write_value(model, 0)
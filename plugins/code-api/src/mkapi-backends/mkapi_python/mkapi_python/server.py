@@ -0,0 +1,432 @@
+"""
+Development server generating the API files on demand, see :class:`mkapi_python.server.DevServer`.
+
+The server loads the module tree and the symbol tables once, then serves the modules' documents over HTTP using the
+paths requested by the frontend's `HttpClient.fetchModule` (e.g. `/foo/bar.json` for the module `foo.bar`):
+a module is generated on its first request, and kept in memory for the subsequent ones.
+
+The package's source files are polled for changes: on change, the module tree and the symbol tables are reloaded,
+and only the modules impacted are invalidated: those for which the sources changed, and those whose
+cross-links resolve differently (see :class:`mkapi_python.watch.DependencyGraph`).
+
+Example:
+```
+python -m mkapi_python.server foo --port 8000 --out /tmp/foo-api --cross-linked-packages bar
+```
+The frontend's `dataFolder` is then to be set to `http://localhost:8000`.
+The options of the command line map the fields of :class:`mkapi_python.py_griffe.Configuration` relevant to a
+generation on demand (run with `--help` for the list).
+
+The generated artifacts (see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`) are served as well:
+*  The source assets (see :attr:`mkapi_python.py_griffe.Configuration.source_assets`), written along with the
+   modules' documents.
+*  The search index (see :attr:`mkapi_python.py_griffe.Configuration.search_index`), written each time the package
+   is loaded.
+*  The navigation manifest, written on request: all the modules are generated to compute it.
+"""
+
+import argparse
+import functools
+import http.server
+import json
+import logging
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import cast
+
+import griffe
+from griffe.dataclasses import Module as AstModule
+
+from .artifacts import ARTIFACTS_FOLDER
+from .ast_cache import AstCache
+from .incremental import IncrementalManifest, ManifestEntry
+from .navigation import NAVIGATION_FILENAME
+from .py_griffe import (
+    Configuration,
+    CrossLinkedPackage,
+    Project,
+    generate_module,
+    init_navigation_manifest,
+    init_project,
+    init_search_documents,
+    list_modules,
+    load_cross_linked_packages,
+)
+from .search_index import SearchIndex
+from .stats import GenerationStats
+from .std_links import std_links
+from .watch import (
+    DependencyGraph,
+    changed_files,
+    report_summary,
+    sources_state,
+    touched_modules,
+)
+
+__all__ = [
+    "DevServer",
+    "DevRequestHandler",
+    "serve",
+    "parse_cross_linked_index",
+    "main",
+]
+
+LOGGER = logging.getLogger(__name__)
+"""
+Logger of the development server: the generations and the invalidations are reported at the `INFO` level, the
+reloads that failed at the `WARNING` level.
+"""
+
+
+class DevServer:  # pylint: disable=too-many-instance-attributes
+    """
+    Generates the API files of a package on demand, and invalidates them when the sources change.
+
+    The HTTP layer is provided by :func:`mkapi_python.server.serve`, generations and reloads are serialized using
+    a lock.
+    """
+
+    def __init__(self, objspec: str | Path, config: Configuration):
+        """
+        Load the package, its symbol tables and the cross-linked packages.
+
+        Parameters:
+            objspec: Name or path of the package, as provided to `griffe.load`.
+            config: Configuration, the API files are written in :attr:`mkapi_python.py_griffe.Configuration.out`.
+        """
+        self.objspec = objspec
+        """
+        Name or path of the package.
+        """
+        self.config = config
+        """
+        Configuration.
+        """
+        self.cross_packages: dict[str, CrossLinkedPackage] = load_cross_linked_packages(
+            config=config
+        )
+        """
+        The cross-linked packages, loaded once.
+        """
+        self.documents: dict[str, bytes] = {}
+        """
+        Documents of the modules generated and still valid, keyed by module's path (e.g. `foo.bar`).
+        """
+        self.entries: dict[str, ManifestEntry] = {}
+        """
+        Sources hash and dependencies of the modules in :attr:`mkapi_python.server.DevServer.documents`.
+        """
+        self.graph = DependencyGraph()
+        """
+        Reverse dependencies of the modules in :attr:`mkapi_python.server.DevServer.documents`.
+        """
+        self.lock = threading.Lock()
+        """
+        Lock serializing the generations and the reloads.
+        """
+        self.sources = sources_state(objspec)
+        """
+        State of the source files when the package has been loaded.
+        """
+        project, modules = self._load()
+        self.project: Project = project
+        """
+        The project, including the symbol tables.
+        """
+        self.modules: dict[str, AstModule] = modules
+        """
+        The documented modules, keyed by path.
+        """
+
+    def _load(self) -> tuple[Project, dict[str, AstModule]]:
+        root_ast = cast(AstModule, griffe.load(self.objspec, submodules=True))
+        project = init_project(
+            root_ast=root_ast,
+            config=self.config,
+            stats=GenerationStats(),
+            cross_packages=self.cross_packages,
+        )
+        modules = list_modules(
+            root_ast=root_ast, modules_elements=project.modules_elements
+        )
+        if self.config.search_index:
+            SearchIndex.build(documents=init_search_documents(project)).save(
+                folder=self.config.out
+            )
+        return project, dict(modules)
+
+    def get(self, path: str) -> bytes | None:
+        """
+        Get the document of a module, generated if needed.
+
+        Parameters:
+            path: Path of the module, e.g. `foo.bar`.
+
+        Returns:
+            The document, `None` if the module is not documented.
+        """
+        with self.lock:
+            if path in self.documents:
+                return self.documents[path]
+            if path not in self.modules:
+                return None
+            start = time.perf_counter()
+            generation = generate_module(
+                module=self.modules[path],
+                path=path,
+                project=self.project,
+                manifest=IncrementalManifest(generator="", modules={}),
+            )
+            target = Path(self.config.out, *path.split(".")).with_suffix(".json")
+            self.documents[path] = target.read_bytes()
+            if generation.entry:
+                self.entries[path] = generation.entry
+                self.graph.update(path, generation.entry.dependencies)
+            LOGGER.info(
+                "Generated '%s' in %.0f ms (%s)",
+                path,
+                (time.perf_counter() - start) * 1000,
+                report_summary(generation.report),
+            )
+            return self.documents[path]
+
+    def get_artifact(self, path: str) -> bytes | None:
+        """
+        Get a generated artifact, the navigation manifest being generated (with all the modules) if requested.
+
+        Parameters:
+            path: Path of the artifact relative to the output folder, e.g. `.mkapi/navigation.json`.
+
+        Returns:
+            The artifact's content, `None` if it is not found or not within
+            :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`.
+        """
+        folder = Path(self.config.out, ARTIFACTS_FOLDER).resolve()
+        target = Path(self.config.out, path).resolve()
+        if not target.is_relative_to(folder):
+            return None
+        if path == NAVIGATION_FILENAME:
+            for module in list(self.modules):
+                self.get(module)
+            with self.lock:
+                init_navigation_manifest(
+                    modules=list(self.modules.items()), project=self.project
+                ).save(folder=self.config.out)
+        return target.read_bytes() if target.is_file() else None
+
+    def refresh(self) -> list[str] | None:
+        """
+        Reload the package if its sources changed, and invalidate the modules impacted.
+
+        Returns:
+            The modules invalidated, `None` if the sources did not change.
+        """
+        sources = sources_state(self.objspec)
+        if sources == self.sources:
+            return None
+        with self.lock:
+            files = changed_files(previous=self.sources, current=sources)
+            self.sources = sources
+            project, self.modules = self._load()
+            invalidated = touched_modules(
+                previous=self.project,
+                project=project,
+                modules=self.modules,
+                entries=self.entries,
+                files=files,
+            ) | self.graph.impacted(previous=self.project, project=project)
+            self.project = project
+            for path in invalidated:
+                del self.documents[path]
+                del self.entries[path]
+                self.graph.remove(path)
+            return sorted(invalidated)
+
+    def watch(self, interval: float):
+        """
+        Poll the sources for changes, see :func:`mkapi_python.server.DevServer.refresh`. It does not return.
+
+        Parameters:
+            interval: Interval between two polls, in seconds.
+        """
+        while True:
+            time.sleep(interval)
+            try:
+                invalidated = self.refresh()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                # E.g. a syntax error while editing: the previous state is kept until the next change.
+                LOGGER.warning("Reload failed: %s", error)
+                continue
+            if invalidated is not None:
+                LOGGER.info("Sources changed, modules invalidated: %s", invalidated)
+
+
+class DevRequestHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves the modules' documents of a :class:`mkapi_python.server.DevServer` (e.g. `GET /foo/bar.json`), along with
+    the generated artifacts (e.g. `GET /.mkapi/navigation.json`).
+    """
+
+    def __init__(
+        self,
+        request: socket.socket,
+        client_address: tuple[str, int],
+        server: socketserver.BaseServer,
+        *,
+        server_state: DevServer,
+    ):
+        """
+        Parameters:
+            request: The request's socket, see `http.server.BaseHTTPRequestHandler`.
+            client_address: Address of the client.
+            server: The HTTP server.
+            server_state: The development server providing the documents.
+        """
+        self.server_state = server_state
+        """
+        The development server providing the documents.
+        """
+        super().__init__(request, client_address, server)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        path = self.path.split("?")[0].strip("/")
+        if path.startswith(f"{ARTIFACTS_FOLDER}/"):
+            document = self.server_state.get_artifact(path)
+        elif path.endswith(".json"):
+            document = self.server_state.get(
+                path.removesuffix(".json").replace("/", ".")
+            )
+        else:
+            document = None
+        if document is None:
+            self.send_error(404, f"Not found: '{path}'")
+            return
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            "application/json" if path.endswith(".json") else "text/plain",
+        )
+        self.send_header("Content-Length", str(len(document)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(document)
+
+
+def serve(
+    objspec: str | Path,
+    config: Configuration,
+    host: str = "localhost",
+    port: int = 8000,
+    interval: float = 1.0,
+):
+    """
+    Start a development server, it does not return.
+
+    Parameters:
+        objspec: Name or path of the package, as provided to `griffe.load`.
+        config: Configuration.
+        host: Host of the server.
+        port: Port of the server.
+        interval: Interval between two polls of the sources, in seconds.
+    """
+    state = DevServer(objspec=objspec, config=config)
+    threading.Thread(target=state.watch, args=(interval,), daemon=True).start()
+    handler = functools.partial(DevRequestHandler, server_state=state)
+    with http.server.ThreadingHTTPServer((host, port), handler) as server:
+        LOGGER.info("Serving the API of '%s' on http://%s:%s", objspec, host, port)
+        server.serve_forever()
+
+
+def parse_cross_linked_index(value: str) -> tuple[str, Path]:
+    """
+    Parameters:
+        value: Argument of the command line, as `<package>=<path>`.
+
+    Returns:
+        The package's name and the path of its symbol index.
+    """
+    package, sep, path = value.partition("=")
+    if not sep or not package or not path:
+        raise argparse.ArgumentTypeError(f"Expected '<package>=<path>', got '{value}'")
+    return package, Path(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Development server generating the API files on demand."
+    )
+    parser.add_argument("package", help="Name or path of the package.")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--out", type=Path, required=True, help="Folder of the API files."
+    )
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument(
+        "--cross-linked-packages",
+        nargs="*",
+        default=[],
+        metavar="PACKAGE",
+        help="Other packages to cross-link with.",
+    )
+    parser.add_argument(
+        "--cross-linked-index",
+        type=parse_cross_linked_index,
+        action="append",
+        default=[],
+        metavar="PACKAGE=PATH",
+        help="Symbol index of a cross-linked package (repeatable).",
+    )
+    parser.add_argument(
+        "--external-links",
+        type=Path,
+        help="JSON file of external links, merged with the standard Python links.",
+    )
+    parser.add_argument(
+        "--ast-cache",
+        type=Path,
+        help="Folder of the cache used to load the cross-linked packages.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write the API files without indentation.",
+    )
+    parser.add_argument(
+        "--source-assets",
+        action="store_true",
+        help="Write the implementations as source assets.",
+    )
+    parser.add_argument(
+        "--search-index", action="store_true", help="Write the search index."
+    )
+    args = parser.parse_args()
+    external_links = std_links()
+    if args.external_links:
+        with open(args.external_links, encoding="UTF8") as file:
+            external_links = {**external_links, **json.load(file)}
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    serve(
+        objspec=args.package,
+        config=Configuration(
+            out=args.out,
+            external_links=external_links,
+            cross_linked_packages=args.cross_linked_packages,
+            cross_linked_indexes=dict(args.cross_linked_index),
+            ast_cache=AstCache(folder=args.ast_cache) if args.ast_cache else None,
+            compact=args.compact,
+            source_assets=args.source_assets,
+            search_index=args.search_index,
+        ),
+        host=args.host,
+        port=args.port,
+        interval=args.interval,
+    )
+
+
+if __name__ == "__main__":
+    main()
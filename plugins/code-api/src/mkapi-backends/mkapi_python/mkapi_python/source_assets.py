@@ -0,0 +1,81 @@
+"""
+Source files written as separate assets, see :attr:`mkapi_python.py_griffe.Configuration.source_assets`.
+
+Instead of embedding the implementation of each class & function in the modules' API files
+(:attr:`mkapi_python.models.Code.implementation`), the source file including it is written once in the folder
+:glob:`mkapi_python.source_assets.SOURCE_ASSETS_FOLDER`, named after the hash of its content. Assets are JSON files
+including the source as a string: the frontend fetches them like the modules' API files.
+The entity's code then references the asset (:attr:`mkapi_python.models.Code.implementationAsset`), the
+implementation being the lines :attr:`mkapi_python.models.Code.startLine` to :attr:`mkapi_python.models.Code.endLine`
+(inclusive, starting at 1): the frontend fetches it only when the implementation is expanded.
+
+Assets are content-addressed: identical files are written once, and an asset already written is not written again
+(e.g. by another worker process, or by a previous generation).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from .artifacts import ARTIFACTS_FOLDER, write_atomically
+
+__all__ = ["SOURCE_ASSETS_FOLDER", "source_asset_name", "SourceAssets"]
+
+SOURCE_ASSETS_FOLDER = f"{ARTIFACTS_FOLDER}/sources"
+"""
+Path of the folder including the source assets, relative to :attr:`mkapi_python.py_griffe.Configuration.out`
+(see :glob:`mkapi_python.artifacts.ARTIFACTS_FOLDER`).
+"""
+
+
+def source_asset_name(source: str) -> str:
+    """
+    Parameters:
+        source: Content of the source file.
+
+    Returns:
+        The asset's path relative to the output folder, e.g. `.mkapi/sources/0a1b2c3d4e5f6a7b.json`.
+    """
+    digest = hashlib.sha256(source.encode("UTF8")).hexdigest()[0:16]
+    return f"{SOURCE_ASSETS_FOLDER}/{digest}.json"
+
+
+class SourceAssets:  # pylint: disable=too-few-public-methods
+    """
+    Writes the source assets of a generation, see :attr:`mkapi_python.py_griffe.Project.source_assets`.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        """
+        Parameters:
+            folder: The output folder.
+        """
+        self.folder = folder
+        """
+        The output folder.
+        """
+        self.assets: dict[Path, str] = {}
+        """
+        The assets written (or found already written), keyed by source file's path.
+        """
+
+    def get(self, path: Path, lines: list[str]) -> str:
+        """
+        Get the asset of a source file, written if needed.
+
+        Parameters:
+            path: Path of the source file.
+            lines: Lines of the source file.
+
+        Returns:
+            The asset's path relative to the output folder.
+        """
+        if path in self.assets:
+            return self.assets[path]
+        source = "\n".join(lines)
+        name = source_asset_name(source)
+        target = self.folder / name
+        if not target.exists():
+            write_atomically(target=target, content=json.dumps(source).encode("UTF8"))
+        self.assets[path] = name
+        return name
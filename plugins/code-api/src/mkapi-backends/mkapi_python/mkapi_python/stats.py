@@ -0,0 +1,234 @@
+"""
+Instrumentation of the generation, see :class:`mkapi_python.stats.GenerationStats`.
+
+Wall times are always recorded. Regarding memory:
+*  The maximum resident set size of the process is recorded at the end of each phase (where the `resource`
+   module is available).
+*  The peak of the memory allocated during each phase is recorded if `tracemalloc` is tracing, e.g. when running
+   with `python -X tracemalloc`.
+
+When modules are generated in parallel, the memory of the worker processes is not included.
+"""
+
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple
+
+__all__ = ["PhaseStats", "ModuleStats", "max_rss", "GenerationStats"]
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - e.g. on Windows
+    resource = None  # type: ignore[assignment]
+
+
+class PhaseStats(NamedTuple):
+    """
+    Statistics of a phase of the generation.
+    """
+
+    name: str
+    """
+    Name of the phase.
+    """
+    duration: float
+    """
+    Wall time in seconds.
+    """
+    peak_memory: int | None
+    """
+    Peak of the memory allocated during the phase in bytes (if `tracemalloc` is tracing).
+    """
+    max_rss: int | None
+    """
+    Maximum resident set size of the process in bytes, at the end of the phase.
+    """
+
+
+class ModuleStats(NamedTuple):
+    """
+    Statistics of the generation of a module's API file.
+    """
+
+    path: str
+    """
+    Path of the module.
+    """
+    skipped: bool
+    """
+    Whether the generation has been skipped (incremental generation).
+    """
+    parse_duration: float
+    """
+    Wall time of `parse_module` in seconds.
+    """
+    write_duration: float
+    """
+    Wall time of the serialization & write of the API file in seconds.
+    """
+    entities: dict[str, float]
+    """
+    Wall time in seconds of the parsing of the module's top-level entities (classes, functions, attributes),
+    keyed by entity's path.
+    """
+    navigation_hits: int
+    """
+    Number of navigation paths retrieved from :attr:`mkapi_python.py_griffe.Project.navigation_cache`.
+    """
+    navigation_misses: int
+    """
+    Number of navigation paths resolved and stored in :attr:`mkapi_python.py_griffe.Project.navigation_cache`.
+    """
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "skipped": self.skipped,
+            "parseDuration": self.parse_duration,
+            "writeDuration": self.write_duration,
+            "navigationHits": self.navigation_hits,
+            "navigationMisses": self.navigation_misses,
+        }
+
+
+def max_rss() -> int | None:
+    """
+    Returns:
+        The maximum resident set size of the process in bytes, `None` if not available on the platform.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere.
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+class GenerationStats:
+    """
+    Statistics of a generation, returned by :func:`mkapi_python.py_griffe.generate_api`.
+
+    A pre-existing instance can be provided to `generate_api` to include phases executed beforehand, e.g.:
+    ```
+    stats = GenerationStats()
+    with stats.phase("griffe load"):
+        griffe_ast = griffe.load("foo", submodules=True)
+    generate_api(griffe_ast, config, stats=stats)
+    ```
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance without statistics.
+        """
+        self.phases: list[PhaseStats] = []
+        """
+        Statistics of the phases, in execution order.
+        """
+        self.modules: list[ModuleStats] = []
+        """
+        Statistics of the modules' generation.
+        """
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Context manager recording the statistics of a phase. Phases are not meant to be nested.
+
+        Parameters:
+            name: Name of the phase.
+        """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append(
+                PhaseStats(
+                    name=name,
+                    duration=time.perf_counter() - start,
+                    peak_memory=tracemalloc.get_traced_memory()[1] if tracing else None,
+                    max_rss=max_rss(),
+                )
+            )
+
+    def slowest_modules(self, count: int = 10) -> list[ModuleStats]:
+        """
+        Parameters:
+            count: Maximum number of modules returned.
+
+        Returns:
+            The modules with the longest generation (parse & write).
+        """
+        return sorted(
+            self.modules,
+            key=lambda m: m.parse_duration + m.write_duration,
+            reverse=True,
+        )[0:count]
+
+    def slowest_entities(self, count: int = 10) -> list[tuple[str, float]]:
+        """
+        Parameters:
+            count: Maximum number of entities returned.
+
+        Returns:
+            The top-level entities with the longest parsing, as tuples `(path, duration)`.
+        """
+        entities = [e for m in self.modules for e in m.entities.items()]
+        return sorted(entities, key=lambda e: e[1], reverse=True)[0:count]
+
+    def to_json(self, count: int = 20) -> dict[str, Any]:
+        """
+        Parameters:
+            count: Number of slowest modules & entities included.
+
+        Returns:
+            The JSON report.
+        """
+        generated = [m for m in self.modules if not m.skipped]
+        hits = sum(m.navigation_hits for m in self.modules)
+        misses = sum(m.navigation_misses for m in self.modules)
+        return {
+            "phases": [
+                {
+                    "name": p.name,
+                    "duration": p.duration,
+                    "peakMemory": p.peak_memory,
+                    "maxRss": p.max_rss,
+                }
+                for p in self.phases
+            ],
+            "modules": {
+                "count": len(self.modules),
+                "skipped": len(self.modules) - len(generated),
+                "parseDuration": sum(m.parse_duration for m in generated),
+                "writeDuration": sum(m.write_duration for m in generated),
+            },
+            "navigationCache": {
+                "hits": hits,
+                "misses": misses,
+                "hitRate": hits / (hits + misses) if hits + misses else None,
+            },
+            "slowestModules": [m.to_json() for m in self.slowest_modules(count)],
+            "slowestEntities": [
+                {"path": path, "duration": duration}
+                for path, duration in self.slowest_entities(count)
+            ],
+        }
+
+    def save(self, path: Path, count: int = 20):
+        """
+        Save the JSON report.
+
+        Parameters:
+            path: Path of the report file.
+            count: Number of slowest modules & entities included.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="UTF8") as file:
+            json.dump(self.to_json(count), file, indent=2)
@@ -0,0 +1,98 @@
+"""
+Reverse-segment trie used to find the symbols' path ending with a given suffix,
+see :attr:`mkapi_python.py_griffe.Project.symbols_trie`.
+"""
+
+import bisect
+import itertools
+from typing import Iterable, NamedTuple
+
+__all__ = ["SuffixTrieNode", "SuffixTrie"]
+
+
+class SuffixTrieNode(NamedTuple):
+    """
+    Node of a :class:`mkapi_python.suffix_trie.SuffixTrie`.
+    """
+
+    children: dict[str, "SuffixTrieNode"]
+    """
+    Children nodes, keyed by the previous segment of the paths.
+    """
+    paths: list[int]
+    """
+    Indexes of the paths ending with the segments leading to this node, in insertion order.
+    """
+    reversed_keys: list[str]
+    """
+    Sorted list of the reversed children's keys, computed on first lookup.
+    It allows to find the children's keys ending with a given string using a binary search.
+    """
+
+
+class SuffixTrie:  # pylint: disable=too-few-public-methods
+    """
+    Trie of dot-separated paths indexed from their last segment, e.g. the path `foo.bar.baz` is stored under the
+    nodes `baz` -> `bar` -> `foo`.
+
+    Looking up the paths ending with a suffix takes time proportional to the number of segments of the suffix
+    (plus the size of the result), instead of the number of paths.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """
+        Build the trie.
+
+        Parameters:
+            paths: The paths to index.
+        """
+        self.paths: list[str] = list(paths)
+        """
+        The paths indexed, in insertion order.
+        """
+        self.root = SuffixTrieNode(children={}, paths=[], reversed_keys=[])
+        """
+        Root node.
+        """
+        for index, path in enumerate(self.paths):
+            node = self.root
+            for segment in reversed(path.split(".")):
+                node = node.children.setdefault(
+                    segment, SuffixTrieNode(children={}, paths=[], reversed_keys=[])
+                )
+                node.paths.append(index)
+
+    def ends_with(self, suffix: str) -> list[str]:
+        """
+        Find the paths ending with a suffix, the result is the same as
+        `[p for p in paths if p.endswith(suffix)]`.
+
+        The segments of the suffix are matched as a whole, except the first one that can match the end of a
+        segment (e.g. `bar.baz` matches `foo.bar.baz` and `foo.qux_bar.baz`).
+
+        Parameters:
+            suffix: The suffix.
+
+        Returns:
+            The matching paths, in insertion order.
+        """
+        first, *others = suffix.split(".")
+        node = self.root
+        for segment in reversed(others):
+            child = node.children.get(segment, None)
+            if child is None:
+                return []
+            node = child
+
+        if node.children and not node.reversed_keys:
+            node.reversed_keys.extend(sorted(k[::-1] for k in node.children))
+
+        prefix = first[::-1]
+        keys = node.reversed_keys
+        matches: list[list[int]] = []
+        index = bisect.bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            matches.append(node.children[keys[index][::-1]].paths)
+            index += 1
+        indexes = matches[0] if len(matches) == 1 else sorted(itertools.chain(*matches))
+        return [self.paths[i] for i in indexes]
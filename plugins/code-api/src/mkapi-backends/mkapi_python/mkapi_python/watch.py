@@ -0,0 +1,434 @@
+"""
+Watch mode of the generation, see :func:`mkapi_python.watch.watch_api`.
+
+After a first generation, the package's source files are polled for changes. On change, the modules changed are
+reloaded and the symbol tables updated (see :class:`mkapi_python.reload.PackageReloader`), then only the following
+modules are regenerated:
+*  The modules for which the sources changed (including the new ones).
+*  The modules that looked up entries of the symbol tables whose resolution changed: symbols referenced in
+   declarations (`Code.references`), sphinx cross-links, base classes (`inherits` relations), *etc.*
+   They are found using the reverse dependencies of :class:`mkapi_python.watch.DependencyGraph`.
+
+The regenerations are reported using the logger :glob:`mkapi_python.watch.LOGGER`.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, cast
+
+import griffe
+from griffe.dataclasses import Module as AstModule
+from griffe.finder import ModuleFinder
+
+from .ast_cache import package_files
+from .content_store import ContentStore, publish_modules
+from .incremental import (
+    DependencyKind,
+    IncrementalManifest,
+    ManifestEntry,
+    ModuleDependencies,
+    remove_api_files,
+)
+from .pack import write_pack
+from .py_griffe import (
+    Configuration,
+    Project,
+    generate_modules,
+    generate_project_api,
+    generator_hash,
+    get_module_elements,
+    init_navigation_manifest,
+    init_project,
+    init_search_documents,
+    list_modules,
+    module_source_files,
+    module_sources_hash,
+    resolve_dependency,
+    save_project_symbol_index,
+)
+from .reload import PackageReloader
+from .search_index import SearchIndex
+from .stats import GenerationStats
+
+__all__ = [
+    "sources_state",
+    "changed_files",
+    "report_summary",
+    "DependencyGraph",
+    "touched_modules",
+    "ApiWatcher",
+    "watch_api",
+]
+
+LOGGER = logging.getLogger(__name__)
+"""
+Logger of the watch mode: the regenerations (with the errors' count of each module) are reported at the `INFO` level,
+the reloads that failed at the `WARNING` level.
+"""
+
+
+def sources_state(objspec: str | Path) -> dict[Path, tuple[int, int]]:
+    """
+    Parameters:
+        objspec: Name or path of the package, as provided to `griffe.load`.
+
+    Returns:
+        The modification time & size of the package's source files, keyed by path.
+    """
+    _, spec = ModuleFinder().find_spec(objspec)
+    state: dict[Path, tuple[int, int]] = {}
+    for path in package_files(spec):
+        stat = path.stat()
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def changed_files(
+    previous: dict[Path, tuple[int, int]], current: dict[Path, tuple[int, int]]
+) -> set[Path]:
+    """
+    Parameters:
+        previous: Previous state of the source files, see :func:`mkapi_python.watch.sources_state`.
+        current: Current state of the source files.
+
+    Returns:
+        The files added, removed or modified.
+    """
+    return {
+        path
+        for path in previous.keys() | current.keys()
+        if previous.get(path) != current.get(path)
+    }
+
+
+def report_summary(report: dict[str, Any]) -> str:
+    """
+    Parameters:
+        report: Errors reported while generating a module, see `DocReporter.dump`.
+
+    Returns:
+        A one-line summary of the errors' count.
+    """
+    counts = {key: len(value) for key, value in report.items() if value}
+    if not counts:
+        return "no errors"
+    return ", ".join(f"{key}: {count}" for key, count in counts.items())
+
+
+class DependencyGraph:
+    """
+    Reverse dependencies between the modules and the entries of the symbol tables they looked up,
+    see :class:`mkapi_python.incremental.ModuleDependencies`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty graph.
+        """
+        self.dependents: dict[tuple[DependencyKind, str], set[str]] = {}
+        """
+        Paths of the modules that looked up an entry, keyed by `(kind, key)`.
+        """
+        self.lookups: dict[str, list[tuple[DependencyKind, str]]] = {}
+        """
+        Entries looked up by a module, keyed by module's path.
+        """
+
+    def update(self, module: str, dependencies: ModuleDependencies):
+        """
+        Set the entries looked up by a module, replacing the previous ones.
+
+        Parameters:
+            module: Path of the module.
+            dependencies: The lookups recorded while generating the module.
+        """
+        self.remove(module)
+        self.lookups[module] = list(dependencies.lookups())
+        for lookup in self.lookups[module]:
+            self.dependents.setdefault(lookup, set()).add(module)
+
+    def remove(self, module: str):
+        """
+        Remove a module from the graph.
+
+        Parameters:
+            module: Path of the module.
+        """
+        for lookup in self.lookups.pop(module, []):
+            dependents = self.dependents[lookup]
+            dependents.discard(module)
+            if not dependents:
+                del self.dependents[lookup]
+
+    def impacted(self, previous: Project, project: Project) -> set[str]:
+        """
+        Find the modules that looked up entries resolving differently in two versions of the project.
+
+        Each entry is resolved once, regardless of the number of modules that looked it up.
+
+        Parameters:
+            previous: The project when the modules have been generated.
+            project: The new project.
+
+        Returns:
+            The paths of the modules impacted.
+        """
+        return {
+            module
+            for (kind, key), modules in self.dependents.items()
+            if resolve_dependency(kind, key, previous)
+            != resolve_dependency(kind, key, project)
+            for module in modules
+        }
+
+
+def touched_modules(
+    previous: Project,
+    project: Project,
+    modules: dict[str, AstModule],
+    entries: dict[str, ManifestEntry],
+    files: set[Path],
+) -> set[str]:
+    """
+    Find the generated modules for which the sources changed.
+
+    A module is touched if the list of its documented sub-modules (or their leaf status) changed, or if its sources
+    hash changed.
+    The sources hash is only computed for the modules including one of the files changed.
+
+    Parameters:
+        previous: The project when the modules have been generated.
+        project: The new project.
+        modules: The documented modules of the new project, keyed by path.
+        entries: The generated modules' entries, keyed by path.
+        files: The source files changed, see :func:`mkapi_python.watch.changed_files`.
+
+    Returns:
+        The paths of the modules touched, including the ones removed.
+    """
+
+    def children(p: Project, ast: AstModule) -> list[tuple[str, bool]]:
+        if ast.path not in p.modules_elements:
+            return []
+        return [
+            (m.path, p.leaf_modules.get(m.path, True))
+            for m in p.modules_elements[ast.path].modules
+        ]
+
+    touched = set()
+    for path, entry in entries.items():
+        if path not in modules:
+            touched.add(path)
+            continue
+        ast = modules[path]
+        elements = get_module_elements(
+            ast=ast, modules_elements=project.modules_elements
+        )
+        if children(previous, ast) != children(project, ast):
+            touched.add(path)
+            continue
+        if files.isdisjoint(module_source_files(ast=ast, elements=elements)):
+            continue
+        if entry.sources != module_sources_hash(ast=ast, elements=elements):
+            touched.add(path)
+    return touched
+
+
+class ApiWatcher:
+    """
+    Generates the API files of a package, then regenerates the modules impacted by the changes of its sources.
+
+    The package is reloaded using :class:`mkapi_python.reload.PackageReloader`: usually, only the modules for
+    which the sources changed are visited again.
+    """
+
+    def __init__(self, objspec: str | Path, config: Configuration):
+        """
+        Generate the API files of the package (incrementally, see
+        :attr:`mkapi_python.py_griffe.Configuration.incremental`).
+
+        Parameters:
+            objspec: Name or path of the package, as provided to `griffe.load`.
+            config: Configuration.
+        """
+        self.objspec = objspec
+        """
+        Name or path of the package.
+        """
+        self.config = config._replace(incremental=True)
+        """
+        The configuration, with incremental generation enabled.
+        """
+        self.sources = sources_state(objspec)
+        """
+        State of the source files when last polled, see :func:`mkapi_python.watch.sources_state`.
+        """
+        self.pending: set[Path] = set()
+        """
+        Source files changed, not taken into account yet because the reload failed.
+        """
+        root_ast = cast(AstModule, griffe.load(objspec, submodules=True))
+        stats = GenerationStats()
+        project = init_project(root_ast=root_ast, config=self.config, stats=stats)
+        generate_project_api(project=project, stats=stats)
+        self.reloader = PackageReloader(objspec=objspec, project=project)
+        """
+        Reloads the package, its cross-linked packages are loaded once by the first generation.
+        """
+        self.entries = dict(
+            IncrementalManifest.load(
+                folder=self.config.out, generator=generator_hash(self.config)
+            ).modules
+        )
+        """
+        Entries of the generated modules, keyed by path.
+        """
+        self.graph = DependencyGraph()
+        """
+        Reverse dependencies of the generated modules.
+        """
+        for path, entry in self.entries.items():
+            self.graph.update(path, entry.dependencies)
+
+    def poll(self) -> bool:
+        """
+        Check the source files, and regenerate the modules impacted if some of them changed.
+
+        Returns:
+            Whether source files changed.
+        """
+        current = sources_state(self.objspec)
+        files = changed_files(previous=self.sources, current=current)
+        self.sources = current
+        if files:
+            self.regenerate(files=files | self.pending)
+        return bool(files)
+
+    def regenerate(self, files: set[Path]):
+        """
+        Reload the package and regenerate the modules impacted by changes of its source files.
+
+        The API files of the modules removed are deleted.
+        If the reload fails (*e.g.* syntax error), the previous state is kept until the next change.
+
+        Parameters:
+            files: The source files changed, see :func:`mkapi_python.watch.changed_files`.
+        """
+        start = time.perf_counter()
+        previous = self.reloader.project
+        try:
+            project = self.reloader.reload(files=files)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            LOGGER.warning("Reload failed: %s", error)
+            self.pending = files
+            return
+        self.pending = set()
+        modules = dict(
+            list_modules(
+                root_ast=project.root_ast, modules_elements=project.modules_elements
+            )
+        )
+        regenerated = (
+            touched_modules(
+                previous=previous,
+                project=project,
+                modules=modules,
+                entries=self.entries,
+                files=files,
+            )
+            | self.graph.impacted(previous=previous, project=project)
+            | (modules.keys() - self.entries.keys())
+        )
+        removed = [path for path in self.entries if path not in modules]
+        for path in removed:
+            del self.entries[path]
+            self.graph.remove(path)
+        remove_api_files(folder=self.config.out, modules=removed)
+        generations = generate_modules(
+            modules=[(path, modules[path]) for path in modules if path in regenerated],
+            project=project,
+            manifest=IncrementalManifest(
+                generator=generator_hash(self.config), modules={}
+            ),
+        )
+        for generation in generations:
+            if generation.entry:
+                self.entries[generation.path] = generation.entry
+                self.graph.update(generation.path, generation.entry.dependencies)
+            LOGGER.info("%s: %s", generation.path, report_summary(generation.report))
+        self.save_artifacts(project=project, modules=modules)
+        LOGGER.info(
+            "%d file(s) changed, %d module(s) regenerated in %.0f ms (%s)",
+            len(files),
+            len(generations),
+            (time.perf_counter() - start) * 1000,
+            (
+                f"{len(self.reloader.reloaded)} module(s) reloaded"
+                if self.reloader.reloaded is not None
+                else "package reloaded"
+            ),
+        )
+
+    def save_artifacts(self, project: Project, modules: dict[str, AstModule]):
+        """
+        Write the artifacts covering all the modules: symbol index, pack, content store, navigation manifest,
+        search index and incremental manifest.
+
+        Parameters:
+            project: The project.
+            modules: The documented modules, keyed by path.
+        """
+        config = self.config
+        save_project_symbol_index(project)
+        if config.pack:
+            write_pack(
+                folder=config.out,
+                modules=[path.replace(".", "/") for path in modules],
+                compression=config.pack_compression,
+            )
+        if config.content_store:
+            publish_modules(
+                folder=config.out,
+                store=ContentStore(folder=config.content_store),
+                modules=[path.replace(".", "/") for path in modules],
+            )
+        init_navigation_manifest(modules=list(modules.items()), project=project).save(
+            folder=config.out
+        )
+        if config.search_index:
+            SearchIndex.build(documents=init_search_documents(project)).save(
+                folder=config.out
+            )
+        IncrementalManifest(
+            generator=generator_hash(config), modules=self.entries
+        ).save(folder=config.out)
+
+
+def watch_api(
+    objspec: str | Path,
+    config: Configuration,
+    interval: float = 1.0,
+    iterations: int | None = None,
+):
+    """
+    Generate the API files of a package, then regenerate the modules impacted each time its sources change,
+    see :class:`mkapi_python.watch.ApiWatcher`.
+
+    The first generation is incremental (see :attr:`mkapi_python.py_griffe.Configuration.incremental`):
+    the manifest is kept up to date along the regenerations, a subsequent run only regenerates the modules impacted
+    by the changes done in between.
+    The cross-linked packages are loaded once, by the first generation, and reused by the regenerations.
+
+    Parameters:
+        objspec: Name or path of the package, as provided to `griffe.load`.
+        config: Configuration.
+        interval: Interval between two polls of the sources, in seconds.
+        iterations: Number of polls before returning, watch forever if `None`.
+    """
+    watcher = ApiWatcher(objspec=objspec, config=config)
+    iteration = 0
+    while iterations is None or iteration < iterations:
+        iteration += 1
+        time.sleep(interval)
+        watcher.poll()
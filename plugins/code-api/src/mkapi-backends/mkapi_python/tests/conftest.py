@@ -0,0 +1,108 @@
+"""
+Fixtures shared by the tests: a small package written in a temporary folder, loaded with griffe.
+"""
+
+import textwrap
+from pathlib import Path
+from typing import cast
+
+import griffe
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+TOY_PACKAGE = "toypkg"
+"""
+Name of the package created by the fixture :func:`toy_package`.
+"""
+
+TOY_SOURCES = {
+    "__init__.py": '''
+        """
+        The toy package, see :class:`toypkg.models.foo.Foo`.
+        """
+        from .models import *
+        ''',
+    "models/__init__.py": '''
+        """
+        Models of the toy package.
+        """
+
+        from .foo import *
+        ''',
+    "models/foo.py": '''
+        """
+        The foo model.
+        """
+
+
+        class Foo:
+            """
+            A foo, see :func:`toypkg.models.foo.make_foo`.
+            """
+
+            def start(self) -> None:
+                """
+                Run the :class:`toypkg.models.foo.Foo`, see :class:`Unknown`.
+                """
+
+            def stop(self) -> None:
+                """
+                Run the :class:`toypkg.models.foo.Foo`, see :class:`Unknown`.
+                """
+
+
+        def make_foo() -> Foo:
+            """
+            Create a :class:`toypkg.models.foo.Foo`.
+            """
+            return Foo()
+        ''',
+}
+"""
+Sources of the package created by the fixture :func:`toy_package`, keyed by path relative to the package's folder.
+"""
+
+
+def write_package(folder: Path, name: str, sources: dict[str, str]) -> Path:
+    """
+    Write a package.
+
+    Parameters:
+        folder: The folder including the package.
+        name: Name of the package.
+        sources: Sources, keyed by path relative to the package's folder.
+
+    Returns:
+        The folder including the package.
+    """
+    for path, source in sources.items():
+        target = folder / name / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(textwrap.dedent(source).lstrip(), encoding="UTF8")
+    return folder
+
+
+def load_package(folder: Path, name: str) -> AstModule:
+    """
+    Write and load a copy of the toy package (see :glob:`TOY_SOURCES`) under another name.
+
+    Parameters:
+        folder: The folder including the package.
+        name: Name of the package.
+
+    Returns:
+        The package's AST.
+    """
+    sources = {
+        path: source.replace(TOY_PACKAGE, name) for path, source in TOY_SOURCES.items()
+    }
+    write_package(folder, name, sources)
+    return cast(AstModule, griffe.load(name, submodules=True, search_paths=[folder]))
+
+
+@pytest.fixture
+def toy_package(tmp_path: Path) -> AstModule:
+    """
+    The toy package, see :glob:`TOY_SOURCES`.
+    """
+    return load_package(tmp_path / "src", TOY_PACKAGE)
@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+from conftest import load_package
+
+from mkapi_python import (
+    ARTIFACTS_FOLDER,
+    NAVIGATION_FILENAME,
+    SEARCH_INDEX_FOLDER,
+    SYMBOL_INDEX_FILENAME,
+    Configuration,
+    generate_api,
+)
+
+
+def test_artifacts_do_not_collide_with_modules(tmp_path: Path):
+    out = tmp_path / "out"
+    for name in ["sources", "navigation", "search"]:
+        root_ast = load_package(tmp_path / "src", name)
+        generate_api(
+            root_ast, Configuration(out=out, source_assets=True, search_index=True)
+        )
+
+        models = json.loads((out / name / "models.json").read_text())
+        (foo,) = [t for t in models["types"] if t["name"] == "Foo"]
+        asset = foo["code"]["implementationAsset"]
+        assert asset.startswith(f"{ARTIFACTS_FOLDER}/")
+        assert (out / asset).is_file()
+        assert json.loads((out / f"{name}.json").read_text())["name"] == name
+        assert NAVIGATION_FILENAME.startswith(f"{ARTIFACTS_FOLDER}/")
+        navigation = json.loads((out / NAVIGATION_FILENAME).read_text())
+        assert navigation["root"] == name
+        assert SEARCH_INDEX_FOLDER.startswith(f"{ARTIFACTS_FOLDER}/")
+        index = json.loads((out / SEARCH_INDEX_FOLDER / "index.json").read_text())
+        assert index["documentsCount"] > 0
+        assert SYMBOL_INDEX_FILENAME.startswith(f"{ARTIFACTS_FOLDER}/")
+        index = json.loads((out / SYMBOL_INDEX_FILENAME).read_text())
+        assert index["package"] == name
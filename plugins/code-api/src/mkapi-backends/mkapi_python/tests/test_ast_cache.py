@@ -0,0 +1,64 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+from conftest import TOY_PACKAGE, load_package
+
+from mkapi_python import AstCache
+
+
+@pytest.fixture
+def package_src(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    src = tmp_path / "src"
+    load_package(src, TOY_PACKAGE)
+    monkeypatch.syspath_prepend(str(src))
+    return src
+
+
+def test_ast_cache_hit_and_miss(tmp_path: Path, package_src: Path):
+    folder = tmp_path / "cache"
+
+    first = AstCache(folder=folder).load(TOY_PACKAGE)
+    cache = AstCache(folder=folder)
+    second = cache.load(TOY_PACKAGE)
+
+    assert cache.hits == [TOY_PACKAGE] and cache.misses == []
+    assert second.as_json(full=True) == first.as_json(full=True)
+    assert folder.stat().st_mode & 0o777 == 0o700
+
+    source = package_src / TOY_PACKAGE / "models" / "foo.py"
+    source.write_text(
+        source.read_text(encoding="UTF8") + "\n\nBAR = 1\n", encoding="UTF8"
+    )
+    os.utime(source, ns=(time.time_ns(), time.time_ns() + 10**9))
+    cache = AstCache(folder=folder)
+    third = cache.load(TOY_PACKAGE)
+
+    assert cache.misses == [TOY_PACKAGE]
+    assert "BAR" in third["models.foo"].members
+
+
+def test_ast_cache_corrupted_entry(tmp_path: Path, package_src: Path):
+    folder = tmp_path / "cache"
+    AstCache(folder=folder).load(TOY_PACKAGE)
+    (entry,) = folder.glob("*.pickle")
+    entry.write_bytes(b"not a pickle")
+
+    cache = AstCache(folder=folder)
+    cache.load(TOY_PACKAGE)
+
+    assert cache.misses == [TOY_PACKAGE]
+    assert AstCache(folder=folder).load(TOY_PACKAGE) is not None
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_ast_cache_ignores_shared_folder(tmp_path: Path, package_src: Path):
+    folder = tmp_path / "cache"
+    AstCache(folder=folder).load(TOY_PACKAGE)
+    folder.chmod(0o777)
+
+    cache = AstCache(folder=folder)
+    cache.load(TOY_PACKAGE)
+
+    assert cache.misses == [TOY_PACKAGE]
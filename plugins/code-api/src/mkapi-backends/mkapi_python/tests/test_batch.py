@@ -0,0 +1,77 @@
+import multiprocessing
+from pathlib import Path
+from typing import cast
+
+import griffe
+import pytest
+from conftest import TOY_PACKAGE, TOY_SOURCES, write_package
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, generate_api, generate_batch_api
+
+PACKAGES = {"toya": "toyb", "toyb": "toya"}
+"""
+The packages of the batch, along with the package they cross-link.
+"""
+
+
+def write_packages(src: Path):
+    for name, other in PACKAGES.items():
+        sources = {
+            path: source.replace(TOY_PACKAGE, name)
+            for path, source in TOY_SOURCES.items()
+        }
+        sources["models/foo.py"] += f'''
+
+        def make_other() -> "{other}.models.foo.Foo":
+            """
+            Create a :class:`{other}.models.foo.Foo`.
+            """
+        '''
+        write_package(src, name, sources)
+
+
+def api_files(folder: Path) -> dict[Path, bytes]:
+    return {p.relative_to(folder): p.read_bytes() for p in folder.rglob("*.json")}
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_matches_separate_generations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, jobs: int
+):
+    if jobs > 1 and "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("fork unavailable")
+    src = tmp_path / "src"
+    write_packages(src)
+    monkeypatch.syspath_prepend(str(src))
+
+    def config(name: str, folder: str) -> Configuration:
+        return Configuration(
+            out=tmp_path / folder / name, cross_linked_packages=[PACKAGES[name]]
+        )
+
+    for name in PACKAGES:
+        generate_api(
+            cast(AstModule, griffe.load(name, submodules=True)),
+            config(name, "separate"),
+        )
+    stats = generate_batch_api(
+        builds=[(name, config(name, "batch")) for name in PACKAGES], jobs=jobs
+    )
+
+    assert sorted(stats) == sorted(PACKAGES)
+    for name in PACKAGES:
+        batch = api_files(tmp_path / "batch" / name)
+        assert batch == api_files(tmp_path / "separate" / name)
+        models = batch[Path(name, "models.json")].decode("UTF8")
+        assert f"@nav[{PACKAGES[name]}]/models.foo.Foo" in models
+
+
+def test_batch_duplicated_package(tmp_path: Path):
+    with pytest.raises(ValueError, match="built more than once"):
+        generate_batch_api(
+            builds=[
+                ("toya", Configuration(out=tmp_path / "a")),
+                ("toya", Configuration(out=tmp_path / "b")),
+            ]
+        )
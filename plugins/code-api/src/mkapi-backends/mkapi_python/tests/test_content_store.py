@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+from typing import cast
+
+import griffe
+from conftest import TOY_PACKAGE, load_package
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import (
+    STORE_MANIFEST_FILENAME,
+    Configuration,
+    ContentStore,
+    StoreManifest,
+    generate_api,
+    publish_modules,
+)
+
+
+def test_publish_modules(tmp_path: Path):
+    out = tmp_path / "out"
+    (out / "toypkg").mkdir(parents=True)
+    (out / "toypkg.json").write_text('{"name": "toypkg"}')
+    (out / "toypkg" / "models.json").write_text('{"name": "models"}')
+    store = ContentStore(folder=tmp_path / "store")
+
+    umask = os.umask(0o022)
+    try:
+        manifest = publish_modules(
+            folder=out, store=store, modules=["toypkg", "toypkg/models"]
+        )
+    finally:
+        os.umask(umask)
+
+    assert StoreManifest.load(out) == manifest
+    assert (out / STORE_MANIFEST_FILENAME).is_file()
+    manifest_folder = (out / STORE_MANIFEST_FILENAME).parent
+    for module, blob in manifest.modules.items():
+        path = manifest_folder / manifest.store / blob
+        assert path.read_bytes() == (out / f"{module}.json").read_bytes()
+        assert path.stat().st_mode & 0o777 == 0o644
+    assert sorted(p.name for p in store.folder.iterdir()) == sorted(
+        manifest.modules.values()
+    )
+
+
+def test_content_store_deduplicates_versions(tmp_path: Path):
+    src, store = tmp_path / "src", tmp_path / "store"
+    generate_api(
+        load_package(src, TOY_PACKAGE),
+        Configuration(out=tmp_path / "v1", content_store=store),
+    )
+    source = src / TOY_PACKAGE / "models" / "foo.py"
+    source.write_text(
+        source.read_text(encoding="UTF8").replace("Create a", "Build a"),
+        encoding="UTF8",
+    )
+    root_ast = cast(AstModule, griffe.load(TOY_PACKAGE, search_paths=[src]))
+    generate_api(root_ast, Configuration(out=tmp_path / "v2", content_store=store))
+
+    v1, v2 = StoreManifest.load(tmp_path / "v1"), StoreManifest.load(tmp_path / "v2")
+
+    assert v1.modules[TOY_PACKAGE] == v2.modules[TOY_PACKAGE]
+    assert v1.modules[f"{TOY_PACKAGE}/models"] != v2.modules[f"{TOY_PACKAGE}/models"]
+    assert sorted(p.name for p in store.iterdir()) == sorted(
+        {*v1.modules.values(), *v2.modules.values()}
+    )
+
+    content_store = ContentStore(folder=store)
+    blob = content_store.put(source=tmp_path / "v2" / f"{TOY_PACKAGE}.json")
+    assert blob == v1.modules[TOY_PACKAGE]
+    assert (content_store.written, content_store.reused) == (0, 1)
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, GenerationStats, init_project, replace_links
+
+
+def test_replace_links_shared_by_siblings(toy_package: AstModule, tmp_path: Path):
+    project = init_project(
+        root_ast=toy_package,
+        config=Configuration(out=tmp_path / "out"),
+        stats=GenerationStats(),
+        cross_packages={},
+    )
+    foo = toy_package["models.foo.Foo"]
+    start, stop = foo["start"], foo["stop"]
+    assert start.docstring.value == stop.docstring.value
+    text = start.docstring.value
+
+    first = replace_links(text, parent=start.canonical_path, project=project)
+    misses = project.docstring_cache.misses
+    second = replace_links(text, parent=stop.canonical_path, project=project)
+
+    assert second == first
+    assert "mkapi-api-link" in first
+    assert project.docstring_cache.hits == 1
+    assert project.docstring_cache.misses == misses
+    assert set(project.reporter.sphinx_links_unresolved) == {
+        f"{start.canonical_path}=>:class:`Unknown`",
+        f"{stop.canonical_path}=>:class:`Unknown`",
+    }
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import cast
+
+import griffe
+from conftest import TOY_PACKAGE, load_package, write_package
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import INCREMENTAL_MANIFEST_FILENAME, Configuration, generate_api
+
+
+def test_incremental_removes_api_files(tmp_path: Path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    config = Configuration(out=out, incremental=True)
+    write_package(src, TOY_PACKAGE, {"extra/__init__.py": '"""\nThe extra.\n"""\n'})
+    generate_api(load_package(src, TOY_PACKAGE), config)
+    assert (out / TOY_PACKAGE / "extra.json").is_file()
+    assert (out / INCREMENTAL_MANIFEST_FILENAME).is_file()
+
+    (src / TOY_PACKAGE / "extra" / "__init__.py").unlink()
+    (src / TOY_PACKAGE / "extra").rmdir()
+    generate_api(load_package(src, TOY_PACKAGE), config)
+
+    assert not (out / TOY_PACKAGE / "extra.json").exists()
+    assert (out / TOY_PACKAGE / "models.json").is_file()
+
+
+def test_incremental_regenerates_changed_modules(tmp_path: Path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    config = Configuration(out=out, incremental=True)
+    generate_api(load_package(src, TOY_PACKAGE), config)
+
+    stats = generate_api(load_package(src, TOY_PACKAGE), config)
+    assert [(m.path, m.skipped) for m in stats.modules] == [
+        (TOY_PACKAGE, True),
+        (f"{TOY_PACKAGE}.models", True),
+    ]
+
+    source = src / TOY_PACKAGE / "models" / "foo.py"
+    source.write_text(
+        source.read_text(encoding="UTF8").replace("Create a", "Build a"),
+        encoding="UTF8",
+    )
+    root_ast = cast(AstModule, griffe.load(TOY_PACKAGE, search_paths=[src]))
+    stats = generate_api(root_ast, config)
+
+    assert [(m.path, m.skipped) for m in stats.modules] == [
+        (TOY_PACKAGE, True),
+        (f"{TOY_PACKAGE}.models", False),
+    ]
+    generate_api(root_ast, Configuration(out=tmp_path / "full"))
+    for name in [f"{TOY_PACKAGE}.json", f"{TOY_PACKAGE}/models.json"]:
+        assert (out / name).read_bytes() == (tmp_path / "full" / name).read_bytes()
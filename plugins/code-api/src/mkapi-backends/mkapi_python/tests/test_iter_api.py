@@ -0,0 +1,36 @@
+import io
+from pathlib import Path
+
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, DocReporter, dump_model, generate_api, iter_api
+
+
+def test_iter_api_matches_generate_api(toy_package: AstModule, tmp_path: Path):
+    out = tmp_path / "out"
+    generate_api(toy_package, Configuration(out=tmp_path / "generated"))
+
+    modules = dict(
+        iter_api(toy_package, Configuration(out=out), reporter=DocReporter())
+    )
+
+    assert list(modules) == ["toypkg", "toypkg.models"]
+    assert not out.exists()
+    for path, module in modules.items():
+        stream = io.StringIO()
+        dump_model(module, stream, indent=4)
+        expected = Path(tmp_path / "generated", *path.split(".")).with_suffix(".json")
+        assert stream.getvalue() == expected.read_text(encoding="UTF8")
+
+
+def test_iter_api_unsupported_options(toy_package: AstModule, tmp_path: Path):
+    out = tmp_path / "out"
+    config = Configuration(out=out, source_assets=True, pack=True)
+
+    with pytest.raises(
+        ValueError, match="not supported by iter_api .*: pack, source_assets"
+    ):
+        iter_api(toy_package, config)
+
+    assert not out.exists()
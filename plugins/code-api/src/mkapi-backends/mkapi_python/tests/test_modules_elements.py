@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import cast
+
+import griffe
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import (
+    Configuration,
+    GenerationStats,
+    extract_module,
+    init_leaf_modules,
+    init_modules_elements,
+    init_project,
+    init_symbols,
+    is_leaf_module,
+    list_modules,
+)
+
+
+def test_modules_elements_match_extraction():
+    root_ast = cast(AstModule, griffe.load("griffe", submodules=True))
+
+    modules_elements = init_modules_elements(root_ast=root_ast)
+
+    modules = list_modules(root_ast=root_ast)
+    assert list(modules_elements) == [path for path, _ in modules]
+    for path, module in modules:
+        assert modules_elements[path] == extract_module(ast=module)
+    assert list_modules(root_ast=root_ast, modules_elements=modules_elements) == modules
+    assert init_symbols(
+        root_ast=root_ast, modules_elements=modules_elements
+    ) == init_symbols(root_ast=root_ast)
+
+
+def test_leaf_modules_match_tree(toy_package: AstModule, tmp_path: Path):
+    project = init_project(
+        root_ast=toy_package,
+        config=Configuration(out=tmp_path),
+        stats=GenerationStats(),
+        cross_packages={},
+    )
+
+    leaf_modules = init_leaf_modules(modules_elements=project.modules_elements)
+
+    assert leaf_modules == {"toypkg": False, "toypkg.models": True}
+    for path, leaf in leaf_modules.items():
+        assert is_leaf_module(path, project._replace(leaf_modules={})) == leaf
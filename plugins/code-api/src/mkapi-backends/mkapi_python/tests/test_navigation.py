@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import (
+    NAVIGATION_FILENAME,
+    ChildModule,
+    Configuration,
+    Semantic,
+    content_hash,
+    generate_api,
+)
+
+
+def test_navigation_manifest(toy_package: AstModule, tmp_path: Path):
+    out = tmp_path / "out"
+    extra = ChildModule(
+        name="Extra",
+        path="toypkg/extra",
+        isLeaf=True,
+        semantic=Semantic(role="module", labels=[], attributes={}, relations={}),
+        navPath="@nav/extra",
+    )
+    generate_api(
+        toy_package,
+        Configuration(out=out, extra_modules={"toypkg": [extra], "unknown": [extra]}),
+    )
+
+    manifest = json.loads((out / NAVIGATION_FILENAME).read_text(encoding="UTF8"))
+
+    assert manifest["root"] == "toypkg"
+    assert list(manifest["modules"]) == ["toypkg", "toypkg.models"]
+    assert manifest["modules"]["toypkg"]["navPath"] is None
+    assert list(manifest["extraModules"]) == ["toypkg"]
+    for path, node in manifest["modules"].items():
+        file = Path(out, *path.split(".")).with_suffix(".json")
+        assert node["hash"] == content_hash(file)
+        document = json.loads(file.read_text(encoding="UTF8"))
+        assert node["name"] == document["name"]
+        documented = [
+            c for c in document["children"] if c["path"] in manifest["modules"]
+        ]
+        assert node["children"] == [c["path"] for c in documented]
+        for child in documented:
+            assert manifest["modules"][child["path"]]["isLeaf"] == child["isLeaf"]
+            assert manifest["modules"][child["path"]]["navPath"] == child["navPath"]
@@ -0,0 +1,65 @@
+from pathlib import Path
+from typing import cast
+
+import griffe
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import (
+    Configuration,
+    DocReporter,
+    GenerationStats,
+    Project,
+    empty_dependencies,
+    init_project,
+    navigation_path,
+    resolve_navigation_path,
+    std_links,
+)
+
+
+def init_toy_project(root_ast: AstModule, out: Path) -> Project:
+    return init_project(
+        root_ast=root_ast,
+        config=Configuration(out=out, external_links=std_links()),
+        stats=GenerationStats(),
+        cross_packages={},
+    )
+
+
+def test_navigation_path_hits_replay_side_effects(
+    toy_package: AstModule, tmp_path: Path
+):
+    project = init_toy_project(toy_package, tmp_path)
+    cache = project.navigation_cache
+    calls = [("toypkg.models.foo.Foo", "Foo"), ("toypkg.missing.Bar", "Bar")]
+
+    results, recorded = [], []
+    for _ in range(2):
+        reporter, dependencies = DocReporter(), empty_dependencies()
+        scoped = project._replace(reporter=reporter, dependencies=dependencies)
+        results.append([navigation_path(p, n, project=scoped) for p, n in calls])
+        assert reporter.internal_cross_ref_errors == {"toypkg.missing.Bar"}
+        recorded.append(dependencies)
+
+    assert results[0] == results[1]
+    assert recorded[0] == recorded[1] and recorded[0].symbols
+    assert results[0][0] is not None and results[0][1] is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_navigation_path_matches_resolution(tmp_path: Path):
+    root_ast = cast(AstModule, griffe.load("griffe", submodules=True))
+    project = init_toy_project(root_ast, tmp_path)
+    paths = [
+        (path, path.split(".")[-1])
+        for path in [*project.all_symbols, *project.all_aliases]
+    ]
+
+    for _ in range(2):
+        for path, name in paths:
+            assert (
+                navigation_path(path, name, project=project, report_error=False)
+                == resolve_navigation_path(py_path=path, name=name, project=project)[0]
+            )
+
+    assert project.navigation_cache.hits >= len(set(paths))
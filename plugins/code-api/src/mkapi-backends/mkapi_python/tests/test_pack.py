@@ -0,0 +1,52 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import (
+    PACK_FILENAME,
+    Configuration,
+    PackCompression,
+    generate_api,
+    read_pack_index,
+    read_packed_module,
+)
+
+MODULES = ["toypkg", "toypkg/models"]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_pack_round_trip(
+    toy_package: AstModule, tmp_path: Path, compression: PackCompression | None
+):
+    out = tmp_path / "out"
+    generate_api(
+        toy_package, Configuration(out=out, pack=True, pack_compression=compression)
+    )
+
+    index = read_pack_index(out)
+
+    assert index.compression == compression
+    assert sorted(index.modules) == MODULES
+    for module in MODULES:
+        expected = json.loads((out / f"{module}.json").read_text(encoding="UTF8"))
+        assert read_packed_module(out, index, module) == expected
+    with pytest.raises(KeyError, match="Module 'toypkg/unknown' not found"):
+        read_packed_module(out, index, "toypkg/unknown")
+
+
+def test_gzip_pack_decompresses_whole(toy_package: AstModule, tmp_path: Path):
+    out = tmp_path / "out"
+    generate_api(
+        toy_package, Configuration(out=out, pack=True, pack_compression="gzip")
+    )
+
+    index = read_pack_index(out)
+    content = gzip.decompress((out / f"{PACK_FILENAME}.gz").read_bytes())
+
+    assert content == b"".join(
+        (out / f"{module}.json").read_bytes()
+        for module, _ in sorted(index.modules.items(), key=lambda item: item[1][0])
+    )
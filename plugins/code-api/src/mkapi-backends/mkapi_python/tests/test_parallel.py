@@ -0,0 +1,38 @@
+import multiprocessing
+from pathlib import Path
+from typing import cast
+
+import griffe
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, generate_api, std_links
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="fork unavailable"
+)
+def test_parallel_generation_is_identical(tmp_path: Path):
+    root_ast = cast(AstModule, griffe.load("griffe", submodules=True))
+    for jobs in [1, 3]:
+        generate_api(
+            root_ast,
+            Configuration(
+                out=tmp_path / f"jobs-{jobs}", external_links=std_links(), jobs=jobs
+            ),
+        )
+
+    serial = sorted(
+        p.relative_to(tmp_path / "jobs-1")
+        for p in (tmp_path / "jobs-1").rglob("*.json")
+    )
+    parallel = sorted(
+        p.relative_to(tmp_path / "jobs-3")
+        for p in (tmp_path / "jobs-3").rglob("*.json")
+    )
+    assert len(serial) > 3
+    assert parallel == serial
+    for path in serial:
+        assert (tmp_path / "jobs-3" / path).read_bytes() == (
+            tmp_path / "jobs-1" / path
+        ).read_bytes(), path
@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import cast
+
+import griffe
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+from benchmarks.replace_links import collect_texts, previous_replace_links, safe_call
+from mkapi_python import (
+    Configuration,
+    DocReporter,
+    GenerationStats,
+    init_project,
+    rewrite_links,
+    std_links,
+)
+
+
+@pytest.mark.parametrize("package", ["griffe", "mkapi_python"])
+def test_rewrite_links_golden_corpus(package: str):
+    root_ast = cast(AstModule, griffe.load(package, submodules=True))
+    project = init_project(
+        root_ast=root_ast,
+        config=Configuration(out=Path(), external_links=std_links()),
+        stats=GenerationStats(),
+        cross_packages={},
+    )
+    texts: list[tuple[str, str]] = []
+    collect_texts(root_ast, texts)
+    assert texts
+
+    outputs = {}
+    reports = {}
+    for name, function in [
+        ("previous", previous_replace_links),
+        ("single-pass", rewrite_links),
+    ]:
+        reporter = DocReporter()
+        p = project._replace(reporter=reporter)
+        outputs[name] = [
+            safe_call(function, text, parent=parent, project=p)
+            for text, parent in texts
+        ]
+        reports[name] = reporter.dump()
+
+    assert outputs["single-pass"] == outputs["previous"]
+    assert reports["single-pass"] == reports["previous"]
+
+
+def test_rewrite_links_code_blocks(toy_package: AstModule, tmp_path: Path):
+    project = init_project(
+        root_ast=toy_package,
+        config=Configuration(out=tmp_path),
+        stats=GenerationStats(),
+        cross_packages={},
+    )
+    link = ":class:`toypkg.models.foo.Foo`"
+    # More than 10 code blocks: the placeholders of the previous implementation collided (`md_placeholder_1` is a
+    # prefix of `md_placeholder_10`).
+    blocks = [f"```\n{link} {i}\n```" for i in range(12)]
+    text = f"{link}\n" + "\n".join(blocks)
+
+    rewritten = rewrite_links(text, parent="toypkg", project=project)
+
+    assert rewritten.endswith("\n".join(blocks))
+    assert rewritten.startswith("<mkapi-api-link")
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from mkapi_python import (
+    SEARCH_INDEX_FOLDER,
+    SearchDocument,
+    SearchIndex,
+    decode_postings,
+    encode_postings,
+    front_code,
+    front_decode,
+)
+
+TERMS = sorted(
+    [
+        "client",
+        "clients",
+        "clone",
+        "close",
+        "closure",
+        "http",
+        "https",
+        "load",
+        "loader",
+    ]
+)
+
+DOCUMENTS = [
+    SearchDocument(
+        path=f"toypkg.module_{i}.HttpClient{i}",
+        kind="class",
+        navigation_path=f"toypkg.module_{i}",
+        summary=f"Client number {i}.",
+    )
+    for i in range(10)
+]
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 4, 16])
+def test_front_code_round_trip(block_size: int):
+    prefixes, suffixes = front_code(TERMS, block_size=block_size)
+
+    assert front_decode(prefixes, suffixes) == TERMS
+    assert all(prefixes[i] == 0 for i in range(0, len(TERMS), block_size))
+    assert [suffixes[i] for i in range(0, len(TERMS), block_size)] == TERMS[
+        ::block_size
+    ]
+
+
+def test_postings_round_trip():
+    postings = [(0, 1), (3, 6), (4, 4), (1027, 7)]
+
+    assert decode_postings(encode_postings(postings)) == postings
+
+
+def test_search_index_round_trip(tmp_path: Path):
+    index = SearchIndex.build(documents=DOCUMENTS, shard_size=8, documents_shard_size=4)
+    index.save(tmp_path)
+
+    loaded = SearchIndex.load(tmp_path)
+
+    assert loaded == index
+    assert len(loaded.shards) > 1
+    folder = tmp_path / SEARCH_INDEX_FOLDER
+    assert sorted(path.name for path in folder.glob("documents-*.json")) == [
+        "documents-0.json",
+        "documents-1.json",
+        "documents-2.json",
+    ]
+    postings = [
+        posting
+        for shard in loaded.shards
+        for term, encoded in zip(shard.terms, shard.postings)
+        if term == "client"
+        for posting in decode_postings(encoded)
+    ]
+    assert [position for position, _ in postings] == list(range(len(DOCUMENTS)))
+
+
+def test_search_index_save_removes_stale_files(tmp_path: Path):
+    SearchIndex.build(documents=DOCUMENTS, shard_size=8, documents_shard_size=4).save(
+        tmp_path
+    )
+    folder = tmp_path / SEARCH_INDEX_FOLDER
+    (folder / "documents.json").write_text("[]", encoding="UTF8")
+
+    SearchIndex.build(documents=DOCUMENTS[:2]).save(tmp_path)
+
+    assert sorted(path.name for path in folder.iterdir()) == [
+        "documents-0.json",
+        "index.json",
+        "shard-0.json",
+    ]
+
+
+def test_search_index_unsupported_version(tmp_path: Path):
+    SearchIndex.build(documents=DOCUMENTS).save(tmp_path)
+    path = tmp_path / SEARCH_INDEX_FOLDER / "index.json"
+    data = json.loads(path.read_text(encoding="UTF8"))
+    path.write_text(json.dumps({**data, "version": 0}), encoding="UTF8")
+
+    with pytest.raises(ValueError, match="Unsupported search index version '0'"):
+        SearchIndex.load(tmp_path)
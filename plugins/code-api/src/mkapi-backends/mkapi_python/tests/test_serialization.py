@@ -0,0 +1,66 @@
+import dataclasses
+import io
+import json
+from pathlib import Path
+from typing import Any, cast
+
+import griffe
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, DocReporter, dump_model, iter_api, std_links
+
+
+def to_json(model: Any) -> Any:
+    """
+    Convert a model as `dataclasses.asdict` does, omitting the fields declared with `OMIT_IF_NONE` when `None`.
+    """
+    if dataclasses.is_dataclass(model):
+        return {
+            f.name: to_json(getattr(model, f.name))
+            for f in dataclasses.fields(model)
+            if not (f.metadata.get("omit_if_none") and getattr(model, f.name) is None)
+        }
+    if isinstance(model, (list, tuple)):
+        return [to_json(v) for v in model]
+    if isinstance(model, dict):
+        return {k: to_json(v) for k, v in model.items()}
+    return model
+
+
+def dumps(model: Any, indent: int | None) -> str:
+    stream = io.StringIO()
+    dump_model(model, stream, indent=indent)
+    return stream.getvalue()
+
+
+def test_dump_model_matches_json_dump():
+    root_ast = cast(AstModule, griffe.load("griffe", submodules=True))
+    config = Configuration(out=Path(), external_links=std_links())
+
+    modules = list(iter_api(root_ast, config, reporter=DocReporter()))
+
+    assert len(modules) > 3
+    for _, module in modules:
+        assert dumps(module, indent=4) == json.dumps(to_json(module), indent=4)
+        assert dumps(module, indent=None) == json.dumps(
+            to_json(module), separators=(",", ":")
+        )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"é": "ü\n\"'\t", "": [], "nested": {}, "list": [[], {}, [1, 2.5, None]]},
+        {1: "int", 2.5: "float", True: "true", None: "none"},
+        [1e100, -0.0, 10**20, False],
+    ],
+)
+def test_dump_model_values(value: Any):
+    assert dumps(value, indent=4) == json.dumps(value, indent=4)
+    assert dumps(value, indent=None) == json.dumps(value, separators=(",", ":"))
+
+
+def test_dump_model_invalid_key():
+    with pytest.raises(TypeError, match="keys must be str"):
+        dumps({(1, 2): "tuple"}, indent=4)
@@ -0,0 +1,93 @@
+import functools
+import http.server
+import json
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+from conftest import TOY_PACKAGE, load_package
+
+from mkapi_python import NAVIGATION_FILENAME, SEARCH_INDEX_FOLDER, Configuration
+from mkapi_python import server as dev_server
+from mkapi_python.server import DevRequestHandler, DevServer
+
+
+def test_dev_server_serves_artifacts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    src = tmp_path / "src"
+    load_package(src, TOY_PACKAGE)
+    monkeypatch.syspath_prepend(str(src))
+    state = DevServer(
+        objspec=TOY_PACKAGE,
+        config=Configuration(
+            out=tmp_path / "out", source_assets=True, search_index=True
+        ),
+    )
+    handler = functools.partial(DevRequestHandler, server_state=state)
+    with http.server.ThreadingHTTPServer(("localhost", 0), handler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://localhost:{server.server_address[1]}"
+
+        def get(path: str) -> bytes:
+            with urllib.request.urlopen(f"{url}/{path}") as response:
+                return response.read()
+
+        models = json.loads(get(f"{TOY_PACKAGE}/models.json"))
+        (foo,) = [t for t in models["types"] if t["name"] == "Foo"]
+        source = json.loads(get(foo["code"]["implementationAsset"]))
+        assert "class Foo:" in source
+
+        navigation = json.loads(get(NAVIGATION_FILENAME))
+        assert set(navigation["modules"]) == {TOY_PACKAGE, f"{TOY_PACKAGE}.models"}
+
+        index = json.loads(get(f"{SEARCH_INDEX_FOLDER}/index.json"))
+        assert index["documentsCount"] > 0
+
+        with pytest.raises(urllib.error.HTTPError):
+            get(".mkapi/../../secret.txt")
+        server.shutdown()
+
+
+def test_main_configuration(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    links = tmp_path / "links.json"
+    links.write_text(json.dumps({"Foo": "https://foo.org"}), encoding="UTF8")
+    calls: list[dict] = []
+    monkeypatch.setattr(dev_server, "serve", lambda **kwargs: calls.append(kwargs))
+    monkeypatch.setattr(
+        "sys.argv",
+        [
+            "server",
+            TOY_PACKAGE,
+            "--out",
+            str(tmp_path / "out"),
+            "--cross-linked-packages",
+            "bar",
+            "baz",
+            "--cross-linked-index",
+            "bar=/docs/bar/index.json",
+            "--external-links",
+            str(links),
+            "--compact",
+        ],
+    )
+
+    dev_server.main()
+
+    (call,) = calls
+    config: Configuration = call["config"]
+    assert config.cross_linked_packages == ["bar", "baz"]
+    assert config.cross_linked_indexes == {"bar": Path("/docs/bar/index.json")}
+    assert config.external_links["Foo"] == "https://foo.org"
+    assert "float" in config.external_links
+    assert config.compact and not config.search_index
+
+
+def test_main_invalid_cross_linked_index(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        "sys.argv",
+        ["server", TOY_PACKAGE, "--out", "out", "--cross-linked-index", "bar"],
+    )
+
+    with pytest.raises(SystemExit):
+        dev_server.main()
@@ -0,0 +1,25 @@
+import json
+import os
+from pathlib import Path
+
+from mkapi_python import SOURCE_ASSETS_FOLDER, SourceAssets
+
+
+def test_source_assets(tmp_path: Path):
+    assets = SourceAssets(folder=tmp_path)
+    lines = ["class Foo:", "    pass"]
+
+    umask = os.umask(0o022)
+    try:
+        name = assets.get(path=Path("foo.py"), lines=lines)
+        other = SourceAssets(folder=tmp_path).get(path=Path("bar.py"), lines=lines)
+    finally:
+        os.umask(umask)
+
+    assert name == other
+    assert name.startswith(f"{SOURCE_ASSETS_FOLDER}/")
+    assert [p.name for p in (tmp_path / SOURCE_ASSETS_FOLDER).iterdir()] == [
+        Path(name).name
+    ]
+    assert (tmp_path / name).stat().st_mode & 0o777 == 0o644
+    assert json.loads((tmp_path / name).read_text()) == "class Foo:\n    pass"
@@ -0,0 +1,53 @@
+import json
+import tracemalloc
+from pathlib import Path
+
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, GenerationStats, generate_api
+
+
+def test_generation_stats(toy_package: AstModule, tmp_path: Path):
+    report = tmp_path / "stats.json"
+    stats = GenerationStats()
+    with stats.phase("griffe load"):
+        pass
+
+    returned = generate_api(
+        toy_package,
+        Configuration(out=tmp_path / "out", stats_report=report),
+        stats=stats,
+    )
+
+    assert returned is stats
+    names = [phase.name for phase in stats.phases]
+    assert names[0] == "griffe load"
+    assert {"init_symbols", "init_aliases", "modules"} <= set(names)
+    assert all(
+        phase.duration >= 0 and phase.peak_memory is None for phase in stats.phases
+    )
+    assert [m.path for m in stats.modules] == ["toypkg", "toypkg.models"]
+    (models,) = [m for m in stats.modules if m.path == "toypkg.models"]
+    assert "toypkg.models.foo.Foo" in models.entities
+    assert stats.slowest_modules(count=1) == [
+        max(stats.modules, key=lambda m: m.parse_duration + m.write_duration)
+    ]
+
+    data = json.loads(report.read_text(encoding="UTF8"))
+    assert [p["name"] for p in data["phases"]] == names
+    assert data["modules"]["count"] == 2 and data["modules"]["skipped"] == 0
+    assert {e["path"] for e in data["slowestEntities"]} >= {"toypkg.models.foo.Foo"}
+
+
+def test_phase_peak_memory():
+    stats = GenerationStats()
+    tracemalloc.start()
+    try:
+        with stats.phase("allocation"):
+            data = bytearray(10**6)
+    finally:
+        tracemalloc.stop()
+
+    (phase,) = stats.phases
+    assert len(data) == 10**6
+    assert phase.peak_memory is not None and phase.peak_memory >= 10**6
@@ -0,0 +1,37 @@
+from typing import cast
+
+import griffe
+import pytest
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import SuffixTrie, init_modules_elements, init_symbols
+
+PATHS = [
+    "foo.bar.baz",
+    "foo.qux_bar.baz",
+    "foo.baz",
+    "bar.baz.qux",
+    "foo.bar",
+]
+
+
+@pytest.mark.parametrize(
+    "suffix", ["baz", "bar.baz", "ar.baz", "foo.bar.baz", "qux", "z", "missing", "a.b"]
+)
+def test_ends_with(suffix: str):
+    trie = SuffixTrie(paths=PATHS)
+
+    assert trie.ends_with(suffix) == [p for p in PATHS if p.endswith(suffix)]
+
+
+def test_ends_with_symbols():
+    root_ast = cast(AstModule, griffe.load("griffe", submodules=True))
+    paths = list(
+        init_symbols(
+            root_ast=root_ast, modules_elements=init_modules_elements(root_ast=root_ast)
+        )
+    )
+    trie = SuffixTrie(paths=paths)
+
+    for suffix in ["load", "Alias", "dataclasses.Alias", "s.Alias", "as_json"]:
+        assert trie.ends_with(suffix) == [p for p in paths if p.endswith(suffix)]
@@ -0,0 +1,44 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from mkapi_python import (
+    SYMBOL_INDEX_FILENAME,
+    CrossLinkedPackage,
+    SymbolRef,
+    load_symbol_index,
+    save_symbol_index,
+)
+
+PACKAGE = CrossLinkedPackage(
+    all_symbols={
+        "toypkg.models.Foo": SymbolRef(kind="class", navigation_path="toypkg.models")
+    },
+    all_aliases={"toypkg.models.foo.Foo": "toypkg.models.Foo"},
+)
+
+
+def test_load_symbol_index(tmp_path: Path):
+    save_symbol_index(package=PACKAGE, name="toypkg", folder=tmp_path)
+
+    loaded = load_symbol_index(path=tmp_path / SYMBOL_INDEX_FILENAME, package="toypkg")
+
+    assert loaded.to_json() == PACKAGE.to_json()
+
+
+def test_load_symbol_index_other_package(tmp_path: Path):
+    save_symbol_index(package=PACKAGE, name="toypkg", folder=tmp_path)
+
+    with pytest.raises(ValueError, match="package 'toypkg', expected 'otherpkg'"):
+        load_symbol_index(path=tmp_path / SYMBOL_INDEX_FILENAME, package="otherpkg")
+
+
+def test_load_symbol_index_unsupported_version(tmp_path: Path):
+    save_symbol_index(package=PACKAGE, name="toypkg", folder=tmp_path)
+    path = tmp_path / SYMBOL_INDEX_FILENAME
+    data = json.loads(path.read_text(encoding="UTF8"))
+    path.write_text(json.dumps({**data, "version": 0}), encoding="UTF8")
+
+    with pytest.raises(ValueError, match="Unsupported symbol index version '0'"):
+        load_symbol_index(path=path, package="toypkg")
@@ -0,0 +1,89 @@
+import filecmp
+import logging
+from pathlib import Path
+from typing import cast
+
+import griffe
+import pytest
+from conftest import TOY_PACKAGE, load_package, write_package
+from griffe.dataclasses import Module as AstModule
+
+from mkapi_python import Configuration, generate_api, watch
+from mkapi_python.watch import ApiWatcher, watch_api
+
+
+def assert_same_files(left: Path, right: Path):
+    comparison = filecmp.dircmp(left, right, ignore=["incremental.json"])
+    assert not comparison.left_only and not comparison.right_only
+    assert not comparison.diff_files
+    for sub in comparison.subdirs.values():
+        assert_same_files(Path(sub.left), Path(sub.right))
+
+
+def test_watch_api_reloads_changed_modules(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    src = tmp_path / "src"
+    load_package(src, "toydep")
+    load_package(src, TOY_PACKAGE)
+    monkeypatch.syspath_prepend(str(src))
+    loads = []
+    load = griffe.load
+
+    def spy(objspec: str, **kwargs):
+        loads.append(objspec)
+        return load(objspec, **kwargs)
+
+    def edit(_: float):
+        source = src / TOY_PACKAGE / "models" / "foo.py"
+        source.write_text(source.read_text().replace("A foo,", "A changed foo,"))
+
+    monkeypatch.setattr(griffe, "load", spy)
+    monkeypatch.setattr(watch.time, "sleep", edit)
+    out = tmp_path / "out"
+    caplog.set_level(logging.INFO, logger=watch.LOGGER.name)
+    watch_api(
+        TOY_PACKAGE,
+        Configuration(out=out, cross_linked_packages=["toydep"]),
+        interval=0,
+        iterations=1,
+    )
+
+    assert loads == [TOY_PACKAGE, "toydep"]
+    assert "A changed foo" in (out / TOY_PACKAGE / "models.json").read_text()
+    assert "1 file(s) changed, 1 module(s) regenerated" in caplog.text
+    assert "(1 module(s) reloaded)" in caplog.text
+
+
+def test_api_watcher_matches_generation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    src = tmp_path / "src"
+    load_package(src, TOY_PACKAGE)
+    write_package(src, TOY_PACKAGE, {"extra/__init__.py": '"""\nThe extra.\n"""\n'})
+    monkeypatch.syspath_prepend(str(src))
+    config = Configuration(out=tmp_path / "watch")
+    watcher = ApiWatcher(TOY_PACKAGE, config)
+    package = src / TOY_PACKAGE
+
+    def check(step: int, partial: bool):
+        assert watcher.poll()
+        assert (watcher.reloader.reloaded is not None) == partial
+        out = tmp_path / f"full-{step}"
+        generate_api(
+            cast(
+                AstModule, griffe.load(TOY_PACKAGE, submodules=True, search_paths=[src])
+            ),
+            config._replace(out=out),
+        )
+        assert_same_files(config.out, out)
+
+    foo = package / "models" / "foo.py"
+    foo.write_text(foo.read_text().replace("make_foo", "create_foo"))
+    check(step=1, partial=True)
+    init = package / "models" / "__init__.py"
+    init.write_text(init.read_text().replace("Models", "The models"))
+    check(step=2, partial=True)
+    (package / "extra" / "__init__.py").unlink()
+    check(step=3, partial=False)
+    assert not (config.out / TOY_PACKAGE / "extra.json").exists()
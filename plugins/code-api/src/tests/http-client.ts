@@ -115,6 +115,11 @@ const files = {
     },
 }
 
+const sourceAssets = {
+    'assets/api/.mkapi/sources/0a1b2c3d4e5f6a7b.json':
+        'def foo():\n    return 42\n\n\ndef bar():\n    return foo()',
+}
+
 export class MockClient {
     public readonly configuration
     public readonly project
@@ -126,6 +131,9 @@ export class MockClient {
         const assetPath = `${this.project.dataFolder}/${modulePath}.json`
         return of(files[assetPath])
     }
+    fetchSourceAsset(assetPath) {
+        return of(sourceAssets[`${this.project.dataFolder}/${assetPath}`])
+    }
     installCss() {
         return Promise.resolve()
     }
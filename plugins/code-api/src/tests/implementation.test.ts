@@ -0,0 +1,109 @@
+import { render } from 'rx-vdom'
+import { Router } from 'mkdocs-ts'
+import { firstValueFrom, throwError } from 'rxjs'
+import {
+    Code,
+    configurationPython,
+    Entity,
+    fetchImplementation,
+    ImplementationView,
+} from '../lib'
+import { MockClient } from './http-client'
+import { mockMissingUIComponents } from './utils'
+
+const project = {
+    entryModule: 'foo',
+    dataFolder: 'assets/api',
+    rootModulesNav: { foo: '/api' },
+}
+const code: Code = {
+    declaration: 'def bar()',
+    implementationAsset: '.mkapi/sources/0a1b2c3d4e5f6a7b.json',
+    filePath: 'foo.py',
+    startLine: 5,
+    endLine: 6,
+    references: {},
+}
+const entity: Entity = {
+    name: 'bar',
+    documentation: { sections: [] },
+    code,
+    semantic: { role: 'function', labels: [], attributes: {}, relations: {} },
+    path: 'foo.bar',
+    navPath: '@nav/api.bar',
+}
+
+describe('Implementations', () => {
+    let router: Router
+    beforeAll(() => {
+        mockMissingUIComponents()
+        router = new Router({
+            navigation: {
+                name: 'API',
+                header: { icon: { tag: 'div' as const } },
+                layout: { content: () => ({ tag: 'div' as const }) },
+            },
+        })
+    })
+    beforeEach(() => (document.body.innerHTML = ''))
+
+    it('Should return the embedded implementation', async () => {
+        const implementation = await firstValueFrom(
+            fetchImplementation({ ...code, implementation: 'def bar(): ...' }),
+        )
+        expect(implementation).toBe('def bar(): ...')
+    })
+    it('Should extract the implementation from the source asset', async () => {
+        const httpClient = new MockClient({
+            project,
+            configuration: configurationPython,
+        })
+        const implementation = await firstValueFrom(
+            fetchImplementation(code, httpClient),
+        )
+        expect(implementation).toBe('def bar():\n    return foo()')
+    })
+    it('Should fetch the source asset when expanded', () => {
+        const httpClient = new MockClient({
+            project,
+            configuration: configurationPython,
+        })
+        const fetchSourceAsset = jest
+            .spyOn(httpClient, 'fetchSourceAsset')
+            .mockReturnValue(throwError(() => new Error('Not Found')))
+        const view = new ImplementationView({
+            code,
+            parent: entity,
+            router,
+            configuration: configurationPython,
+            project,
+            httpClient,
+        })
+        document.body.append(render(view))
+        expect(fetchSourceAsset).not.toHaveBeenCalled()
+        expect(document.querySelector('.text-danger')).toBeNull()
+
+        view.expanded$.next(true)
+
+        expect(fetchSourceAsset).toHaveBeenCalledWith(code.implementationAsset)
+        const error = document.querySelector<HTMLElement>('.text-danger')
+        expect(error?.innerText).toBe(
+            'Failed to load the implementation: Not Found',
+        )
+    })
+    it('Should report a missing HTTP client', () => {
+        const view = new ImplementationView({
+            code,
+            parent: entity,
+            router,
+            configuration: configurationPython,
+            project,
+        })
+        document.body.append(render(view))
+
+        view.expanded$.next(true)
+
+        const error = document.querySelector<HTMLElement>('.text-danger')
+        expect(error?.innerText).toContain(code.implementationAsset)
+    })
+})